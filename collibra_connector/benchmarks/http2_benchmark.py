@@ -0,0 +1,99 @@
+"""
+Benchmark HTTP/1.1 vs HTTP/2 for AsyncCollibraConnector.
+
+Fetches the same set of assets concurrently with each transport and reports
+wall time, throughput and latency percentiles. Run against a real instance:
+
+    pip install "collibra-connector[http2]"
+    export COLLIBRA_URL=https://your-instance.collibra.com
+    export COLLIBRA_USERNAME=user COLLIBRA_PASSWORD=pass
+    python benchmarks/http2_benchmark.py --assets 2000 --concurrency 200
+
+To model an egress proxy that caps sockets per client, pass the same
+--connections value to both modes (e.g. --connections 4).
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Any, Dict, List, Optional
+
+from collibra_connector import AsyncCollibraConnector
+
+
+async def collect_asset_ids(count: int) -> List[str]:
+    """Collect up to `count` asset IDs to fetch during the benchmark."""
+    async with AsyncCollibraConnector() as conn:
+        ids: List[str] = []
+        offset = 0
+        while len(ids) < count:
+            page = await conn.asset.find_assets(limit=min(1000, count - len(ids)), offset=offset)
+            if not page.results:
+                break
+            ids.extend(asset.id for asset in page.results)
+            offset += len(page.results)
+        return ids
+
+
+async def run_mode(
+    asset_ids: List[str],
+    http2: bool,
+    concurrency: int,
+    connections: Optional[int]
+) -> Dict[str, Any]:
+    """Fetch every asset once and time each request."""
+    latencies: List[float] = []
+
+    async with AsyncCollibraConnector(http2=http2, max_connections=connections) as conn:
+        # Warm up so connection setup is not measured
+        await conn.asset.get_asset(asset_ids[0])
+
+        async def timed(asset_id: str) -> None:
+            start = time.perf_counter()
+            await conn.asset.get_asset(asset_id)
+            latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await conn.gather_with_concurrency([timed(a) for a in asset_ids], max_concurrent=concurrency)
+        elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "mode": "HTTP/2" if http2 else "HTTP/1.1",
+        "requests": len(latencies),
+        "seconds": elapsed,
+        "req_per_sec": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(0.99 * (len(latencies) - 1))] * 1000,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--assets", type=int, default=1000, help="Number of assets to fetch")
+    parser.add_argument("--concurrency", type=int, default=100, help="Concurrent requests")
+    parser.add_argument("--connections", type=int, default=None,
+                        help="Max connections for both modes (default: 100 for HTTP/1.1, 4 for HTTP/2)")
+    parser.add_argument("--rounds", type=int, default=3, help="Rounds per mode (best is reported)")
+    args = parser.parse_args()
+
+    asset_ids = await collect_asset_ids(args.assets)
+    if not asset_ids:
+        raise SystemExit("No assets found to benchmark")
+
+    print(f"Fetching {len(asset_ids)} assets, concurrency={args.concurrency}")
+    print(f"{'mode':<10}{'req/s':>10}{'seconds':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    for http2 in (False, True):
+        results = [
+            await run_mode(asset_ids, http2, args.concurrency, args.connections)
+            for _ in range(args.rounds)
+        ]
+        best = max(results, key=lambda r: r["req_per_sec"])
+        print(
+            f"{best['mode']:<10}{best['req_per_sec']:>10.1f}{best['seconds']:>10.2f}"
+            f"{best['p50_ms']:>10.1f}{best['p99_ms']:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,106 @@
+"""
+Benchmark JSON codecs and compression on realistic Collibra payloads.
+
+Generates pages shaped like ``GET /assets?limit=1000`` and
+``GET /relations?limit=1000`` responses and compares decode/encode time for
+each available codec, plus the transfer size with and without compression.
+No Collibra instance is needed:
+
+    pip install -e . orjson brotli   # orjson/brotli are optional
+    python benchmarks/json_codec_benchmark.py --limit 1000 --repeat 20
+"""
+import argparse
+import gzip
+import time
+import uuid
+from typing import Any, Callable, Dict, List
+
+from collibra_connector.codec import BROTLI_AVAILABLE, ORJSON_AVAILABLE, JSONCodec, OrjsonCodec
+
+
+def _ref(name: str) -> Dict[str, Any]:
+    return {"id": str(uuid.uuid4()), "resourceType": "Asset", "name": name}
+
+
+def assets_page(limit: int) -> Dict[str, Any]:
+    """Build an /assets page with the fields Collibra returns."""
+    results: List[Dict[str, Any]] = []
+    for i in range(limit):
+        results.append({
+            "id": str(uuid.uuid4()),
+            "createdBy": str(uuid.uuid4()),
+            "createdOn": 1700000000000 + i,
+            "lastModifiedBy": str(uuid.uuid4()),
+            "lastModifiedOn": 1710000000000 + i,
+            "system": False,
+            "resourceType": "Asset",
+            "name": f"warehouse.sales.orders.column_{i}",
+            "displayName": f"Orders column {i}",
+            "articulationScore": 87.5,
+            "excludedFromAutoHyperlinking": False,
+            "domain": _ref("Sales Data Dictionary"),
+            "type": _ref("Column"),
+            "status": _ref("Accepted"),
+            "avgRating": 0.0,
+            "ratingsCount": 0,
+        })
+    return {"total": limit * 25, "offset": 0, "limit": limit, "results": results}
+
+
+def relations_page(limit: int) -> Dict[str, Any]:
+    """Build a /relations page with the fields Collibra returns."""
+    results = [{
+        "id": str(uuid.uuid4()),
+        "createdBy": str(uuid.uuid4()),
+        "createdOn": 1700000000000 + i,
+        "lastModifiedBy": str(uuid.uuid4()),
+        "lastModifiedOn": 1710000000000 + i,
+        "system": False,
+        "resourceType": "Relation",
+        "source": _ref(f"table_{i}"),
+        "target": _ref(f"column_{i}"),
+        "type": {"id": str(uuid.uuid4()), "resourceType": "RelationType"},
+        "startingDate": 0,
+        "endingDate": 0,
+    } for i in range(limit)]
+    return {"total": limit * 40, "offset": 0, "limit": limit, "results": results}
+
+
+def best_time(fn: Callable[[], Any], repeat: int) -> float:
+    """Return the fastest of `repeat` runs in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--limit", type=int, default=1000, help="Results per page")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per measurement (best is reported)")
+    args = parser.parse_args()
+
+    codecs = [JSONCodec()]
+    if ORJSON_AVAILABLE:
+        codecs.append(OrjsonCodec())
+    else:
+        print("orjson not installed; only the stdlib codec is measured")
+
+    for label, page in (("assets", assets_page(args.limit)), ("relations", relations_page(args.limit))):
+        raw = JSONCodec().dumps(page)
+        sizes = [f"raw {len(raw) / 1024:.0f} KiB", f"gzip {len(gzip.compress(raw)) / 1024:.0f} KiB"]
+        if BROTLI_AVAILABLE:
+            import brotli
+            sizes.append(f"br {len(brotli.compress(raw)) / 1024:.0f} KiB")
+        print(f"\n/{label} page, {args.limit} results ({', '.join(sizes)})")
+        print(f"{'codec':<10}{'decode ms':>12}{'encode ms':>12}")
+        for codec in codecs:
+            decode = best_time(lambda: codec.loads(raw), args.repeat)
+            encode = best_time(lambda: codec.dumps(page), args.repeat)
+            print(f"{codec.name:<10}{decode:>12.2f}{encode:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
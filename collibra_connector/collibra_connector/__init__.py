@@ -87,17 +87,36 @@ from .api.Exceptions import (
     ForbiddenError,
     NotFoundError,
     ServerError,
+    CircuitOpenError,
 )
 from .helpers import (
     Paginator,
     PaginatedResponse,
     BatchProcessor,
     BatchResult,
+    ParallelResult,
     CachedMetadata,
+    AsyncCachedMetadata,
+    RelationTypeRegistry,
     DataTransformer,
     DataFrameExporter,
+    StreamingExporter,
+    ArrowExporter,
+    IncrementalExporter,
+    IncrementalExportResult,
+    CacheInfo,
     timed_cache,
 )
+from .resilience import (
+    AdaptiveConcurrencyLimiter,
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    HedgingPolicy,
+    RateLimiter,
+)
+from .auth import SessionAuth
+from .codec import JSONCodec, OrjsonCodec, get_json_codec
+from .cache import ConditionalGetCache, EntityCache, NegativeCache, ResponseCache
 from .models import (
     # Base classes
     BaseCollibraModel,
@@ -224,15 +243,41 @@ __all__ = [
     "ForbiddenError",
     "NotFoundError",
     "ServerError",
+    "CircuitOpenError",
     # Helpers
     "Paginator",
     "PaginatedResponse",
     "BatchProcessor",
     "BatchResult",
+    "ParallelResult",
     "CachedMetadata",
+    "AsyncCachedMetadata",
+    "RelationTypeRegistry",
     "DataTransformer",
     "DataFrameExporter",
+    "StreamingExporter",
+    "ArrowExporter",
+    "IncrementalExporter",
+    "IncrementalExportResult",
     "timed_cache",
+    "CacheInfo",
+    # Resilience
+    "RateLimiter",
+    "AdaptiveConcurrencyLimiter",
+    "CircuitBreaker",
+    "CircuitBreakerRegistry",
+    "HedgingPolicy",
+    # Authentication
+    "SessionAuth",
+    # JSON codecs
+    "JSONCodec",
+    "OrjsonCodec",
+    "get_json_codec",
+    # Caching
+    "ConditionalGetCache",
+    "ResponseCache",
+    "EntityCache",
+    "NegativeCache",
     # Base models
     "BaseCollibraModel",
     "ResourceReference",
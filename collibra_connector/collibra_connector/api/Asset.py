@@ -1,6 +1,49 @@
+import re
 import uuid
 from .Base import BaseAPI
 
+# Attribute kinds exported by get_full_profiles, with the field holding their value
+PROFILE_ATTRIBUTE_FIELDS = {
+    "StringAttribute": "LongExpression",
+    "NumericAttribute": "Value",
+    "BooleanAttribute": "Value",
+    "DateAttribute": "Value",
+    "SingleValueListAttribute": "Value",
+}
+# Assets per Output Module export in get_full_profiles
+PROFILE_BATCH_SIZE = 1000
+
+
+def _profile_group(kind):
+    """Column group name of an attribute kind, e.g. StringAttribute -> stringAttributes."""
+    return f"{kind[0].lower()}{kind[1:]}s"
+
+
+def _profile_relation(group, role, other):
+    """Output Module Relation field where the profiled asset plays the given role."""
+    return {
+        "name": group,
+        "type": role,
+        "Id": {"name": f"{group}Id"},
+        "RelationType": {"Id": {"name": f"{group}TypeId"}},
+        other: {
+            "Id": {"name": f"{group}AssetId"},
+            "Signifier": {"name": f"{group}AssetName"},
+            "AssetType": {"Signifier": {"name": f"{group}AssetType"}},
+            "Status": {"Signifier": {"name": f"{group}AssetStatus"}},
+        },
+    }
+
+
+def _timestamp(value):
+    """Output Module exports timestamps as strings; convert them to epoch milliseconds."""
+    if value in (None, ""):
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
 
 class Asset(BaseAPI):
     def __init__(self, connector):
@@ -23,8 +66,9 @@ class Asset(BaseAPI):
         :param asset_id: The ID of the asset to retrieve.
         :return: Asset details.
         """
-        response = self._get(url=f"{self.__base_api}/{asset_id}")
-        return self._handle_response(response)
+        return self._entity(
+            "asset", asset_id, lambda: self._handle_response(self._get(url=f"{self.__base_api}/{asset_id}"))
+        )
 
     def add_asset(
         self,
@@ -147,7 +191,7 @@ class Asset(BaseAPI):
         }
 
         response = self._patch(url=f"{self.__base_api}/{asset_id}", data=data)
-        return self._handle_response(response)
+        return self._entity_write("asset", asset_id, response)
 
     def update_asset_attribute(self, asset_id: str, attribute_id: str, value):
         """
@@ -248,7 +292,7 @@ class Asset(BaseAPI):
             raise ValueError("asset_id must be a valid UUID") from exc
 
         response = self._delete(url=f"{self.__base_api}/{asset_id}")
-        return self._handle_response(response)
+        return self._entity_write("asset", asset_id, response)
 
     def set_asset_relations(self, asset_id: str, related_asset_ids: list, relation_direction: str,
                             type_id: str = None, type_public_id: str = None):
@@ -465,6 +509,8 @@ class Asset(BaseAPI):
 
         This is a convenience method that fetches all relevant data about an asset
         in a single call, perfect for data cataloging and governance use cases.
+        The asset and the requested sub-resources are fetched concurrently on the
+        connector's connection pool, so the latency is roughly that of the slowest call.
 
         Args:
             asset_id: The UUID of the asset.
@@ -507,71 +553,67 @@ class Asset(BaseAPI):
             CommentModel
         )
 
-        asset_data = self.get_asset(asset_id)
-        attributes_dict = {}
-        relations_data = {"outgoing": {}, "incoming": {}, "outgoing_count": 0, "incoming_count": 0}
-        responsibilities_list = []
-        comments_list = []
-        activities_list = []
+        def fetch_responsibilities():
+            params = {"resourceIds": asset_id, "limit": 50}
+            data = self._handle_response(self._get(url=f"{connector.api}/responsibilities", params=params))
+            responsibilities = []
+            for resp in data.get('results', []):
+                role = resp.get('role', {}).get('name', 'Unknown')
+                owner = resp.get('owner', {})
+                owner_name = f"{owner.get('firstName', '')} {owner.get('lastName', '')}".strip()
+                if not owner_name:
+                    owner_name = owner.get('name', 'Unknown')
+                responsibilities.append(ResponsibilitySummary(
+                    role=role,
+                    owner=owner_name,
+                    owner_id=owner.get('id')
+                ))
+            return responsibilities
+
+        def fetch_comments():
+            comments = []
+            for comment_data in connector.comment.get_comments(asset_id).get('results', []):
+                try:
+                    comments.append(CommentModel.model_validate(comment_data))
+                except Exception:
+                    pass
+            return comments
 
-        # 2. Get attributes
+        # 1. The asset itself, then the optional sub-resources
+        tasks = {"asset": lambda: self.get_asset(asset_id)}
         if include_attributes:
-            try:
-                attributes_dict = connector.attribute.get_attributes_as_dict(asset_id)
-            except Exception:
-                pass  # Attributes are optional
-
-        # 3. Get relations
+            tasks["attributes"] = lambda: connector.attribute.get_attributes_as_dict(asset_id)
         if include_relations:
-            try:
-                relations_data = connector.relation.get_asset_relations(
-                    asset_id,
-                    include_type_details=True
-                )
-            except Exception:
-                pass  # Relations are optional
-
-        # 4. Get responsibilities
+            # Type names come from the connector's relation type registry
+            tasks["relations"] = lambda: connector.relation.get_asset_relations(
+                asset_id,
+                include_type_details=True
+            )
         if include_responsibilities:
-            try:
-                import requests
-                url = f"{connector.api}/responsibilities"
-                params = {"resourceIds": asset_id, "limit": 50}
-                response = requests.get(url, auth=connector.auth, timeout=connector.timeout)
-                if response.status_code == 200:
-                    data = response.json()
-                    for resp in data.get('results', []):
-                        role = resp.get('role', {}).get('name', 'Unknown')
-                        owner = resp.get('owner', {})
-                        owner_name = f"{owner.get('firstName', '')} {owner.get('lastName', '')}".strip()
-                        if not owner_name:
-                            owner_name = owner.get('name', 'Unknown')
-                        responsibilities_list.append(ResponsibilitySummary(
-                            role=role,
-                            owner=owner_name,
-                            owner_id=owner.get('id')
-                        ))
-            except Exception:
-                pass  # Responsibilities are optional
-
-        # 5. Get comments
+            tasks["responsibilities"] = fetch_responsibilities
         if include_comments:
-            try:
-                comments_result = connector.comment.get_comments(asset_id)
-                for comment_data in comments_result.get('results', []):
-                    try:
-                        comments_list.append(CommentModel.model_validate(comment_data))
-                    except Exception:
-                        pass
-            except Exception:
-                pass  # Comments are optional
-
-        # 6. Get activities
+            tasks["comments"] = fetch_comments
         if include_activities:
-            try:
-                activities_list = self.get_asset_activities(asset_id)
-            except Exception:
-                pass  # Activities are optional
+            tasks["activities"] = lambda: self.get_asset_activities(asset_id)
+
+        # All calls run concurrently on the connector's long-lived worker threads, or
+        # one after another when this profile is itself fetched by a map() worker
+        names = list(tasks)
+        fetched = connector.map(lambda name: tasks[name](), names, shared_pool=True)
+        results = dict(zip(names, fetched.results))
+        errors = dict(zip(names, fetched.errors))
+        if errors["asset"] is not None:
+            raise errors["asset"]
+
+        # Sub-resources are optional: a failed call leaves its default
+        asset_data = results["asset"]
+        attributes_dict = results.get("attributes") or {}
+        relations_data = results.get("relations") or {
+            "outgoing": {}, "incoming": {}, "outgoing_count": 0, "incoming_count": 0
+        }
+        responsibilities_list = results.get("responsibilities") or []
+        comments_list = results.get("comments") or []
+        activities_list = results.get("activities") or []
 
         # Create and return AssetProfileModel
         return AssetProfileModel(
@@ -583,6 +625,344 @@ class Asset(BaseAPI):
             activities=activities_list
         )
 
+    def get_full_profiles(
+        self,
+        asset_ids: list = None,
+        domain_id: str = None,
+        include_attributes: bool = True,
+        include_relations: bool = True,
+        include_responsibilities: bool = True,
+        batch_size: int = PROFILE_BATCH_SIZE,
+        community_id: str = None,
+        asset_type_ids: list = None,
+        limit: int = None
+    ):
+        """
+        Get the profiles of many assets in bulk through Output Module exports.
+
+        Instead of several requests per asset, one TableViewConfig export returns the
+        assets, their attributes, relations and responsibilities for up to ``batch_size``
+        assets. Relation type names come from the connector's relation type registry.
+        Comments and activities are not included; use get_full_profile for those.
+
+        Args:
+            asset_ids: UUIDs of the assets to profile. Cannot be combined with the filters below.
+            domain_id: UUID of a domain whose assets are profiled.
+            include_attributes: Include asset attributes (default: True).
+            include_relations: Include incoming/outgoing relations (default: True).
+            include_responsibilities: Include responsibility assignments (default: True).
+            batch_size: Assets per export request (default: 1000).
+            community_id: UUID of a community whose domains' assets are profiled.
+            asset_type_ids: Only profile assets of these types (with domain_id or community_id).
+            limit: Maximum number of assets to profile with the filters (default: all).
+
+        Returns:
+            List of AssetProfileModel, in the order of asset_ids (assets that were not
+            found are omitted) or ordered by asset id for the filters.
+
+        Example:
+            >>> profiles = connector.asset.get_full_profiles(domain_id="domain-uuid")
+            >>> for profile in profiles:
+            ...     print(profile.asset.name, profile.data_steward)
+        """
+        profiles = self.iter_full_profiles(
+            asset_ids=asset_ids,
+            domain_id=domain_id,
+            include_attributes=include_attributes,
+            include_relations=include_relations,
+            include_responsibilities=include_responsibilities,
+            batch_size=batch_size,
+            community_id=community_id,
+            asset_type_ids=asset_type_ids,
+            limit=limit
+        )
+        if asset_ids is None:
+            return list(profiles)
+        by_id = {profile.asset.id: profile for profile in profiles}
+        return [by_id[asset_id] for asset_id in asset_ids if asset_id in by_id]
+
+    def iter_full_profiles(
+        self,
+        asset_ids: list = None,
+        domain_id: str = None,
+        include_attributes: bool = True,
+        include_relations: bool = True,
+        include_responsibilities: bool = True,
+        batch_size: int = PROFILE_BATCH_SIZE,
+        community_id: str = None,
+        asset_type_ids: list = None,
+        limit: int = None
+    ):
+        """
+        Lazily yield asset profiles from bulk Output Module exports.
+
+        Takes the same arguments as get_full_profiles, but each export of ``batch_size``
+        assets is streamed and its profiles are yielded as they are parsed, so only one
+        row is held in memory at a time. Arguments are validated on the first ``next()``.
+
+        Returns:
+            Generator of AssetProfileModel, ordered by asset id within each batch.
+            Duplicate asset_ids are profiled once; assets that were not found are skipped.
+
+        Example:
+            >>> for profile in connector.asset.iter_full_profiles(domain_id="domain-uuid"):
+            ...     print(profile.asset.name)
+        """
+        if asset_ids is not None and (domain_id or community_id or asset_type_ids):
+            raise ValueError("asset_ids cannot be combined with domain_id, community_id or asset_type_ids")
+        if asset_ids is None and not (domain_id or community_id):
+            raise ValueError("asset_ids, domain_id or community_id is required")
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+        if asset_ids is not None:
+            to_check = asset_ids
+        else:
+            to_check = [value for value in (domain_id, community_id) if value] + list(asset_type_ids or [])
+        for value in to_check:
+            try:
+                uuid.UUID(value)
+            except (ValueError, TypeError, AttributeError) as exc:
+                raise ValueError(f"Invalid UUID: {value!r}") from exc
+
+        connector = self._BaseAPI__connector
+        fields = self._profile_fields(include_attributes, include_relations, include_responsibilities)
+
+        if asset_ids is None:
+            conditions = self._scope_conditions(domain_id, community_id, asset_type_ids)
+            for row in self._export_rows(fields, conditions, batch_size, limit):
+                yield self._profile_from_row(row)
+            return
+
+        unique_ids = list(dict.fromkeys(asset_ids))
+        for i in range(0, len(unique_ids), batch_size):
+            config = connector.output_module.table_view_config(
+                "Asset",
+                fields,
+                filter={"AND": [{"Field": {"name": "id", "operator": "IN", "values": unique_ids[i:i + batch_size]}}]},
+                order=[{"Field": {"name": "id", "order": "ASC"}}]
+            )
+            for row in connector.output_module.stream_json(config, validation_enabled=True, path=("aaData",)):
+                yield self._profile_from_row(row)
+
+    def get_modified_asset_ids(
+        self,
+        since: int,
+        domain_id: str = None,
+        community_id: str = None,
+        asset_type_ids: list = None,
+        include_attributes: bool = True,
+        batch_size: int = PROFILE_BATCH_SIZE
+    ):
+        """
+        Get the ids of the assets of a domain or community changed since a point in time.
+
+        One Output Module export returns only the ids of the assets whose own or
+        (with include_attributes) any attribute's last modification is at or after ``since``.
+
+        Args:
+            since: Unix timestamp in milliseconds.
+            domain_id: UUID of a domain whose assets are checked.
+            community_id: UUID of a community whose domains' assets are checked.
+            asset_type_ids: Only check assets of these types.
+            include_attributes: Also treat assets with changed attributes as modified (default: True).
+            batch_size: Assets per export request (default: 1000).
+
+        Returns:
+            List of asset UUIDs ordered by id.
+
+        Example:
+            >>> ids = connector.asset.get_modified_asset_ids(1700000000000, domain_id="domain-uuid")
+            >>> profiles = connector.asset.get_full_profiles(asset_ids=ids)
+        """
+        if not isinstance(since, int) or since < 0:
+            raise ValueError("since must be a non-negative integer (Unix timestamp in milliseconds)")
+        if not (domain_id or community_id):
+            raise ValueError("domain_id or community_id is required")
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+        for value in [value for value in (domain_id, community_id) if value] + list(asset_type_ids or []):
+            try:
+                uuid.UUID(value)
+            except (ValueError, TypeError, AttributeError) as exc:
+                raise ValueError(f"Invalid UUID: {value!r}") from exc
+
+        fields = {
+            "Id": {"name": "id"},
+            "LastModified": {"name": "lastModifiedOn"},
+            # Filters can only reference declared fields, so the scope fields are declared too
+            "AssetType": {"Id": {"name": "typeId"}},
+            "Domain": {"Id": {"name": "domainId"}, "Community": {"Id": {"name": "communityId"}}},
+        }
+        changed = [{"Field": {"name": "lastModifiedOn", "operator": "GREATER_OR_EQUALS", "value": str(since)}}]
+        if include_attributes:
+            for kind in PROFILE_ATTRIBUTE_FIELDS:
+                group = _profile_group(kind)
+                fields[kind] = [{"name": group, "LastModified": {"name": f"{group}LastModified"}}]
+                changed.append({"Field": {
+                    "name": f"{group}LastModified", "operator": "GREATER_OR_EQUALS", "value": str(since)
+                }})
+        conditions = self._scope_conditions(domain_id, community_id, asset_type_ids) + [{"OR": changed}]
+        return [row["id"] for row in self._export_rows(fields, conditions, batch_size)]
+
+    @staticmethod
+    def _scope_conditions(domain_id, community_id, asset_type_ids):
+        """
+        Output Module filter conditions selecting the assets of a domain or community.
+        """
+        conditions = []
+        if domain_id:
+            conditions.append({"Field": {"name": "domainId", "operator": "EQUALS", "value": domain_id}})
+        if community_id:
+            conditions.append({"Field": {"name": "communityId", "operator": "EQUALS", "value": community_id}})
+        if asset_type_ids:
+            conditions.append({"Field": {"name": "typeId", "operator": "IN", "values": list(asset_type_ids)}})
+        return conditions
+
+    def _export_rows(self, fields, conditions, batch_size, limit=None):
+        """
+        Lazily yields the rows of an Asset export ordered by id, one page of batch_size at a time,
+        until a short page or limit rows. fields must name the asset id "id".
+        """
+        output_module = self._BaseAPI__connector.output_module
+        count = 0
+        while limit is None or count < limit:
+            length = batch_size if limit is None else min(batch_size, limit - count)
+            config = output_module.table_view_config(
+                "Asset",
+                fields,
+                filter={"AND": conditions},
+                order=[{"Field": {"name": "id", "order": "ASC"}}],
+                display_start=count,
+                display_length=length
+            )
+            page_count = 0
+            for row in output_module.stream_json(config, validation_enabled=True, path=("aaData",)):
+                page_count += 1
+                yield row
+            count += page_count
+            if page_count < length:
+                return
+
+    @staticmethod
+    def _profile_fields(include_attributes: bool, include_relations: bool, include_responsibilities: bool):
+        """
+        Output Module fields of an Asset resource for get_full_profiles.
+        Field names double as the keys of the exported rows.
+        """
+        fields = {
+            "Id": {"name": "id"},
+            "Signifier": {"name": "name"},
+            "DisplayName": {"name": "displayName"},
+            "CreatedOn": {"name": "createdOn"},
+            "LastModified": {"name": "lastModifiedOn"},
+            "AssetType": {"Id": {"name": "typeId"}, "Signifier": {"name": "typeName"}},
+            "Status": {"Id": {"name": "statusId"}, "Signifier": {"name": "statusName"}},
+            "Domain": {
+                "Id": {"name": "domainId"},
+                "Name": {"name": "domainName"},
+                "Community": {"Id": {"name": "communityId"}, "Name": {"name": "communityName"}},
+            },
+        }
+        if include_attributes:
+            for kind, value_field in PROFILE_ATTRIBUTE_FIELDS.items():
+                group = _profile_group(kind)
+                fields[kind] = [{
+                    "name": group,
+                    "AttributeType": {"Signifier": {"name": f"{group}Type"}},
+                    value_field: {"name": f"{group}Value"},
+                }]
+        if include_relations:
+            fields["Relation"] = [
+                _profile_relation("outgoingRelations", "SOURCE", "Target"),
+                _profile_relation("incomingRelations", "TARGET", "Source"),
+            ]
+        if include_responsibilities:
+            fields["Responsibility"] = [{
+                "name": "responsibilities",
+                "Role": {"Signifier": {"name": "responsibilitiesRole"}},
+                "User": {
+                    "Id": {"name": "responsibilitiesUserId"},
+                    "FirstName": {"name": "responsibilitiesFirstName"},
+                    "LastName": {"name": "responsibilitiesLastName"},
+                },
+                "UserGroup": {
+                    "Id": {"name": "responsibilitiesGroupId"},
+                    "Name": {"name": "responsibilitiesGroupName"},
+                },
+            }]
+        return fields
+
+    def _profile_from_row(self, row: dict):
+        """
+        Maps one row exported with _profile_fields to an AssetProfileModel.
+        """
+        from ..models import AssetProfileModel, RelationsGrouped, ResponsibilitySummary
+
+        asset = {
+            "id": row["id"],
+            "name": row.get("name"),
+            "displayName": row.get("displayName"),
+            "createdOn": _timestamp(row.get("createdOn")),
+            "lastModifiedOn": _timestamp(row.get("lastModifiedOn")),
+            "type": {"id": row.get("typeId"), "name": row.get("typeName")},
+            "status": {"id": row.get("statusId"), "name": row.get("statusName")},
+            "domain": {
+                "id": row.get("domainId"),
+                "name": row.get("domainName"),
+                "community": {"id": row.get("communityId"), "name": row.get("communityName")},
+            },
+        }
+
+        attributes = {}
+        for kind in PROFILE_ATTRIBUTE_FIELDS:
+            group = _profile_group(kind)
+            for item in row.get(group) or []:
+                if item.get(f"{group}Type") is not None:
+                    attributes[item[f"{group}Type"]] = item.get(f"{group}Value")
+
+        registry = self._BaseAPI__connector.relation_types
+        relations = {"outgoing": {}, "incoming": {}, "outgoing_count": 0, "incoming_count": 0}
+        for direction, group, other, role in (
+            ("outgoing", "outgoingRelations", "target", "role"),
+            ("incoming", "incomingRelations", "source", "coRole"),
+        ):
+            for item in row.get(group) or []:
+                if item.get(f"{group}Id") is None:
+                    continue
+                type_id = item.get(f"{group}TypeId")
+                relation_type = (registry.get(type_id) if type_id else None) or {}
+                relations[direction].setdefault(relation_type.get(role, "Unknown"), []).append({
+                    "id": item[f"{group}Id"],
+                    f"{other}_id": item.get(f"{group}AssetId"),
+                    f"{other}_name": item.get(f"{group}AssetName"),
+                    f"{other}_type": item.get(f"{group}AssetType"),
+                    f"{other}_status": item.get(f"{group}AssetStatus") or "N/A",
+                })
+                relations[f"{direction}_count"] += 1
+
+        responsibilities = []
+        for item in row.get("responsibilities") or []:
+            if item.get("responsibilitiesUserId"):
+                owner_id = item["responsibilitiesUserId"]
+                owner = f"{item.get('responsibilitiesFirstName') or ''} {item.get('responsibilitiesLastName') or ''}".strip()
+            elif item.get("responsibilitiesGroupId"):
+                owner_id = item["responsibilitiesGroupId"]
+                owner = item.get("responsibilitiesGroupName") or ""
+            else:
+                continue
+            responsibilities.append(ResponsibilitySummary(
+                role=item.get("responsibilitiesRole") or "Unknown",
+                owner=owner or "Unknown",
+                owner_id=owner_id
+            ))
+
+        return AssetProfileModel(
+            asset=asset,
+            attributes=attributes,
+            relations=RelationsGrouped(**relations),
+            responsibilities=responsibilities
+        )
+
     def get_full_profile_flat(self, asset_id: str):
         """
         Get a flattened profile of an asset suitable for export to CSV/DataFrame.
@@ -600,8 +980,19 @@ class Asset(BaseAPI):
             >>> import pandas as pd
             >>> df = pd.DataFrame([flat])
         """
-        profile = self.get_full_profile(asset_id)
+        return self.flatten_profile(self.get_full_profile(asset_id))
+
+    @staticmethod
+    def flatten_profile(profile):
+        """
+        Flatten an AssetProfileModel into a dictionary of simple values.
 
+        Args:
+            profile: Profile returned by get_full_profile or get_full_profiles.
+
+        Returns:
+            Flattened dictionary with all asset information.
+        """
         flat = {
             # Basic info
             "id": profile.asset.id,
@@ -614,34 +1005,33 @@ class Asset(BaseAPI):
             "domain": profile.asset.domain_name,
             "domain_id": profile.asset.domain.id,
             "created_on": profile.asset.created_on,
-            "last_modified_on": profile["asset"].get("lastModifiedOn"),
+            "last_modified_on": profile.asset.last_modified_on,
         }
 
         # Add attributes with prefix
-        for attr_name, attr_value in profile.get("attributes", {}).items():
+        for attr_name, attr_value in profile.attributes.items():
             # Clean HTML from description
             if attr_name == "Description" and isinstance(attr_value, str):
-                import re
                 attr_value = re.sub(r'<[^>]+>', '', attr_value)
             flat[f"attr_{attr_name.lower().replace(' ', '_')}"] = attr_value
 
         # Add relation counts
-        flat["relations_outgoing_count"] = profile["relations"].get("outgoing_count", 0)
-        flat["relations_incoming_count"] = profile["relations"].get("incoming_count", 0)
+        flat["relations_outgoing_count"] = profile.relations.outgoing_count
+        flat["relations_incoming_count"] = profile.relations.incoming_count
 
         # Add relation summaries
         outgoing_summary = []
-        for rel_type, targets in profile["relations"].get("outgoing", {}).items():
+        for rel_type, targets in profile.relations.outgoing.items():
             outgoing_summary.append(f"{rel_type}: {len(targets)}")
         flat["relations_outgoing_summary"] = "; ".join(outgoing_summary)
 
         incoming_summary = []
-        for rel_type, sources in profile["relations"].get("incoming", {}).items():
+        for rel_type, sources in profile.relations.incoming.items():
             incoming_summary.append(f"{rel_type}: {len(sources)}")
         flat["relations_incoming_summary"] = "; ".join(incoming_summary)
 
         # Add responsibilities
-        resp_list = [f"{r['role']}: {r['owner']}" for r in profile.get("responsibilities", [])]
+        resp_list = [f"{r.role}: {r.owner}" for r in profile.responsibilities]
         flat["responsibilities"] = "; ".join(resp_list)
 
         return flat
@@ -680,20 +1070,15 @@ class Asset(BaseAPI):
         # DELETE with body is not standard in many libs but Collibra might support it or use a different endpoint?
         # Checking Collibra API: DELETE /assets/{assetId}/tags takes list of tags in body.
         # BaseAPI._delete does not support data.
-        # We need to use requests directly or extend BaseAPI.
-        
-        import requests
-        # Access connector auth and timeout
+        # Go through the connector transport so the pooled session and retries apply.
         connector = self._BaseAPI__connector
-        
-        response = requests.delete(
-            url, 
-            json=tags, # Pass tags directly as list or {"tags": ...}? API says list of strings usually.
-                       # Checking Collibra docs: DELETE /assets/{assetId}/tags body is ["tag1", "tag2"]
-            auth=connector.auth,
-            timeout=connector.timeout,
+
+        response = self._invalidating(url, connector._make_request(
+            "DELETE",
+            url,
+            json=tags,  # Checking Collibra docs: DELETE /assets/{assetId}/tags body is ["tag1", "tag2"]
             headers={"Content-Type": "application/json"}
-        )
+        ))
         
         return self._handle_response(response)
 
@@ -705,8 +1090,7 @@ class Asset(BaseAPI):
         :return: Response from the API.
         """
         import os
-        import requests
-        
+
         if not asset_id:
             raise ValueError("asset_id is required")
         if not os.path.exists(file_path):
@@ -715,21 +1099,18 @@ class Asset(BaseAPI):
         url = f"{self._BaseAPI__connector.api}/attachments"
         filename = os.path.basename(file_path)
         
-        # Open file in binary mode and ensure it's closed
+        # Read the file up front so a retried request re-sends the full content
         with open(file_path, 'rb') as f:
-            files = {
-                'file': (filename, f, 'application/octet-stream'),
-                'resourceId': (None, str(asset_id)),
-                'resourceType': (None, 'Asset')
-            }
-            
-            response = requests.post(
-                url,
-                files=files,
-                auth=self._BaseAPI__connector.auth,
-                timeout=self._BaseAPI__connector.timeout
-            )
-        
+            content = f.read()
+
+        files = {
+            'file': (filename, content, 'application/octet-stream'),
+            'resourceId': (None, str(asset_id)),
+            'resourceType': (None, 'Asset')
+        }
+
+        response = self._invalidating(url, self._BaseAPI__connector._make_request("POST", url, files=files))
+
         return self._handle_response(response)
 
     def get_attachments(self, asset_id: str):
@@ -1,5 +1,5 @@
 import re
-import requests
+from ..cache import CachedResponse, request_key
 from .Exceptions import (
     UnauthorizedError,
     ForbiddenError,
@@ -7,6 +7,9 @@ from .Exceptions import (
     ServerError
 )
 
+# Body of the 404 returned for lookups in the connector's negative cache
+_CACHED_NOT_FOUND = CachedResponse(b"Not found (cached)", {}, None, None)
+
 
 class BaseAPI:
 
@@ -30,19 +33,34 @@ class BaseAPI:
         url = self.__base_api if not url else url
         headers = self.__header if not headers else headers
         params = self.__params if not params else params
-        return requests.get(
+        negative_cache = self.__connector.negative_cache
+        if negative_cache is not None:
+            key = request_key(url, params)
+            if negative_cache.hit(key, self.__connector.cache_identity):
+                return self.__connector._build_response(_CACHED_NOT_FOUND, url, 404)
+        response = self._cached(
+            "GET",
             url,
-            auth=self.__connector.auth,
-            params=params,
-            headers=headers,
-            timeout=self.__connector.timeout
+            params,
+            None,
+            lambda: self.__connector._make_request(
+                "GET",
+                url,
+                params=params,
+                headers=headers
+            )
         )
+        if negative_cache is not None and response.status_code == 404:
+            negative_cache.add(key, self.__connector.cache_identity)
+        return response
 
-    def _post(self, url: str, data: dict, headers: dict = None, params: dict = None):
+    def _post(self, url: str, data: dict, headers: dict = None, params: dict = None, cacheable: bool = False):
         """
         Makes a POST request to the specified URL with the given data.
         :param url: The URL to send the POST request to.
         :param data: The data to send in the POST request.
+        :param cacheable: True for read-only POSTs (e.g. /search) whose responses may be served
+                          from the connector's response cache.
         :return: The response from the POST request.
         """
         url = self.__base_api if not url else url
@@ -51,14 +69,19 @@ class BaseAPI:
             raise ValueError("Data must be a dictionary")
         if not data:
             raise ValueError("Data cannot be empty")
-        return requests.post(
-            url,
-            auth=self.__connector.auth,
-            json=data,
-            headers=headers,
-            params=params,
-            timeout=self.__connector.timeout
-        )
+
+        def send():
+            return self.__connector._make_request(
+                "POST",
+                url,
+                json=data,
+                headers=headers,
+                params=params
+            )
+
+        if cacheable:
+            return self._cached("POST", url, params, data, send)
+        return self._invalidating(url, send())
 
     def _put(self, url: str, data: dict, headers: dict = None):
         """
@@ -73,13 +96,12 @@ class BaseAPI:
             raise ValueError("Data must be a dictionary")
         if not data:
             raise ValueError("Data cannot be empty")
-        return requests.put(
+        return self._invalidating(url, self.__connector._make_request(
+            "PUT",
             url,
-            auth=self.__connector.auth,
             json=data,
-            headers=headers,
-            timeout=self.__connector.timeout
-        )
+            headers=headers
+        ))
 
     def _delete(self, url: str, headers: dict = None):
         """
@@ -89,12 +111,11 @@ class BaseAPI:
         """
         url = self.__base_api if not url else url
         headers = self.__header if not headers else headers
-        return requests.delete(
+        return self._invalidating(url, self.__connector._make_request(
+            "DELETE",
             url,
-            auth=self.__connector.auth,
-            headers=headers,
-            timeout=self.__connector.timeout
-        )
+            headers=headers
+        ))
 
     def _patch(self, url: str, data: dict, headers: dict = None):
         """
@@ -109,13 +130,87 @@ class BaseAPI:
             raise ValueError("Data must be a dictionary")
         if not data:
             raise ValueError("Data cannot be empty")
-        return requests.patch(
+        return self._invalidating(url, self.__connector._make_request(
+            "PATCH",
             url,
-            auth=self.__connector.auth,
             json=data,
-            headers=headers,
-            timeout=self.__connector.timeout
-        )
+            headers=headers
+        ))
+
+    def _cached(self, method: str, url: str, params, body, send):
+        """
+        Serves a read request from the connector's response cache, or sends it and stores a 200.
+        :param method: The HTTP method of the request.
+        :param url: The URL of the request.
+        :param params: The query parameters of the request.
+        :param body: The JSON body of the request, if any.
+        :param send: Callable that sends the request and returns the response.
+        :return: The cached or fresh response.
+        """
+        cache = self.__connector.response_cache
+        if cache is None:
+            return send()
+        key = cache.key(method, url, params, body, self.__connector.cache_identity)
+        cached = cache.get(key)
+        if cached is not None:
+            return self.__connector._build_response(cached, url)
+        response = send()
+        if response.status_code == 200:
+            cache.set(key, url, response.content, response.headers)
+        return response
+
+    def _invalidating(self, url: str, response):
+        """
+        Drops cached responses and 404s of the endpoint family a write may have changed.
+        :param url: The URL of the write request.
+        :param response: The response of the write request.
+        :return: The response, unchanged.
+        """
+        cache = self.__connector.response_cache
+        if cache is not None:
+            cache.invalidate_related(url)
+        negative_cache = self.__connector.negative_cache
+        if negative_cache is not None:
+            negative_cache.invalidate(url)
+        return response
+
+    def _entity(self, kind: str, entity_id: str, fetch):
+        """
+        Returns an entity from the connector's entity cache, fetching and caching it on a miss.
+        :param kind: The entity kind, e.g. "asset".
+        :param entity_id: The ID of the entity.
+        :param fetch: Callable that retrieves the entity from the API.
+        :return: The entity details.
+        """
+        cache = self.__connector.entity_cache
+        if cache is None:
+            return fetch()
+        entity = cache.get(kind, entity_id)
+        if entity is None:
+            generation = cache.generation
+            entity = fetch()
+            if isinstance(entity, dict) and entity:
+                cache.put(kind, entity_id, entity, generation)
+        return entity
+
+    def _entity_write(self, kind: str, entity_id: str, response):
+        """
+        Handles the response of a write to an entity, keeping the entity cache coherent.
+        The entity and cached entities referencing it are dropped; an updated entity returned
+        by the API is cached in their place.
+        :param kind: The entity kind, e.g. "asset".
+        :param entity_id: The ID of the written entity.
+        :param response: The response object from the write request.
+        :return: The JSON content of the response.
+        """
+        cache = self.__connector.entity_cache
+        if cache is None:
+            return self._handle_response(response)
+        cache.invalidate(kind, entity_id)
+        result = self._handle_response(response)
+        if isinstance(result, dict) and result.get("id") == entity_id:
+            cache.put(kind, entity_id, result)
+        return result
 
     def _handle_response(self, response):
         """
@@ -124,10 +219,11 @@ class BaseAPI:
         :return: The JSON content of the response if successful, otherwise raises an error.
         """
         if response.status_code in [200, 201, 204]:
-            # Check if response has content before trying to parse JSON
-            if response.status_code != 204 and response.text.strip():
+            # Check the raw bytes for content; decoding .text first is slow on large pages
+            content = response.content
+            if response.status_code != 204 and content and not content.isspace():
                 try:
-                    return response.json()
+                    return self.__connector.json_codec.loads(content)
                 except ValueError as e:
                     raise ValueError(f"Invalid JSON response: {e}") from e
             return {}
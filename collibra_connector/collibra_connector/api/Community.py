@@ -23,8 +23,11 @@ class Community(BaseAPI):
         except ValueError as exc:
             raise ValueError("community_id must be a valid UUID") from exc
 
-        response = self._get(url=f"{self.__base_api}/{community_id}")
-        return self._handle_response(response)
+        return self._entity(
+            "community",
+            community_id,
+            lambda: self._handle_response(self._get(url=f"{self.__base_api}/{community_id}"))
+        )
 
     def find_communities(
         self,
@@ -245,7 +248,7 @@ class Community(BaseAPI):
             data["removeScopeOverlapOnMove"] = remove_scope_overlap_on_move
 
         response = self._patch(url=f"{self.__base_api}/{community_id}", data=data)
-        return self._handle_response(response)
+        return self._entity_write("community", community_id, response)
 
     def remove_community(self, community_id: str):
         """
@@ -269,7 +272,7 @@ class Community(BaseAPI):
             raise ValueError("community_id must be a valid UUID") from exc
 
         response = self._delete(url=f"{self.__base_api}/{community_id}")
-        return self._handle_response(response)
+        return self._entity_write("community", community_id, response)
 
     def change_to_root_community(self, community_id: str):
         """
@@ -289,4 +292,4 @@ class Community(BaseAPI):
             raise ValueError("community_id must be a valid UUID") from exc
 
         response = self._post(url=f"{self.__base_api}/{community_id}/root", data={})
-        return self._handle_response(response)
+        return self._entity_write("community", community_id, response)
@@ -23,8 +23,9 @@ class Domain(BaseAPI):
         except ValueError as exc:
             raise ValueError("domain_id must be a valid UUID") from exc
 
-        response = self._get(url=f"{self.__base_api}/{domain_id}")
-        return self._handle_response(response)
+        return self._entity(
+            "domain", domain_id, lambda: self._handle_response(self._get(url=f"{self.__base_api}/{domain_id}"))
+        )
 
     def find_domains(
         self,
@@ -231,7 +232,7 @@ class Domain(BaseAPI):
             raise ValueError("domain_id must be a valid UUID") from exc
 
         response = self._delete(url=f"{self.__base_api}/{domain_id}")
-        return self._handle_response(response)
+        return self._entity_write("domain", domain_id, response)
 
     def change_domain(
         self,
@@ -308,4 +309,4 @@ class Domain(BaseAPI):
             data["excludedFromAutoHyperlinking"] = excluded_from_auto_hyperlinking
 
         response = self._patch(url=f"{self.__base_api}/{domain_id}", data=data)
-        return self._handle_response(response)
+        return self._entity_write("domain", domain_id, response)
@@ -17,3 +17,14 @@ class NotFoundError(CollibraAPIError):
 
 class ServerError(CollibraAPIError):
     """Raised when server returns 5xx errors"""
+
+
+class CircuitOpenError(ServerError):
+    """Raised when a circuit breaker rejects a request without sending it"""
+
+    def __init__(self, endpoint: str, retry_after: float = 0.0) -> None:
+        super().__init__(
+            f"Circuit breaker open for '{endpoint}', retry in {retry_after:.1f}s"
+        )
+        self.endpoint = endpoint
+        self.retry_after = retry_after
@@ -1,4 +1,5 @@
 from .Base import BaseAPI
+from ..helpers import METADATA_CACHE_TTL, timed_cache
 
 
 class Metadata(BaseAPI):
@@ -6,6 +7,7 @@ class Metadata(BaseAPI):
         super().__init__(connector)
         self.__base_api = connector.api
 
+    @timed_cache(ttl_seconds=METADATA_CACHE_TTL, maxsize=8, copy_results=True)
     def get_collibra_metadata(self):
         """
         Retrieve comprehensive metadata from Collibra including asset types,
@@ -89,31 +91,37 @@ class Metadata(BaseAPI):
         except Exception as e:
             raise Exception(f"Error fetching Collibra metadata: {str(e)}") from e
 
+    @timed_cache(ttl_seconds=METADATA_CACHE_TTL, maxsize=8, copy_results=True)
     def get_asset_types(self):
         """Get all asset types."""
         response = self._get(url=f"{self.__base_api}/assetTypes")
         return self._handle_response(response)
 
+    @timed_cache(ttl_seconds=METADATA_CACHE_TTL, maxsize=8, copy_results=True)
     def get_relation_types(self):
         """Get all relation types."""
         response = self._get(url=f"{self.__base_api}/relationTypes")
         return self._handle_response(response)
 
+    @timed_cache(ttl_seconds=METADATA_CACHE_TTL, maxsize=8, copy_results=True)
     def get_statuses(self):
         """Get all statuses."""
         response = self._get(url=f"{self.__base_api}/statuses")
         return self._handle_response(response)
 
+    @timed_cache(ttl_seconds=METADATA_CACHE_TTL, maxsize=8, copy_results=True)
     def get_attribute_types(self):
         """Get all attribute types."""
         response = self._get(url=f"{self.__base_api}/attributeTypes")
         return self._handle_response(response)
 
+    @timed_cache(ttl_seconds=METADATA_CACHE_TTL, maxsize=8, copy_results=True)
     def get_domain_types(self):
         """Get all domain types."""
         response = self._get(url=f"{self.__base_api}/domainTypes")
         return self._handle_response(response)
 
+    @timed_cache(ttl_seconds=METADATA_CACHE_TTL, maxsize=8, copy_results=True)
     def get_roles(self):
         """Get all roles."""
         response = self._get(url=f"{self.__base_api}/roles")
@@ -1,19 +1,33 @@
-import requests
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator, List, Sequence, Union
 from .Base import BaseAPI
+from ..codec import JSONArrayStream
 
 
 class OutputModule(BaseAPI):
     """
     Output Module API endpoints for Collibra DGC.
     """
+    STREAM_CHUNK_SIZE = 64 * 1024
+
     def __init__(self, connector):
         super().__init__(connector)
         self.__base_api = connector.api + "/outputModule"
 
+    def _view_config_body(self, view_config: Union[str, Dict[str, Any]]) -> bytes:
+        """
+        Encodes a ViewConfig/TableViewConfig given as a JSON/YAML string or a dictionary.
+        :param view_config: The ViewConfig as a string or dictionary.
+        :return: The request body as bytes.
+        """
+        if isinstance(view_config, dict):
+            return self._BaseAPI__connector.json_codec.dumps(view_config)
+        if not view_config:
+            raise ValueError("view_config cannot be empty")
+        return view_config.encode("utf-8")
+
     def export_json(
         self,
-        body: str,
+        body: Union[str, Dict[str, Any]],
         validation_enabled: bool = False
     ) -> Dict[Any, Any]:
         """
@@ -26,7 +40,7 @@ class OutputModule(BaseAPI):
         and a limit on the number of results).
 
         Args:
-            view_config (str): The JSON/YAML representation of ViewConfig/TableViewConfig
+            body (str | dict): The JSON/YAML representation of ViewConfig/TableViewConfig
                              that describes the query to be performed.
             validation_enabled (bool): Determines if the ViewConfig's syntax should be validated
                                      (True) or not (False). Default value is False for backward
@@ -45,4 +59,120 @@ class OutputModule(BaseAPI):
             'Content-Type': 'application/json'
         }
 
-        return self._post(url=endpoint, data=body, headers=headers).json()
+        response = self._BaseAPI__connector._make_request(
+            "POST",
+            endpoint,
+            data=self._view_config_body(body),
+            headers=headers,
+            params={"validationEnabled": str(validation_enabled).lower()}
+        )
+        return self._handle_response(response)
+
+    def stream_json(
+        self,
+        body: Union[str, Dict[str, Any]],
+        validation_enabled: bool = False,
+        path: Optional[Sequence[str]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Exports results in JSON format and yields the rows as they are parsed off the socket.
+
+        Unlike export_json, the response is never held in memory as a whole, so peak memory
+        stays constant regardless of the export size.
+
+        Args:
+            body (str | dict): The JSON/YAML representation of ViewConfig/TableViewConfig
+                             that describes the query to be performed.
+            validation_enabled (bool): Determines if the ViewConfig's syntax should be validated.
+            path (Sequence[str], optional): Object keys leading to the rows array, e.g.
+                ("view", "Asset") for a ViewConfig or ("aaData",) for a TableViewConfig.
+                Defaults to the first array in the response.
+
+        Yields:
+            Dict[str, Any]: One exported row at a time.
+
+        Raises:
+            ValueError: If the response does not contain the rows array.
+        """
+        connector = self._BaseAPI__connector
+        endpoint = f"{self.__base_api}/export/json"
+        response = connector._make_request(
+            "POST",
+            endpoint,
+            data=self._view_config_body(body),
+            headers={'Content-Type': 'application/json'},
+            params={"validationEnabled": str(validation_enabled).lower()},
+            stream=True
+        )
+        try:
+            if response.status_code != 200:
+                self._handle_response(response)
+            codec = connector.json_codec
+            stream = JSONArrayStream(path)
+            for chunk in response.iter_content(chunk_size=self.STREAM_CHUNK_SIZE):
+                for item in stream.feed(chunk):
+                    yield codec.loads(item)
+                if stream.done:
+                    break
+            stream.close()
+        finally:
+            response.close()
+
+    @staticmethod
+    def table_view_config(
+        resource: str,
+        fields: Dict[str, Any],
+        filter: Optional[Dict[str, Any]] = None,
+        order: Optional[List[Dict[str, Any]]] = None,
+        display_start: int = 0,
+        display_length: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Builds a TableViewConfig whose Columns mirror the requested fields.
+
+        Every field named with ``{"name": ...}`` becomes a column; lists of fields
+        (e.g. ``"StringAttribute": [{"name": "attributes", ...}]``) become column
+        groups, which the JSON export returns as nested arrays of objects.
+
+        Args:
+            resource (str): The root resource, e.g. "Asset".
+            fields (dict): The Output Module fields of the root resource.
+            filter (dict, optional): The resource Filter, e.g. {"AND": [{"Field": {...}}]}.
+            order (list, optional): The resource Order, e.g. [{"Field": {"name": "id", "order": "ASC"}}].
+            display_start (int): Index of the first row to return.
+            display_length (int, optional): Maximum number of rows to return.
+
+        Returns:
+            Dict[str, Any]: The TableViewConfig, ready for export_json or stream_json.
+        """
+        definition = dict(fields)
+        if filter:
+            definition["Filter"] = filter
+        if order:
+            definition["Order"] = order
+        config: Dict[str, Any] = {
+            "displayStart": display_start,
+            "Resources": {resource: definition},
+            "Columns": _columns(fields),
+        }
+        if display_length is not None:
+            config["displayLength"] = display_length
+        return {"TableViewConfig": config}
+
+
+def _columns(fields: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Derives TableViewConfig Columns from Output Module fields."""
+    columns: List[Dict[str, Any]] = []
+    for key, value in fields.items():
+        if key in ("Filter", "Order"):
+            continue
+        if isinstance(value, list):
+            for group in value:
+                nested = {k: v for k, v in group.items() if isinstance(v, (dict, list))}
+                columns.append({"Group": {"name": group["name"], "Columns": _columns(nested)}})
+        elif isinstance(value, dict):
+            if isinstance(value.get("name"), str):
+                columns.append({"Column": {"fieldName": value["name"]}})
+            else:
+                columns.extend(_columns(value))
+    return columns
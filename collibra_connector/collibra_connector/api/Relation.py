@@ -344,22 +344,19 @@ class Relation(BaseAPI):
             "incoming_count": 0
         }
 
-        # Cache for relation type details
+        # Relation type details come from the connector-wide registry
+        registry = self._BaseAPI__connector.relation_types
         type_cache = {}
 
         def get_type_name(type_id, is_source=True):
-            """Get relation type name, using cache."""
+            """Get relation type name from the registry."""
             if not include_type_details or not type_id:
                 return "Unknown"
 
             if type_id not in type_cache:
-                try:
-                    type_details = self.get_relation_type(type_id)
-                    type_cache[type_id] = type_details
-                except Exception:
-                    type_cache[type_id] = {}
+                type_cache[type_id] = registry.get(type_id) or {}
 
-            cached = type_cache.get(type_id, {})
+            cached = type_cache[type_id]
             if is_source:
                 return cached.get("role", "Unknown")
             else:
@@ -58,7 +58,7 @@ class Search(BaseAPI):
         # Default to ASSET category if not specified, usually what users want
         # But maybe better to leave it open. The API defaults to all.
         
-        response = self._post(url=self.__base_api, data=data)
+        response = self._post(url=self.__base_api, data=data, cacheable=True)
         return self._handle_response(response)
 
     def find_assets(
@@ -1,5 +1,6 @@
 import uuid
 from .Base import BaseAPI
+from ..cache import request_key
 
 
 class User(BaseAPI):
@@ -23,8 +24,9 @@ class User(BaseAPI):
         except ValueError as exc:
             raise ValueError("user_id must be a valid UUID") from exc
 
-        response = self._get(url=f"{self.__base_api}/{user_id}")
-        return self._handle_response(response)
+        return self._entity(
+            "user", user_id, lambda: self._handle_response(self._get(url=f"{self.__base_api}/{user_id}"))
+        )
 
     def get_user_by_username(self, username: str):
         """
@@ -37,6 +39,13 @@ class User(BaseAPI):
         if not isinstance(username, str):
             raise ValueError("username must be a string")
 
+        # Usernames of departed users are looked up repeatedly; remember the misses
+        connector = self._BaseAPI__connector
+        negative_cache = connector.negative_cache
+        key = request_key(self.__base_api, {"userName": username})
+        if negative_cache is not None and negative_cache.hit(key, connector.cache_identity):
+            return None
+
         result = self.find_users(
             name=username,
             name_search_fields=["USERNAME"],
@@ -46,6 +55,8 @@ class User(BaseAPI):
 
         if result.get("total", 0) > 0:
             return result.get("results", [{}])[0].get("id", "")
+        if negative_cache is not None:
+            negative_cache.add(key, connector.cache_identity)
         return None
 
     def create_user(self, username: str, email_address: str):
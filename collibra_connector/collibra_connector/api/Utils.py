@@ -1,113 +1,200 @@
+import os
 import re
 import logging
+import threading
+import time
 from .Base import BaseAPI
+from ..cache import default_cache_dir, read_json_file, write_json_file
+from ..helpers import METADATA_CACHE_TTL, timed_cache
 
 logger = logging.getLogger(__name__)
 
+# Bump when the layout of the UUID mappings changes; older snapshots are ignored
+UUIDS_SNAPSHOT_VERSION = 1
+# Snapshots older than this (seconds) are used, then refreshed in the background
+UUIDS_SNAPSHOT_MAX_AGE = 3600
+UUIDS_PAGE_SIZE = 1000
+
+# Category -> endpoint fetched by get_uuids
+UUID_ENDPOINTS = {
+    "AssetType": "assetTypes",
+    "Relation": "relationTypes",
+    "Responsibility": "roles",
+    "Status": "statuses",
+    "Attribute": "attributeTypes",
+    "Community": "communities",
+    "Domain": "domains",
+    "DomainType": "domainTypes",
+    "WorkflowDefinition": "workflowDefinitions",
+}
+
 
 class Utils(BaseAPI):
     def __init__(self, connector):
         super().__init__(connector)
+        self.__connector = connector
         self.__base_api = connector.api
+        self.__refresh_lock = threading.Lock()
+        self._refresh_thread = None
 
     def get_uuids(self):
         """
         Retrieves UUIDs of asset types, relation types, responsibilities, statuses, and attributes from Collibra,
         returning a dictionary with names as keys and UUIDs as values. Relation type names are used.
+        The categories are fetched concurrently and every page of each category is read.
 
         Returns:
             A dictionary containing dictionaries of named UUIDs for asset types, relation types,
             responsibilities, statuses, and attributes.
         """
-        metadata = {
-            "AssetType": {},
-            "Relation": {},
-            "Responsibility": {},
-            "Status": {},
-            "Attribute": {},
-            "Community": {},
-            "Domain": {},
-            "DomainType": {},
-            "WorkflowDefinition": {},
-        }
         try:
-            # Get Asset Type UUIDs
-            asset_types_url = f"{self.__base_api}/assetTypes"
-            asset_types_response = self._get(url=asset_types_url)
-            asset_types_data = self._handle_response(asset_types_response)
-            for asset_type in asset_types_data["results"]:
-                metadata["AssetType"][asset_type["name"]] = asset_type["id"]
-
-            # Get Relation Type UUIDs
-            relation_types_url = f"{self.__base_api}/relationTypes"
-            relation_types_response = self._get(url=relation_types_url)
-            relation_types_data = self._handle_response(relation_types_response)
-            for relation_type in relation_types_data["results"]:
-                source_name = re.sub(" ", "", relation_type["sourceType"]["name"])
-                target_name = re.sub(" ", "", relation_type["targetType"]["name"])
-                metadata["Relation"][f"{source_name}_{target_name}"] = relation_type["id"]
-
-            # Get Roles
-            resource_roles_url = f"{self.__base_api}/roles"
-            resource_roles_response = self._get(url=resource_roles_url)
-            resource_roles_data = self._handle_response(resource_roles_response)
-            for resource_role in resource_roles_data["results"]:
-                metadata["Responsibility"][resource_role["name"]] = resource_role["id"]
-
-            # Get Status UUIDs
-            statuses_url = f"{self.__base_api}/statuses"
-            statuses_response = self._get(url=statuses_url)
-            statuses_data = self._handle_response(statuses_response)
-            for status in statuses_data["results"]:
-                metadata["Status"][status["name"]] = status["id"]
-
-            # Get Attribute UUIDs
-            attributes_url = f"{self.__base_api}/attributeTypes"
-            attributes_response = self._get(url=attributes_url)
-            attributes_data = self._handle_response(attributes_response)
-            for attribute in attributes_data["results"]:
-                metadata["Attribute"][attribute["name"]] = attribute["id"]
-
-            # Get Community UUIDs
-            communities_url = f"{self.__base_api}/communities"
-            communities_response = self._get(url=communities_url)
-            communities_data = self._handle_response(communities_response)
-            for community in communities_data["results"]:
-                metadata["Community"][community["name"]] = community["id"]
-
-            # Get Domain UUIDs
-            domains_url = f"{self.__base_api}/domains"
-            domains_params = {"limit": 1000, "offset": 0}
-            while True:
-                domains_response = self._get(url=domains_url, params=domains_params)
-                domains_data = self._handle_response(domains_response)
-                for domain in domains_data["results"]:
-                    metadata["Domain"][domain["name"]] = domain["id"]
-                if domains_data.get("offset") + domains_data.get(
-                    "limit"
-                ) >= domains_data.get("total"):
-                    break
-                domains_params["offset"] += domains_params["limit"]
-
-            # Get Domain Type UUIDs
-            domain_types_url = f"{self.__base_api}/domainTypes"
-            domain_types_response = self._get(url=domain_types_url)
-            domain_types_data = self._handle_response(domain_types_response)
-            for domain_type in domain_types_data["results"]:
-                metadata["DomainType"][domain_type["name"]] = domain_type["id"]
-
-            # Get Workflow Definition UUIDs
-            workflow_definitions_url = f"{self.__base_api}/workflowDefinitions"
-            workfow_definitions_response = self._get(
-                workflow_definitions_url
-            )
-            workfow_definitions_response.raise_for_status()
-            workflow_definitions_data = workfow_definitions_response.json()
-            for workflow_definition in workflow_definitions_data["results"]:
-                metadata["WorkflowDefinition"][workflow_definition["name"]] = workflow_definition["id"]
-            logger.info("Collibra UUIDS fetched successfully")
-            return metadata
-
+            return self._fetch_uuids()
         except (KeyError, ValueError, AttributeError) as e:
             logger.error("Error fetching Collibra UUIDs: %s", e)
             return None
+
+    def load_uuids(self, path: str = None, max_age: float = UUIDS_SNAPSHOT_MAX_AGE, refresh: bool = True):
+        """
+        Returns the UUID mappings from a local snapshot, fetching and saving them if there is none.
+        A snapshot older than max_age is returned as is and refreshed in a background thread, which
+        updates the returned dictionary in place and rewrites the snapshot.
+        :param path: Snapshot file. Defaults to snapshot_path().
+        :param max_age: Age in seconds after which the snapshot is refreshed.
+        :param refresh: If False, a stale snapshot is returned without refreshing it.
+        :return: A dictionary like get_uuids(), or None if there was no snapshot and fetching failed.
+        """
+        path = path or self.snapshot_path()
+        snapshot = self._read_snapshot(path)
+        if snapshot is None:
+            uuids = self.get_uuids()
+            if uuids is not None:
+                self.save_uuids(uuids, path)
+            return uuids
+
+        uuids = snapshot["uuids"]
+        if refresh and time.time() - snapshot["created_at"] > max_age:
+            self.refresh_uuids(uuids, path)
+        return uuids
+
+    def refresh_uuids(self, uuids: dict, path: str = None):
+        """
+        Re-fetches the UUID mappings in a daemon thread, updating uuids in place and saving the snapshot.
+        Does nothing if a refresh is already running.
+        :param uuids: The dictionary to update, e.g. connector.uuids.
+        :param path: Snapshot file. Defaults to snapshot_path().
+        :return: The refresh thread, or None if one was already running.
+        """
+        path = path or self.snapshot_path()
+        with self.__refresh_lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return None
+
+            def run():
+                try:
+                    fresh = self._download_uuids()
+                except Exception as e:
+                    logger.warning("Background refresh of Collibra UUIDs failed: %s", e)
+                    return
+                # Each category is swapped in with a single assignment
+                for category, mapping in fresh.items():
+                    uuids[category] = mapping
+                self.save_uuids(fresh, path)
+
+            self._refresh_thread = threading.Thread(target=run, name="collibra-uuids-refresh", daemon=True)
+            self._refresh_thread.start()
+            return self._refresh_thread
+
+    def save_uuids(self, uuids: dict, path: str = None):
+        """
+        Atomically writes the UUID mappings to a versioned snapshot file.
+        Failures are logged and ignored.
+        :param uuids: The mappings returned by get_uuids().
+        :param path: Snapshot file. Defaults to snapshot_path().
+        """
+        path = path or self.snapshot_path()
+        snapshot = {
+            "version": UUIDS_SNAPSHOT_VERSION,
+            "api": self.__base_api,
+            "identity": self.__connector.cache_identity,
+            "created_at": time.time(),
+            "uuids": uuids,
+        }
+        try:
+            write_json_file(path, snapshot)
+        except OSError as e:
+            logger.warning("Could not write UUID snapshot %s: %s", path, e)
+
+    def snapshot_path(self):
+        """
+        Returns the default snapshot file for this Collibra instance and user inside the connector cache
+        directory. Users see different communities and domains, so each one gets its own snapshot.
+        :return: The snapshot file path.
+        """
+        return os.path.join(default_cache_dir(), f"uuids-{self.__connector.cache_identity[:16]}.json")
+
+    def _read_snapshot(self, path):
+        """
+        Reads a snapshot, returning None if it is missing, unreadable, from another version, instance or user.
+        """
+        snapshot = read_json_file(path)
+        if (
+            not isinstance(snapshot, dict)
+            or snapshot.get("version") != UUIDS_SNAPSHOT_VERSION
+            or snapshot.get("api") != self.__base_api
+            or snapshot.get("identity") != self.__connector.cache_identity
+            or not isinstance(snapshot.get("uuids"), dict)
+            or set(snapshot["uuids"]) != set(UUID_ENDPOINTS)
+            or not isinstance(snapshot.get("created_at"), (int, float))
+        ):
+            return None
+        return snapshot
+
+    @timed_cache(ttl_seconds=METADATA_CACHE_TTL, maxsize=8, copy_results=True)
+    def _fetch_uuids(self):
+        """
+        Fetches the UUID mappings returned by get_uuids, memoized for METADATA_CACHE_TTL seconds.
+        Failures raise and are not cached.
+        """
+        return self._download_uuids()
+
+    def _download_uuids(self):
+        """
+        Fetches every category concurrently on the connector's thread pool.
+        The first failure is raised.
+        """
+        categories = list(UUID_ENDPOINTS)
+        pages = self.__connector.map(lambda category: self._get_all(UUID_ENDPOINTS[category]), categories)
+        pages.raise_for_errors()
+
+        metadata = {}
+        for category, results in zip(categories, pages.results):
+            if category == "Relation":
+                mapping = {}
+                for relation_type in results:
+                    source_name = re.sub(" ", "", relation_type["sourceType"]["name"])
+                    target_name = re.sub(" ", "", relation_type["targetType"]["name"])
+                    mapping[f"{source_name}_{target_name}"] = relation_type["id"]
+            else:
+                mapping = {item["name"]: item["id"] for item in results}
+            metadata[category] = mapping
+        logger.info("Collibra UUIDS fetched successfully")
+        return metadata
+
+    def _get_all(self, endpoint, limit=UUIDS_PAGE_SIZE):
+        """
+        Reads all pages of a list endpoint.
+        :param endpoint: The endpoint below the REST API root, e.g. "assetTypes".
+        :param limit: Page size.
+        :return: The combined results.
+        """
+        url = f"{self.__base_api}/{endpoint}"
+        results = []
+        offset = 0
+        while True:
+            data = self._handle_response(self._get(url=url, params={"offset": offset, "limit": limit}))
+            page = data["results"]
+            results.extend(page)
+            offset += len(page)
+            total = data.get("total")
+            if not page or (offset >= total if total is not None else len(page) < limit):
+                return results
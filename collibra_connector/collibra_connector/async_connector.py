@@ -25,9 +25,12 @@ Example:
 from __future__ import annotations
 
 import asyncio
+import copy
 import logging
 import os
-from typing import Any, Dict, List, Optional, TypeVar, Union, TYPE_CHECKING
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Sequence, TypeVar, Union, TYPE_CHECKING
 
 try:
     import httpx
@@ -35,6 +38,12 @@ try:
 except ImportError:
     HTTPX_AVAILABLE = False
 
+try:
+    import h2  # noqa: F401
+    H2_AVAILABLE = True
+except ImportError:
+    H2_AVAILABLE = False
+
 from .models import (
     AssetModel,
     AssetList,
@@ -74,6 +83,25 @@ from .api.Exceptions import (
     NotFoundError,
     ServerError,
 )
+from .auth import SessionToken, apply_session, login_payload, parse_session_response
+from .cache import (
+    CacheKey,
+    CachedResponse,
+    ConditionalGetCache,
+    EntityCache,
+    NegativeCache,
+    ResponseCache,
+    cache_identity,
+    request_key,
+)
+from .codec import JSONArrayStream, JSONCodec, accept_encoding, get_json_codec
+from .resilience import (
+    AdaptiveConcurrencyLimiter,
+    CircuitBreakerRegistry,
+    HedgingPolicy,
+    RateLimiter,
+    endpoint_family,
+)
 
 
 T = TypeVar('T')
@@ -92,16 +120,38 @@ class AsyncBaseAPI:
         params: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """Make async GET request."""
-        return await self._connector._request("GET", endpoint, params=params)
+        def fetch() -> Awaitable[Dict[str, Any]]:
+            return self._connector._request("GET", endpoint, params=params)
+
+        negative_cache = self._connector.negative_cache
+        if negative_cache is None:
+            return await self._cached("GET", endpoint, params, None, fetch)
+        key = request_key(f"{self._base_url}{endpoint}", params)
+        identity = self._connector.cache_identity
+        if negative_cache.hit(key, identity):
+            raise NotFoundError(f"Not found (cached): {endpoint}")
+        try:
+            return await self._cached("GET", endpoint, params, None, fetch)
+        except NotFoundError:
+            negative_cache.add(key, identity)
+            raise
 
     async def _post(
         self,
         endpoint: str,
         data: Dict[str, Any],
-        params: Optional[Dict[str, Any]] = None
+        params: Optional[Dict[str, Any]] = None,
+        cacheable: bool = False
     ) -> Dict[str, Any]:
-        """Make async POST request."""
-        return await self._connector._request("POST", endpoint, json=data, params=params)
+        """Make async POST request (cacheable=True for read-only POSTs such as /search)."""
+        if cacheable:
+            return await self._cached(
+                "POST", endpoint, params, data,
+                lambda: self._connector._request("POST", endpoint, json=data, params=params)
+            )
+        return await self._invalidating(
+            endpoint, self._connector._request("POST", endpoint, json=data, params=params)
+        )
 
     async def _put(
         self,
@@ -109,7 +159,7 @@ class AsyncBaseAPI:
         data: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Make async PUT request."""
-        return await self._connector._request("PUT", endpoint, json=data)
+        return await self._invalidating(endpoint, self._connector._request("PUT", endpoint, json=data))
 
     async def _patch(
         self,
@@ -117,11 +167,86 @@ class AsyncBaseAPI:
         data: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Make async PATCH request."""
-        return await self._connector._request("PATCH", endpoint, json=data)
+        return await self._invalidating(endpoint, self._connector._request("PATCH", endpoint, json=data))
 
     async def _delete(self, endpoint: str) -> Dict[str, Any]:
         """Make async DELETE request."""
-        return await self._connector._request("DELETE", endpoint)
+        return await self._invalidating(endpoint, self._connector._request("DELETE", endpoint))
+
+    async def _cached(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        body: Any,
+        send: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        Serve a read request from the connector's response cache, or send it and store the result.
+
+        SQLite calls run in the default executor so the event loop never blocks on disk I/O.
+        """
+        cache = self._connector.response_cache
+        if cache is None:
+            return await send()
+        url = f"{self._base_url}{endpoint}"
+        key = cache.key(method, url, params, body, self._connector.cache_identity)
+        loop = asyncio.get_running_loop()
+        cached = await loop.run_in_executor(None, cache.get, key)
+        codec = self._connector.json_codec
+        if cached is not None:
+            return codec.loads(cached.content)
+        result = await send()
+        await loop.run_in_executor(None, cache.set, key, url, codec.dumps(result))
+        return result
+
+    async def _entity(
+        self,
+        kind: str,
+        entity_id: str,
+        endpoint: str
+    ) -> Dict[str, Any]:
+        """GET an entity through the connector's entity cache."""
+        cache = self._connector.entity_cache
+        if cache is None:
+            return await self._get(endpoint)
+        entity = cache.get(kind, entity_id)
+        if entity is None:
+            generation = cache.generation
+            entity = await self._get(endpoint)
+            if entity:
+                cache.put(kind, entity_id, entity, generation)
+        return entity
+
+    async def _entity_write(
+        self,
+        kind: str,
+        entity_id: str,
+        request: Awaitable[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Await a write to an entity, then update the entity cache with its result."""
+        cache = self._connector.entity_cache
+        if cache is None:
+            return await request
+        try:
+            result = await request
+        finally:
+            cache.invalidate(kind, entity_id)
+        if isinstance(result, dict) and result.get("id") == entity_id:
+            cache.put(kind, entity_id, result)
+        return result
+
+    async def _invalidating(self, endpoint: str, request: Awaitable[Dict[str, Any]]) -> Dict[str, Any]:
+        """Await a write, then drop cached responses and 404s of the endpoint family it may have changed."""
+        try:
+            return await request
+        finally:
+            url = f"{self._base_url}{endpoint}"
+            if self._connector.negative_cache is not None:
+                self._connector.negative_cache.invalidate(url)
+            cache = self._connector.response_cache
+            if cache is not None:
+                await asyncio.get_running_loop().run_in_executor(None, cache.invalidate_related, url)
 
 
 class AsyncAssetAPI(AsyncBaseAPI):
@@ -142,7 +267,7 @@ class AsyncAssetAPI(AsyncBaseAPI):
             >>> print(asset.name)
             >>> print(asset.status.name)
         """
-        data = await self._get(f"/assets/{asset_id}")
+        data = await self._entity("asset", asset_id, f"/assets/{asset_id}")
         return parse_asset(data)
 
     async def find_assets(
@@ -191,7 +316,7 @@ class AsyncAssetAPI(AsyncBaseAPI):
     async def get_assets_batch(
         self,
         asset_ids: List[str],
-        max_concurrent: int = 50
+        max_concurrent: Optional[int] = None
     ) -> List[AssetModel]:
         """
         Fetch multiple assets in parallel.
@@ -201,7 +326,8 @@ class AsyncAssetAPI(AsyncBaseAPI):
 
         Args:
             asset_ids: List of asset UUIDs to fetch.
-            max_concurrent: Maximum concurrent requests.
+            max_concurrent: Maximum concurrent requests. Defaults to the connector's
+                adaptive limit when enabled, otherwise 50.
 
         Returns:
             List of AssetModel objects.
@@ -211,16 +337,15 @@ class AsyncAssetAPI(AsyncBaseAPI):
             >>> for asset in assets:
             ...     print(f"{asset.name}: {asset.status.name}")
         """
-        semaphore = asyncio.Semaphore(max_concurrent)
-
         async def fetch_one(asset_id: str) -> Optional[AssetModel]:
-            async with semaphore:
-                try:
-                    return await self.get_asset(asset_id)
-                except Exception:
-                    return None
+            try:
+                return await self.get_asset(asset_id)
+            except Exception:
+                return None
 
-        results = await asyncio.gather(*[fetch_one(aid) for aid in asset_ids])
+        results = await self._connector._gather_limited(
+            [fetch_one(aid) for aid in asset_ids], max_concurrent, default=50
+        )
         return [r for r in results if r is not None]
 
     async def add_asset(
@@ -251,7 +376,7 @@ class AsyncAssetAPI(AsyncBaseAPI):
     async def add_assets_batch(
         self,
         assets: List[Dict[str, Any]],
-        max_concurrent: int = 20
+        max_concurrent: Optional[int] = None
     ) -> List[AssetModel]:
         """
         Create multiple assets in parallel.
@@ -259,21 +384,21 @@ class AsyncAssetAPI(AsyncBaseAPI):
         Args:
             assets: List of asset data dicts with keys:
                    name, domain_id, type_id, status_id, display_name
-            max_concurrent: Maximum concurrent requests.
+            max_concurrent: Maximum concurrent requests. Defaults to the connector's
+                adaptive limit when enabled, otherwise 20.
 
         Returns:
             List of created AssetModel objects.
         """
-        semaphore = asyncio.Semaphore(max_concurrent)
-
         async def create_one(asset_data: Dict[str, Any]) -> Optional[AssetModel]:
-            async with semaphore:
-                try:
-                    return await self.add_asset(**asset_data)
-                except Exception:
-                    return None
+            try:
+                return await self.add_asset(**asset_data)
+            except Exception:
+                return None
 
-        results = await asyncio.gather(*[create_one(a) for a in assets])
+        results = await self._connector._gather_limited(
+            [create_one(a) for a in assets], max_concurrent, default=20
+        )
         return [r for r in results if r is not None]
 
     async def change_asset(
@@ -295,12 +420,12 @@ class AsyncAssetAPI(AsyncBaseAPI):
         if domain_id:
             data["domainId"] = domain_id
 
-        result = await self._patch(f"/assets/{asset_id}", data)
+        result = await self._entity_write("asset", asset_id, self._patch(f"/assets/{asset_id}", data))
         return parse_asset(result)
 
     async def remove_asset(self, asset_id: str) -> None:
         """Delete an asset."""
-        await self._delete(f"/assets/{asset_id}")
+        await self._entity_write("asset", asset_id, self._delete(f"/assets/{asset_id}"))
 
     async def get_full_profile(
         self,
@@ -426,19 +551,18 @@ class AsyncAttributeAPI(AsyncBaseAPI):
     async def add_attributes_batch(
         self,
         attributes: List[Dict[str, Any]],
-        max_concurrent: int = 30
+        max_concurrent: Optional[int] = None
     ) -> List[AttributeModel]:
         """Add multiple attributes in parallel."""
-        semaphore = asyncio.Semaphore(max_concurrent)
-
         async def add_one(attr: Dict[str, Any]) -> Optional[AttributeModel]:
-            async with semaphore:
-                try:
-                    return await self.add_attribute(**attr)
-                except Exception:
-                    return None
+            try:
+                return await self.add_attribute(**attr)
+            except Exception:
+                return None
 
-        results = await asyncio.gather(*[add_one(a) for a in attributes])
+        results = await self._connector._gather_limited(
+            [add_one(a) for a in attributes], max_concurrent, default=30
+        )
         return [r for r in results if r is not None]
 
 
@@ -447,7 +571,7 @@ class AsyncDomainAPI(AsyncBaseAPI):
 
     async def get_domain(self, domain_id: str) -> DomainModel:
         """Get a domain by ID."""
-        data = await self._get(f"/domains/{domain_id}")
+        data = await self._entity("domain", domain_id, f"/domains/{domain_id}")
         return parse_domain(data)
 
     async def find_domains(
@@ -473,7 +597,7 @@ class AsyncCommunityAPI(AsyncBaseAPI):
 
     async def get_community(self, community_id: str) -> CommunityModel:
         """Get a community by ID."""
-        data = await self._get(f"/communities/{community_id}")
+        data = await self._entity("community", community_id, f"/communities/{community_id}")
         return parse_community(data)
 
     async def find_communities(
@@ -540,19 +664,18 @@ class AsyncRelationAPI(AsyncBaseAPI):
     async def add_relations_batch(
         self,
         relations: List[Dict[str, str]],
-        max_concurrent: int = 30
+        max_concurrent: Optional[int] = None
     ) -> List[RelationModel]:
         """Create multiple relations in parallel."""
-        semaphore = asyncio.Semaphore(max_concurrent)
-
         async def add_one(rel: Dict[str, str]) -> Optional[RelationModel]:
-            async with semaphore:
-                try:
-                    return await self.add_relation(**rel)
-                except Exception:
-                    return None
+            try:
+                return await self.add_relation(**rel)
+            except Exception:
+                return None
 
-        results = await asyncio.gather(*[add_one(r) for r in relations])
+        results = await self._connector._gather_limited(
+            [add_one(r) for r in relations], max_concurrent, default=30
+        )
         return [r for r in results if r is not None]
 
     async def get_asset_relations(
@@ -676,7 +799,7 @@ class AsyncSearchAPI(AsyncBaseAPI):
         if community_ids:
             data["communityIds"] = community_ids
 
-        result = await self._post("/search", data)
+        result = await self._post("/search", data, cacheable=True)
         return parse_search_results(result)
 
     async def find_assets(
@@ -698,6 +821,79 @@ class AsyncSearchAPI(AsyncBaseAPI):
         )
 
 
+class AsyncOutputModuleAPI(AsyncBaseAPI):
+    """Async Output Module API."""
+
+    def _view_config_body(self, view_config: Union[str, Dict[str, Any]]) -> bytes:
+        """Encode a ViewConfig/TableViewConfig given as a JSON/YAML string or a dict."""
+        if isinstance(view_config, dict):
+            return self._connector.json_codec.dumps(view_config)
+        if not view_config:
+            raise ValueError("view_config cannot be empty")
+        return view_config.encode("utf-8")
+
+    async def export_json(
+        self,
+        view_config: Union[str, Dict[str, Any]],
+        validation_enabled: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Run an Output Module query and return the whole JSON result.
+
+        Args:
+            view_config: ViewConfig/TableViewConfig as a JSON/YAML string or dict.
+            validation_enabled: Whether Collibra validates the ViewConfig syntax.
+
+        Returns:
+            The exported results.
+        """
+        return await self._connector._request(
+            "POST",
+            "/outputModule/export/json",
+            content=self._view_config_body(view_config),
+            params={"validationEnabled": str(validation_enabled).lower()}
+        )
+
+    async def stream_json(
+        self,
+        view_config: Union[str, Dict[str, Any]],
+        validation_enabled: bool = False,
+        path: Optional[Sequence[str]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Run an Output Module query and yield rows as they are parsed off the socket.
+
+        Peak memory stays constant regardless of the export size.
+
+        Args:
+            view_config: ViewConfig/TableViewConfig as a JSON/YAML string or dict.
+            validation_enabled: Whether Collibra validates the ViewConfig syntax.
+            path: Object keys leading to the rows array, e.g. ("view", "Asset") or
+                ("aaData",). Defaults to the first array in the response.
+
+        Yields:
+            One exported row at a time.
+
+        Example:
+            >>> async for row in conn.output_module.stream_json(view_config):
+            ...     writer.write(row)
+        """
+        codec = self._connector.json_codec
+        async with self._connector._stream(
+            "POST",
+            "/outputModule/export/json",
+            content=self._view_config_body(view_config),
+            params={"validationEnabled": str(validation_enabled).lower()}
+        ) as response:
+            stream = JSONArrayStream(path)
+            async for chunk in response.aiter_bytes():
+                for item in stream.feed(chunk):
+                    yield codec.loads(item)
+                if stream.done:
+                    break
+            stream.close()
+
+
 class AsyncCollibraConnector:
     """
     Asynchronous Collibra Connector using httpx.
@@ -722,6 +918,10 @@ class AsyncCollibraConnector:
     DEFAULT_MAX_RETRIES: int = 3
     DEFAULT_RETRY_DELAY: float = 1.0
     RETRYABLE_STATUS_CODES: tuple = (429, 500, 502, 503, 504)
+    DEFAULT_MAX_CONNECTIONS: int = 100
+    # HTTP/2 multiplexes many streams per connection, so a few sockets suffice
+    DEFAULT_HTTP2_CONNECTIONS: int = 4
+    HTTP2_STREAMS_PER_CONNECTION: int = 100
 
     def __init__(
         self,
@@ -731,7 +931,19 @@ class AsyncCollibraConnector:
         timeout: float = DEFAULT_TIMEOUT,
         max_retries: int = DEFAULT_MAX_RETRIES,
         retry_delay: float = DEFAULT_RETRY_DELAY,
-        max_connections: int = 100
+        max_connections: Optional[int] = None,
+        rate_limit: Optional[float] = None,
+        adaptive_concurrency: bool = False,
+        circuit_breaker: Union[bool, CircuitBreakerRegistry] = True,
+        single_flight: bool = False,
+        hedging: Union[bool, HedgingPolicy] = False,
+        http2: bool = False,
+        session_auth: bool = False,
+        json_codec: Union[str, JSONCodec, None] = None,
+        conditional_cache: Union[bool, ConditionalGetCache] = False,
+        response_cache: Union[bool, str, ResponseCache] = False,
+        entity_cache: Union[bool, EntityCache] = False,
+        negative_cache: Union[bool, NegativeCache] = False
     ) -> None:
         """
         Initialize the async connector.
@@ -743,13 +955,51 @@ class AsyncCollibraConnector:
             timeout: Request timeout in seconds.
             max_retries: Max retry attempts.
             retry_delay: Base delay between retries.
-            max_connections: Maximum concurrent connections.
+            max_connections: Maximum open connections. Defaults to 100 for HTTP/1.1
+                and 4 for HTTP/2.
+            rate_limit: Maximum requests per second shared by all coroutines
+                (adapts down on 429; Retry-After is always honored).
+            adaptive_concurrency: If True, batch operations size their parallelism
+                with an AIMD controller (between 1 and max_connections, or the total
+                stream capacity under HTTP/2) instead of fixed semaphores.
+            circuit_breaker: Fail fast per endpoint family after repeated 5xx
+                responses or connection errors. Pass a CircuitBreakerRegistry to tune
+                thresholds or share breakers, or False to disable.
+            single_flight: If True, concurrent identical GETs (same URL and params)
+                share one in-flight request and its result.
+            hedging: If True (or a HedgingPolicy), GETs still running after the
+                endpoint's p95 latency get a backup request; the first response wins.
+                Extra load is capped by the policy's budget (5% by default).
+            http2: If True, multiplex concurrent requests as HTTP/2 streams over a
+                few connections. Requires the http2 extra (pip install httpx[http2]).
+            session_auth: If True, log in once via /auth/sessions and reuse the session
+                cookie and CSRF token instead of sending Basic auth on every request.
+                Expired sessions are re-established transparently.
+            json_codec: Codec for response bodies and request payloads: a JSONCodec,
+                "json", "orjson", or None to use orjson when it is installed.
+            conditional_cache: If True (or a ConditionalGetCache), GET responses carrying
+                an ETag or Last-Modified header are cached and revalidated, so unchanged
+                resources cost a 304 instead of a full payload.
+            response_cache: Persistent SQLite cache of read responses with per-endpoint
+                TTLs: True for the default file, a file path, or a ResponseCache. Writes
+                invalidate the affected endpoint family.
+            entity_cache: If True (or an EntityCache), get_asset, get_domain and
+                get_community results are cached in memory and kept up to date by this
+                connector's own writes.
+            negative_cache: If True (or a NegativeCache), GETs that returned 404 raise
+                NotFoundError locally for a short TTL instead of reaching the server again.
+                Pass the same NegativeCache to a sync connector to share it.
         """
         if not HTTPX_AVAILABLE:
             raise ImportError(
                 "httpx is required for async operations. "
                 "Install it with: pip install httpx"
             )
+        if http2 and not H2_AVAILABLE:
+            raise ImportError(
+                "h2 is required for HTTP/2. "
+                "Install it with: pip install httpx[http2]"
+            )
 
         # Load from env vars if not provided
         api = api or os.environ.get("COLLIBRA_URL")
@@ -766,10 +1016,49 @@ class AsyncCollibraConnector:
         self._api = api.rstrip("/") + "/rest/2.0"
         self._base_url = api.rstrip("/")
         self._auth = (username, password)
+        self._session_auth = session_auth
+        self._session_token: Optional[SessionToken] = None
+        self._session_lock: Optional[asyncio.Lock] = None
         self._timeout = timeout
         self._max_retries = max_retries
         self._retry_delay = retry_delay
+        self._http2 = http2
+        if max_connections is None:
+            max_connections = self.DEFAULT_HTTP2_CONNECTIONS if http2 else self.DEFAULT_MAX_CONNECTIONS
         self._max_connections = max_connections
+        # Requests in flight are bounded by streams, not sockets, under HTTP/2
+        max_concurrency = (
+            max_connections * self.HTTP2_STREAMS_PER_CONNECTION if http2 else max_connections
+        )
+        self._rate_limiter = RateLimiter(rate=rate_limit)
+        self._json_codec = get_json_codec(json_codec)
+        self._concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = (
+            AdaptiveConcurrencyLimiter(max_limit=max_concurrency) if adaptive_concurrency else None
+        )
+        if circuit_breaker is True:
+            circuit_breaker = CircuitBreakerRegistry()
+        self._circuit_breakers: Optional[CircuitBreakerRegistry] = circuit_breaker or None
+        self._single_flight = single_flight
+        self._inflight: Dict[Any, List[Any]] = {}
+        self._coalesced_count = 0
+        if hedging is True:
+            hedging = HedgingPolicy()
+        self._hedging: Optional[HedgingPolicy] = hedging or None
+        if conditional_cache is True:
+            conditional_cache = ConditionalGetCache()
+        self._conditional_cache: Optional[ConditionalGetCache] = conditional_cache or None
+        if response_cache is True:
+            response_cache = ResponseCache()
+        elif isinstance(response_cache, str):
+            response_cache = ResponseCache(response_cache)
+        self._response_cache: Optional[ResponseCache] = response_cache or None
+        self._cache_identity: str = cache_identity(self._api, username)
+        if entity_cache is True:
+            entity_cache = EntityCache()
+        self._entity_cache: Optional[EntityCache] = entity_cache or None
+        if negative_cache is True:
+            negative_cache = NegativeCache()
+        self._negative_cache: Optional[NegativeCache] = negative_cache or None
 
         self._client: Optional[httpx.AsyncClient] = None
         self.logger = logging.getLogger(__name__)
@@ -782,25 +1071,102 @@ class AsyncCollibraConnector:
         self.relation = AsyncRelationAPI(self)
         self.responsibility = AsyncResponsibilityAPI(self)
         self.search = AsyncSearchAPI(self)
+        self.output_module = AsyncOutputModuleAPI(self)
 
     @property
     def api(self) -> str:
         """Get the full API URL."""
         return self._api
 
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        """Get the rate limiter shared by all coroutines of this connector."""
+        return self._rate_limiter
+
+    @property
+    def circuit_breakers(self) -> Optional[CircuitBreakerRegistry]:
+        """Get the per-endpoint circuit breakers (None if disabled)."""
+        return self._circuit_breakers
+
+    @property
+    def json_codec(self) -> JSONCodec:
+        """Get the codec used to decode responses and encode request payloads."""
+        return self._json_codec
+
+    @property
+    def http2(self) -> bool:
+        """Check whether HTTP/2 multiplexing is enabled."""
+        return self._http2
+
+    @property
+    def hedging(self) -> Optional[HedgingPolicy]:
+        """Get the hedging policy for GET requests (None if disabled)."""
+        return self._hedging
+
+    @property
+    def conditional_cache(self) -> Optional[ConditionalGetCache]:
+        """Get the ETag/Last-Modified cache for GET responses (None if disabled)."""
+        return self._conditional_cache
+
+    @property
+    def response_cache(self) -> Optional[ResponseCache]:
+        """Get the persistent response cache (None if disabled)."""
+        return self._response_cache
+
+    @property
+    def cache_identity(self) -> str:
+        """Get the fingerprint of this connector's API and user that scopes shared cache entries."""
+        return self._cache_identity
+
+    @property
+    def entity_cache(self) -> Optional[EntityCache]:
+        """Get the entity cache (None if disabled)."""
+        return self._entity_cache
+
+    @property
+    def negative_cache(self) -> Optional[NegativeCache]:
+        """Get the cache of lookups that returned 404 (None if disabled)."""
+        return self._negative_cache
+
+    @property
+    def coalesced_count(self) -> int:
+        """Get the number of GETs served by joining an identical in-flight request."""
+        return self._coalesced_count
+
+    @property
+    def concurrency_limiter(self) -> Optional[AdaptiveConcurrencyLimiter]:
+        """Get the adaptive concurrency limiter (None unless adaptive_concurrency=True)."""
+        return self._concurrency_limiter
+
+    @property
+    def concurrency_limit(self) -> Optional[int]:
+        """Get the current adaptive concurrency limit, for metrics and logging."""
+        if self._concurrency_limiter is None:
+            return None
+        return self._concurrency_limiter.limit
+
     async def __aenter__(self) -> "AsyncCollibraConnector":
         """Enter async context manager."""
-        limits = httpx.Limits(
-            max_connections=self._max_connections,
-            max_keepalive_connections=self._max_connections // 2
-        )
+        if self._http2:
+            # Keep every multiplexed connection alive; reconnecting costs a TLS handshake
+            limits = httpx.Limits(
+                max_connections=self._max_connections,
+                max_keepalive_connections=self._max_connections
+            )
+        else:
+            limits = httpx.Limits(
+                max_connections=self._max_connections,
+                max_keepalive_connections=self._max_connections // 2
+            )
         self._client = httpx.AsyncClient(
-            auth=self._auth,
+            auth=None if self._session_auth else self._auth,
             timeout=self._timeout,
             limits=limits,
+            http2=self._http2,
             headers={
                 "Content-Type": "application/json",
-                "Accept": "application/json"
+                "Accept": "application/json",
+                "Accept-Encoding": accept_encoding()
             }
         )
         return self
@@ -808,9 +1174,51 @@ class AsyncCollibraConnector:
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Exit async context manager."""
         if self._client:
+            if self._session_token is not None:
+                await self._logout()
             await self._client.aclose()
             self._client = None
 
+    async def _get_session_token(self, stale: Optional[SessionToken] = None) -> SessionToken:
+        """
+        Return a valid session, logging in if there is none or it matches ``stale``.
+
+        Concurrent callers share a single login.
+        """
+        token = self._session_token
+        if token is not None and (stale is None or token.generation != stale.generation):
+            return token
+        if self._session_lock is None:
+            self._session_lock = asyncio.Lock()
+        async with self._session_lock:
+            token = self._session_token
+            if token is None or (stale is not None and token.generation == stale.generation):
+                response = await self._client.post(
+                    f"{self._api}/auth/sessions",
+                    json=login_payload(*self._auth)
+                )
+                try:
+                    body = response.json()
+                except ValueError:
+                    body = None
+                cookie, csrf_token = parse_session_response(
+                    response.status_code, dict(response.cookies), body, response.headers
+                )
+                generation = token.generation + 1 if token is not None else 1
+                token = self._session_token = SessionToken(cookie, csrf_token, generation)
+                self.logger.debug("Established Collibra session")
+            return token
+
+    async def _logout(self) -> None:
+        """End the current session (best effort)."""
+        token, self._session_token = self._session_token, None
+        headers: Dict[str, str] = {}
+        apply_session(headers, "DELETE", token)
+        try:
+            await self._client.delete(f"{self._api}/auth/sessions/current", headers=headers)
+        except httpx.HTTPError as e:
+            self.logger.debug(f"Session logout failed: {e}")
+
     async def _request(
         self,
         method: str,
@@ -837,17 +1245,78 @@ class AsyncCollibraConnector:
             )
 
         url = f"{self._api}{endpoint}"
+        if self._single_flight and method == "GET" and set(kwargs) <= {"params"}:
+            return await self._request_single_flight(url, kwargs.get("params"))
+        return await self._request_with_retry(method, url, **kwargs)
+
+    async def _request_single_flight(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Share one in-flight GET between all concurrent callers with the same URL and params.
+
+        The shared request is shielded, so cancelling one caller does not cancel it
+        for the others. When a result was shared, each caller gets its own copy.
+        """
+        key = request_key(url, params)
+        entry = self._inflight.get(key)
+        if entry is None:
+            task = asyncio.ensure_future(self._request_with_retry("GET", url, params=params))
+            entry = [task, 0]
+            self._inflight[key] = entry
+
+            def _done(finished: "asyncio.Future[Dict[str, Any]]") -> None:
+                if self._inflight.get(key) is entry:
+                    del self._inflight[key]
+                # Mark the exception as retrieved even if every caller was cancelled
+                if not finished.cancelled():
+                    finished.exception()
+
+            task.add_done_callback(_done)
+        else:
+            self._coalesced_count += 1
+        entry[1] += 1
+
+        result = await asyncio.shield(entry[0])
+        return copy.deepcopy(result) if entry[1] > 1 else result
+
+    async def _request_with_retry(
+        self,
+        method: str,
+        url: str,
+        **kwargs: Any
+    ) -> Dict[str, Any]:
+        """Send a request with retries and map the response to JSON or an exception."""
+        if kwargs.get("json") is not None:
+            kwargs["content"] = self._json_codec.dumps(kwargs.pop("json"))
+        cache_key: Optional[CacheKey] = None
+        cached: Optional[CachedResponse] = None
+        if self._conditional_cache is not None and method == "GET":
+            cache_key = request_key(url, kwargs.get("params"))
+            cached, conditional_headers = self._conditional_cache.validators(cache_key)
+            if conditional_headers:
+                kwargs["headers"] = {**(kwargs.get("headers") or {}), **conditional_headers}
         last_exception: Optional[Exception] = None
 
         for attempt in range(self._max_retries):
             try:
-                response = await self._client.request(method, url, **kwargs)
+                if self._hedging is not None and method == "GET":
+                    response = await self._send_hedged(url, **kwargs)
+                else:
+                    response = await self._send(method, url, **kwargs)
+                retry_after = self._rate_limiter.update(response.status_code, response.headers)
 
                 # Handle response based on status code
-                if response.status_code in (200, 201):
-                    if response.text.strip():
-                        return response.json()
-                    return {}
+                if response.status_code == 304 and cached is not None:
+                    self._conditional_cache.record(True)
+                    return self._decode(cached.content)
+                elif response.status_code in (200, 201):
+                    if cache_key is not None and response.status_code == 200:
+                        self._conditional_cache.record(False)
+                        self._conditional_cache.store(cache_key, response.content, response.headers)
+                    return self._decode(response.content)
                 elif response.status_code == 204:
                     return {}
                 elif response.status_code == 401:
@@ -858,7 +1327,7 @@ class AsyncCollibraConnector:
                     raise NotFoundError(f"Not found: {response.text}")
                 elif response.status_code >= 500:
                     if attempt < self._max_retries - 1:
-                        delay = self._retry_delay * (2 ** attempt)
+                        delay = retry_after if retry_after is not None else self._retry_delay * (2 ** attempt)
                         self.logger.warning(
                             f"Server error {response.status_code}, "
                             f"retrying in {delay:.1f}s"
@@ -868,7 +1337,7 @@ class AsyncCollibraConnector:
                     raise ServerError(f"Server error: {response.text}")
                 elif response.status_code == 429:
                     if attempt < self._max_retries - 1:
-                        delay = self._retry_delay * (2 ** attempt)
+                        delay = retry_after if retry_after is not None else self._retry_delay * (2 ** attempt)
                         self.logger.warning(
                             f"Rate limited, retrying in {delay:.1f}s"
                         )
@@ -895,6 +1364,170 @@ class AsyncCollibraConnector:
             raise last_exception
         raise Exception("Request failed after all retries")
 
+    def _decode(self, content: bytes) -> Dict[str, Any]:
+        """Decode a response body with the connector's codec ({} when empty)."""
+        if content and not content.isspace():
+            return self._json_codec.loads(content)
+        return {}
+
+    @asynccontextmanager
+    async def _stream(self, method: str, endpoint: str, **kwargs: Any) -> AsyncIterator["httpx.Response"]:
+        """
+        Open a streaming request whose body is read incrementally by the caller.
+
+        Goes through the same circuit breaker, rate limiter and session handling
+        as _request, but is not retried since the body is consumed as it arrives.
+        A 401 with session auth re-establishes the session and replays the request
+        once, before any of the body reaches the caller.
+
+        Raises:
+            CircuitOpenError: If the endpoint's circuit breaker is open.
+            CollibraAPIError: If the response status is an error.
+        """
+        if not self._client:
+            raise RuntimeError(
+                "Client not initialized. Use 'async with' context manager."
+            )
+
+        url = f"{self._api}{endpoint}"
+        token = await self._get_session_token() if self._session_auth else None
+        breaker = self._circuit_breakers.for_url(url) if self._circuit_breakers else None
+
+        for renewed in (False, True):
+            request_kwargs = self._with_session(method, token, kwargs) if token is not None else kwargs
+            if breaker is not None:
+                breaker.before_request()
+            await self._rate_limiter.acquire_async()
+
+            try:
+                async with self._client.stream(method, url, **request_kwargs) as response:
+                    if breaker is not None:
+                        breaker.record_response(response.status_code)
+                    self._rate_limiter.update(response.status_code, response.headers)
+                    if response.status_code != 401 or token is None or renewed:
+                        if response.status_code >= 400:
+                            await response.aread()
+                            self._raise_for_status(response)
+                        yield response
+                        return
+            except (httpx.ConnectError, httpx.TimeoutException):
+                if breaker is not None:
+                    breaker.record_failure()
+                raise
+            token = await self._get_session_token(stale=token)
+
+    @staticmethod
+    def _raise_for_status(response: "httpx.Response") -> None:
+        """Raise the connector exception matching an error response."""
+        if response.status_code == 401:
+            raise UnauthorizedError(f"Unauthorized: {response.text}")
+        if response.status_code == 403:
+            raise ForbiddenError(f"Forbidden: {response.text}")
+        if response.status_code == 404:
+            raise NotFoundError(f"Not found: {response.text}")
+        if response.status_code >= 500:
+            raise ServerError(f"Server error: {response.text}")
+        raise Exception(f"Unexpected status {response.status_code}: {response.text}")
+
+    async def _send(self, method: str, url: str, **kwargs: Any) -> "httpx.Response":
+        """
+        Send a single HTTP request, attaching the session when session_auth is enabled.
+
+        A 401 with session auth re-establishes the session and replays the request once.
+        """
+        if not self._session_auth:
+            return await self._transmit(method, url, **kwargs)
+
+        token = await self._get_session_token()
+        response = await self._transmit(method, url, **self._with_session(method, token, kwargs))
+        if response.status_code == 401:
+            token = await self._get_session_token(stale=token)
+            response = await self._transmit(method, url, **self._with_session(method, token, kwargs))
+        return response
+
+    @staticmethod
+    def _with_session(method: str, token: SessionToken, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Return request kwargs with the session cookie and CSRF headers added."""
+        headers = dict(kwargs.get("headers") or {})
+        apply_session(headers, method, token)
+        return {**kwargs, "headers": headers}
+
+    async def _transmit(self, method: str, url: str, **kwargs: Any) -> "httpx.Response":
+        """
+        Send a single HTTP request through the circuit breaker and the rate and
+        concurrency limiters.
+
+        The outcome (status code or transport error, and latency) is reported to
+        the endpoint's circuit breaker and to the adaptive concurrency limiter
+        when they are enabled.
+
+        Raises:
+            CircuitOpenError: If the endpoint's circuit breaker is open.
+        """
+        breaker = self._circuit_breakers.for_url(url) if self._circuit_breakers else None
+        if breaker is not None:
+            breaker.before_request()
+
+        await self._rate_limiter.acquire_async()
+        limiter = self._concurrency_limiter
+        if limiter is not None:
+            await limiter.acquire()
+        start = time.monotonic()
+        try:
+            response = await self._client.request(method, url, **kwargs)
+        except (httpx.ConnectError, httpx.TimeoutException):
+            if breaker is not None:
+                breaker.record_failure()
+            if limiter is not None:
+                limiter.record(time.monotonic() - start, error=True)
+            raise
+        finally:
+            if limiter is not None:
+                limiter.release()
+
+        if breaker is not None:
+            breaker.record_response(response.status_code)
+        if limiter is not None:
+            limiter.record(time.monotonic() - start, response.status_code)
+        return response
+
+    async def _send_hedged(self, url: str, **kwargs: Any) -> "httpx.Response":
+        """
+        Send a GET and, if it is slower than the endpoint's hedge delay, a backup copy.
+
+        The first successful response wins and the other request is cancelled.
+        If one of the two fails, the other one is awaited instead.
+        """
+        policy = self._hedging
+        family = endpoint_family(url)
+        policy.on_request()
+        start = time.monotonic()
+        primary = asyncio.ensure_future(self._send("GET", url, **kwargs))
+        tasks = {primary}
+        try:
+            delay = policy.hedge_delay(family)
+            if delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done and policy.try_hedge():
+                    self.logger.debug(f"Hedging GET {url} after {delay:.3f}s")
+                    tasks.add(asyncio.ensure_future(self._send("GET", url, **kwargs)))
+
+            error: Optional[BaseException] = None
+            while tasks:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary:
+                            policy.on_hedge_win()
+                        policy.record(family, time.monotonic() - start)
+                        return task.result()
+                    if error is None or task is primary:
+                        error = task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+
     async def test_connection(self) -> bool:
         """Test the connection to Collibra."""
         try:
@@ -907,7 +1540,7 @@ class AsyncCollibraConnector:
     async def gather_with_concurrency(
         self,
         coros: List[Any],
-        max_concurrent: int = 50
+        max_concurrent: Optional[int] = None
     ) -> List[Any]:
         """
         Execute coroutines with limited concurrency.
@@ -916,12 +1549,34 @@ class AsyncCollibraConnector:
 
         Args:
             coros: List of coroutines to execute.
-            max_concurrent: Maximum concurrent executions.
+            max_concurrent: Maximum concurrent executions. Defaults to the adaptive
+                limiter's max_limit when adaptive_concurrency is enabled (requests
+                are then also bounded by the adaptive limit), otherwise 50.
 
         Returns:
             List of results.
         """
-        semaphore = asyncio.Semaphore(max_concurrent)
+        return await self._gather_limited(coros, max_concurrent, default=50)
+
+    async def _gather_limited(
+        self,
+        coros: List[Any],
+        max_concurrent: Optional[int],
+        default: int
+    ) -> List[Any]:
+        """
+        Gather coroutines under an explicit or adaptive concurrency limit.
+
+        An explicit max_concurrent always wins. Otherwise the adaptive limiter,
+        which gates every HTTP request in _send, tunes parallelism, and at most
+        its max_limit coroutines run at once, so large batches never start every
+        item together; without it the method-specific default is used.
+        """
+        limiter = self._concurrency_limiter
+        if max_concurrent is None and limiter is not None:
+            max_concurrent = limiter.max_limit
+
+        semaphore = asyncio.Semaphore(max_concurrent or default)
 
         async def limited(coro: Any) -> Any:
             async with semaphore:
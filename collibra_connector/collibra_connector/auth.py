@@ -0,0 +1,217 @@
+"""
+Session-cookie authentication for the Collibra API.
+
+By default every request carries Basic credentials, which makes Collibra
+re-authenticate (often against LDAP/SSO) on each call. With session
+authentication a session is created once via ``POST /auth/sessions`` and its
+cookie and CSRF token are reused by every request of the connector. When the
+session expires (401), it is re-established once and the request is replayed.
+
+Example:
+    >>> from collibra_connector import CollibraConnector
+    >>>
+    >>> conn = CollibraConnector(api="...", username="...", password="...", session_auth=True)
+    >>> conn.asset.get_asset("uuid")  # Logs in on first use, then reuses the cookie
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Any, Callable, Mapping, MutableMapping, NamedTuple, Optional, Tuple
+
+import requests
+from requests.auth import AuthBase
+
+from .api.Exceptions import UnauthorizedError
+
+CSRF_HEADER = "X-CSRF-TOKEN"
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+logger = logging.getLogger(__name__)
+
+
+class SessionToken(NamedTuple):
+    """An established Collibra session."""
+
+    cookie: str
+    csrf_token: Optional[str]
+    generation: int
+
+
+def login_payload(username: str, password: str) -> dict:
+    """Return the JSON body for ``POST /auth/sessions``."""
+    return {"username": username, "password": password}
+
+
+def parse_session_response(
+    status_code: int,
+    cookies: Mapping[str, str],
+    body: Any,
+    headers: Mapping[str, str]
+) -> Tuple[str, Optional[str]]:
+    """
+    Extract the session cookie header and CSRF token from a login response.
+
+    Args:
+        status_code: HTTP status code of the login response.
+        cookies: Cookies set by the response.
+        body: Decoded JSON body (may be None).
+        headers: Response headers.
+
+    Returns:
+        Tuple of (Cookie header value, CSRF token or None).
+
+    Raises:
+        UnauthorizedError: If the login was rejected or returned no cookie.
+    """
+    if status_code not in (200, 201):
+        raise UnauthorizedError(f"Session login failed with status {status_code}")
+    cookie = "; ".join(f"{name}={value}" for name, value in cookies.items())
+    if not cookie:
+        raise UnauthorizedError("Session login did not return a session cookie")
+    csrf_token = body.get("csrfToken") if isinstance(body, dict) else None
+    return cookie, csrf_token or headers.get(CSRF_HEADER)
+
+
+def apply_session(headers: MutableMapping[str, str], method: str, token: SessionToken) -> None:
+    """Add the session cookie, and the CSRF token for unsafe methods, to request headers."""
+    headers["Cookie"] = token.cookie
+    if token.csrf_token and method.upper() not in SAFE_METHODS:
+        headers[CSRF_HEADER] = token.csrf_token
+
+
+class _FixedSession(AuthBase):
+    """Apply a given session (or none) in place of the session's own SessionAuth."""
+
+    def __init__(self, token: Optional[SessionToken] = None) -> None:
+        self._token = token
+
+    def __call__(self, r: requests.PreparedRequest) -> requests.PreparedRequest:
+        if self._token is not None:
+            apply_session(r.headers, r.method or "GET", self._token)
+        return r
+
+
+class SessionAuth(AuthBase):
+    """
+    Thread-safe session-cookie auth for ``requests``.
+
+    One session is shared by every thread of a connector. Only one thread logs
+    in (or re-authenticates after a 401) at a time; the others reuse its token.
+    Login and logout requests go through ``session`` when given, so they reuse
+    the connector's pooled, keep-alive connections.
+
+    Example:
+        >>> auth = SessionAuth("https://x.collibra.com/rest/2.0", "user", "pass")
+        >>> requests.get(url, auth=auth)
+    """
+
+    def __init__(
+        self,
+        api: str,
+        username: str,
+        password: str,
+        timeout: float = 30,
+        session: Optional[Callable[[], requests.Session]] = None
+    ) -> None:
+        """
+        Initialize session auth.
+
+        Args:
+            api: Full API URL including the REST version path.
+            username: The username for authentication.
+            password: The password for authentication.
+            timeout: Timeout for login and logout requests in seconds.
+            session: Returns the requests.Session to log in and out with (default: a one-off connection).
+        """
+        self._api = api
+        self._session = session
+        self._username = username
+        self._password = password
+        self._timeout = timeout
+        self._token: Optional[SessionToken] = None
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @property
+    def token(self) -> Optional[SessionToken]:
+        """Get the current session (None until the first request)."""
+        return self._token
+
+    def _http(self) -> Any:
+        """Return the session to send login and logout requests with, or the requests module."""
+        return self._session() if self._session is not None else requests
+
+    def login(self) -> SessionToken:
+        """Create a new session and make it current."""
+        response = self._http().post(
+            f"{self._api}/auth/sessions",
+            json=login_payload(self._username, self._password),
+            timeout=self._timeout,
+            auth=_FixedSession()
+        )
+        try:
+            body = response.json()
+        except ValueError:
+            body = None
+        cookie, csrf_token = parse_session_response(
+            response.status_code, response.cookies.get_dict(), body, response.headers
+        )
+        self._generation += 1
+        self._token = SessionToken(cookie, csrf_token, self._generation)
+        logger.debug("Established Collibra session")
+        return self._token
+
+    def get_token(self, stale: Optional[SessionToken] = None) -> SessionToken:
+        """
+        Return a valid session, logging in if there is none or it matches ``stale``.
+
+        Args:
+            stale: A token that was rejected; ignored if another thread already replaced it.
+        """
+        token = self._token
+        if token is not None and (stale is None or token.generation != stale.generation):
+            return token
+        with self._lock:
+            token = self._token
+            if token is None or (stale is not None and token.generation == stale.generation):
+                token = self.login()
+            return token
+
+    def logout(self) -> None:
+        """End the current session (best effort)."""
+        with self._lock:
+            token, self._token = self._token, None
+        if token is None:
+            return
+        try:
+            self._http().delete(
+                f"{self._api}/auth/sessions/current",
+                timeout=self._timeout,
+                auth=_FixedSession(token)
+            )
+        except requests.RequestException as e:
+            logger.debug(f"Session logout failed: {e}")
+
+    def __call__(self, r: requests.PreparedRequest) -> requests.PreparedRequest:
+        token = self.get_token()
+        apply_session(r.headers, r.method or "GET", token)
+
+        def handle_401(response: requests.Response, **kwargs: Any) -> requests.Response:
+            """Re-authenticate once and replay the request when the session expired."""
+            if response.status_code != 401:
+                return response
+            new_token = self.get_token(stale=token)
+            # Release the connection before replaying on it
+            response.content
+            response.close()
+            prepared = response.request.copy()
+            prepared.deregister_hook("response", handle_401)
+            apply_session(prepared.headers, prepared.method or "GET", new_token)
+            replay = response.connection.send(prepared, **kwargs)
+            replay.history.append(response)
+            replay.request = prepared
+            return replay
+
+        r.register_hook("response", handle_401)
+        return r
@@ -0,0 +1,718 @@
+"""
+HTTP response caches shared by the sync and async connectors.
+
+This module provides:
+- ConditionalGetCache: bounded LRU of GET responses revalidated with
+  If-None-Match / If-Modified-Since, so unchanged resources cost a 304
+- ResponseCache: persistent SQLite cache of read responses with per-endpoint
+  TTLs, shared across processes (CLI runs, cron jobs)
+- EntityCache: LRU of assets, domains, communities and users, kept coherent
+  with the connector's own writes
+- NegativeCache: short-lived record of lookups that returned 404 Not Found
+
+The in-memory caches hold their lock only for bookkeeping (copies are made
+outside it), so an instance can be shared by every thread and coroutine of a
+connector. ResponseCache serializes its SQLite connection with a lock and does
+disk I/O while holding it; the async connector calls it from the default
+executor so the event loop never waits on it. Entries of ResponseCache and
+NegativeCache are scoped by cache_identity(), since Collibra filters responses
+by the caller's permissions.
+
+Example:
+    >>> from collibra_connector import CollibraConnector
+    >>>
+    >>> conn = CollibraConnector(api="...", username="...", password="...", conditional_cache=True)
+    >>> conn.asset.get_asset("uuid")  # 200, stored with its ETag
+    >>> conn.asset.get_asset("uuid")  # 304 from the server, body served from the cache
+    >>> print(conn.conditional_cache.stats())
+"""
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Tuple
+
+from .resilience import endpoint_family
+
+CacheKey = Tuple[str, str]
+
+# Describe the transfer, not the stored (already decoded) body
+_TRANSFER_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+def request_key(url: str, params: Any = None) -> CacheKey:
+    """
+    Build a cache key from a URL and query parameters.
+
+    Parameter order does not matter: ``{"a": 1, "b": 2}`` and ``{"b": 2, "a": 1}``
+    produce the same key.
+    """
+    return (url, json.dumps(params, sort_keys=True, default=str))
+
+
+def _stored_headers(headers: Mapping[str, str]) -> Dict[str, str]:
+    """Drop headers that describe the original transfer rather than the body."""
+    return {name: value for name, value in headers.items() if str(name).lower() not in _TRANSFER_HEADERS}
+
+
+def default_cache_dir() -> str:
+    """
+    Return the directory for on-disk caches.
+
+    Uses ``$COLLIBRA_CACHE_DIR``, then ``$XDG_CACHE_HOME/collibra_connector``,
+    then ``~/.cache/collibra_connector``.
+    """
+    return os.environ.get("COLLIBRA_CACHE_DIR") or os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+        "collibra_connector"
+    )
+
+
+def default_cache_path() -> str:
+    """Return the default ResponseCache file inside default_cache_dir()."""
+    return os.path.join(default_cache_dir(), "responses.sqlite3")
+
+
+def cache_identity(api: str, username: str) -> str:
+    """
+    Return a fingerprint of the caller that scopes shared on-disk cache entries.
+
+    Collibra filters responses by the caller's permissions, so entries written
+    for one user of an instance must never be served to another.
+    """
+    return hashlib.sha256(f"{api.rstrip('/')}\n{username}".encode("utf-8")).hexdigest()
+
+
+def read_json_file(path: str) -> Optional[Any]:
+    """Read a JSON document, returning None if the file is missing or unreadable."""
+    try:
+        with open(path, encoding="utf-8") as handle:
+            return json.load(handle)
+    except (OSError, ValueError):
+        return None
+
+
+def write_json_file(path: str, document: Any) -> None:
+    """
+    Atomically write a JSON document, creating parent directories.
+
+    The document is written to a temporary file in the same directory and
+    renamed over ``path``, so readers never see a partial file.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".json")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(document, handle)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class CachedResponse(NamedTuple):
+    """A stored response body with its validators."""
+
+    content: bytes
+    headers: Dict[str, str]
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+
+class ConditionalGetCache:
+    """
+    Bounded LRU cache of GET responses revalidated with ETag / Last-Modified.
+
+    Only responses that carry an ``ETag`` or ``Last-Modified`` header are stored.
+    On the next GET of the same URL and params, the connector sends
+    ``If-None-Match`` / ``If-Modified-Since``; a ``304 Not Modified`` is then
+    answered from the stored body.
+
+    Example:
+        >>> cache = ConditionalGetCache(max_entries=2048, max_bytes=128 * 1024 * 1024)
+        >>> conn = CollibraConnector(api="...", username="...", password="...", conditional_cache=cache)
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of stored responses.
+            max_bytes: Maximum total size of stored bodies.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries: "OrderedDict[CacheKey, CachedResponse]" = OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: CacheKey) -> Optional[CachedResponse]:
+        """Get a stored response and mark it as recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def validators(self, key: CacheKey) -> Tuple[Optional[CachedResponse], Dict[str, str]]:
+        """
+        Get the stored response and the conditional headers to revalidate it.
+
+        Returns:
+            Tuple of (entry or None, headers to add to the request).
+        """
+        entry = self.get(key)
+        headers: Dict[str, str] = {}
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+        return entry, headers
+
+    def store(self, key: CacheKey, content: bytes, headers: Mapping[str, str]) -> bool:
+        """
+        Store a 200 response if it carries validators and fits in the cache.
+
+        Returns:
+            True if the response was stored.
+        """
+        normalized = {str(name).lower(): value for name, value in headers.items()}
+        etag = normalized.get("etag")
+        last_modified = normalized.get("last-modified")
+        if not etag and not last_modified:
+            return False
+        if "no-store" in normalized.get("cache-control", "").lower():
+            return False
+        if len(content) > self._max_bytes:
+            return False
+
+        entry = CachedResponse(content, _stored_headers(headers), etag, last_modified)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous.content)
+            self._entries[key] = entry
+            self._size += len(content)
+            while len(self._entries) > self._max_entries or self._size > self._max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.content)
+        return True
+
+    def record(self, revalidated: bool) -> None:
+        """Count a conditional request as a hit (304) or a miss."""
+        with self._lock:
+            if revalidated:
+                self._hits += 1
+            else:
+                self._misses += 1
+
+    def invalidate(self, url_prefix: Optional[str] = None) -> int:
+        """
+        Remove stored responses.
+
+        Args:
+            url_prefix: Only remove URLs starting with this prefix (None removes all).
+
+        Returns:
+            Number of entries removed.
+        """
+        with self._lock:
+            if url_prefix is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                self._size = 0
+                return removed
+            keys = [key for key in self._entries if key[0].startswith(url_prefix)]
+            for key in keys:
+                self._size -= len(self._entries.pop(key).content)
+            return len(keys)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache metrics."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+    def __repr__(self) -> str:
+        return f"ConditionalGetCache(entries={len(self._entries)}, max_entries={self._max_entries})"
+
+
+class ResponseCache:
+    """
+    Persistent SQLite cache of read responses.
+
+    Entries are keyed by caller identity, method, URL, params and body, so a
+    file shared by several users never serves one user's permission-filtered
+    responses to another. They expire after a TTL chosen per endpoint family (``/assetTypes``, ``/search``, ...). Metadata
+    families default to one hour, everything else to ``ttl``. The file is
+    shared safely by threads and by concurrent processes, so short-lived CLI
+    invocations and cron jobs start warm. When the total body size exceeds
+    ``max_bytes``, the least recently used entries are evicted. Recency is
+    recorded at most once per ``ACCESS_RESOLUTION`` seconds per entry, so hits
+    are plain reads.
+
+    Example:
+        >>> cache = ResponseCache(ttl=120, ttls={"/search": 30, "/users": 0})  # 0 disables
+        >>> conn = CollibraConnector(api="...", username="...", password="...", response_cache=cache)
+        >>> cache.invalidate(family="/assetTypes")
+    """
+
+    DEFAULT_TTLS: Dict[str, float] = {
+        "/assetTypes": 3600.0,
+        "/attributeTypes": 3600.0,
+        "/complexRelationTypes": 3600.0,
+        "/domainTypes": 3600.0,
+        "/relationTypes": 3600.0,
+        "/roles": 3600.0,
+        "/statuses": 3600.0,
+    }
+
+    # Families whose responses embed data owned by the family that was written
+    RELATED_FAMILIES: Dict[str, Tuple[str, ...]] = {
+        "/assets": ("/attributes", "/relations", "/responsibilities", "/search", "/outputModule", "/navigation"),
+        "/attributes": ("/assets", "/search", "/outputModule", "/navigation"),
+        "/relations": ("/assets", "/complexRelations", "/search", "/outputModule", "/navigation"),
+        "/complexRelations": ("/assets", "/relations", "/search", "/outputModule"),
+        "/domains": ("/assets", "/search", "/outputModule", "/navigation"),
+        "/communities": ("/domains", "/assets", "/search", "/outputModule", "/navigation"),
+        "/responsibilities": ("/assets", "/search", "/outputModule"),
+        "/tags": ("/assets", "/search", "/outputModule"),
+    }
+
+    # Hits refresh an entry's LRU position at most this often (seconds), so reads rarely write
+    ACCESS_RESOLUTION = 60.0
+    # The running size total is recounted from the file after this many stores
+    RECOUNT_INTERVAL = 1000
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl: float = 300.0,
+        ttls: Optional[Dict[str, float]] = None,
+        max_bytes: int = 256 * 1024 * 1024
+    ) -> None:
+        """
+        Open (or create) the cache file.
+
+        Args:
+            path: SQLite file, or ":memory:". Defaults to default_cache_path().
+            ttl: Time to live in seconds for endpoint families without their own TTL.
+            ttls: TTL per endpoint family, merged over DEFAULT_TTLS. A TTL of 0 disables
+                caching for that family.
+            max_bytes: Maximum total size of stored bodies.
+        """
+        self._path = str(path) if path else default_cache_path()
+        if self._path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self._path)), exist_ok=True)
+        self._ttl = ttl
+        self._ttls = {**self.DEFAULT_TTLS, **(ttls or {})}
+        self._max_bytes = max_bytes
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self._path, timeout=30, isolation_level=None, check_same_thread=False)
+        with self._lock:
+            if self._path != ":memory:":
+                # Readers in other processes never block the writer
+                self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, url TEXT NOT NULL, family TEXT NOT NULL, "
+                "body BLOB NOT NULL, headers TEXT NOT NULL, size INTEGER NOT NULL, "
+                "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)")
+            self._recount()
+
+    @property
+    def path(self) -> str:
+        """Get the SQLite file path."""
+        return self._path
+
+    @staticmethod
+    def key(method: str, url: str, params: Any = None, body: Any = None, identity: Optional[str] = None) -> str:
+        """Build the cache key of a request made by ``identity`` (see cache_identity())."""
+        raw = json.dumps([identity, method.upper(), url, params, body], sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def ttl_for(self, url: str) -> float:
+        """Return the TTL in seconds for a URL's endpoint family."""
+        return self._ttls.get(endpoint_family(url), self._ttl)
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Get a fresh entry, or None if it is missing or expired."""
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT body, headers, expires_at, accessed_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or row[2] <= now:
+                if row is not None:
+                    self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._misses += 1
+                return None
+            if now - row[3] >= self.ACCESS_RESOLUTION:
+                self._db.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self._hits += 1
+        headers = json.loads(row[1])
+        return CachedResponse(bytes(row[0]), headers, None, None)
+
+    def set(
+        self,
+        key: str,
+        url: str,
+        content: bytes,
+        headers: Optional[Mapping[str, str]] = None,
+        ttl: Optional[float] = None
+    ) -> bool:
+        """
+        Store a response body.
+
+        Args:
+            key: Key from ResponseCache.key().
+            url: Request URL, used for the TTL and invalidation.
+            content: Raw response body.
+            headers: Response headers to replay.
+            ttl: Override the endpoint family's TTL.
+
+        Returns:
+            True if the response was stored.
+        """
+        ttl = self.ttl_for(url) if ttl is None else ttl
+        if ttl <= 0 or len(content) > self._max_bytes:
+            return False
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, url, family, body, headers, size, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key, url, endpoint_family(url), sqlite3.Binary(content),
+                    json.dumps(_stored_headers(headers or {})), len(content), now + ttl, now
+                )
+            )
+            self._total += len(content)
+            self._stores += 1
+            if self._total > self._max_bytes or self._stores >= self.RECOUNT_INTERVAL:
+                self._evict(now)
+        return True
+
+    def _recount(self) -> int:
+        """Recount the stored size from the file; must be called with the lock held."""
+        self._total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        self._stores = 0
+        return self._total
+
+    def _evict(self, now: float) -> None:
+        """
+        Drop expired entries, then least recently used ones, until within max_bytes.
+
+        Runs only when the running total (an overestimate, since replaced and deleted
+        entries are not subtracted) exceeds max_bytes, or every RECOUNT_INTERVAL stores
+        to account for other processes sharing the file.
+        """
+        if self._recount() <= self._max_bytes:
+            return
+        self._db.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+        total = self._recount()
+        if total <= self._max_bytes:
+            return
+        evict = []
+        for key, size in self._db.execute("SELECT key, size FROM responses ORDER BY accessed_at"):
+            if total <= self._max_bytes:
+                break
+            evict.append((key,))
+            total -= size
+        self._db.executemany("DELETE FROM responses WHERE key = ?", evict)
+        self._total = total
+
+    def invalidate(self, url_prefix: Optional[str] = None, family: Optional[str] = None) -> int:
+        """
+        Remove entries.
+
+        Args:
+            url_prefix: Only remove URLs starting with this prefix.
+            family: Only remove this endpoint family, e.g. "/assets".
+
+        Returns:
+            Number of entries removed (everything when no filter is given).
+        """
+        clauses, args = [], []
+        if url_prefix is not None:
+            clauses.append("substr(url, 1, ?) = ?")
+            args += [len(url_prefix), url_prefix]
+        if family is not None:
+            clauses.append("family = ?")
+            args.append(family)
+        where = " WHERE " + " AND ".join(clauses) if clauses else ""
+        with self._lock:
+            return self._db.execute(f"DELETE FROM responses{where}", args).rowcount
+
+    def invalidate_related(self, url: str) -> int:
+        """Remove the entries of the endpoint families a write to ``url`` may have changed."""
+        family = endpoint_family(url)
+        families = (family,) + self.RELATED_FAMILIES.get(family, ())
+        placeholders = ", ".join("?" for _ in families)
+        with self._lock:
+            return self._db.execute(f"DELETE FROM responses WHERE family IN ({placeholders})", families).rowcount
+
+    def purge_expired(self) -> int:
+        """Remove expired entries and return how many were removed."""
+        with self._lock:
+            return self._db.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),)).rowcount
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache metrics."""
+        with self._lock:
+            entries, size = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+            return {"entries": entries, "bytes": size, "hits": self._hits, "misses": self._misses}
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            self._db.close()
+
+    def __repr__(self) -> str:
+        return f"ResponseCache(path={self._path!r})"
+
+
+class NegativeCache:
+    """
+    Bounded cache of lookups that returned 404 Not Found.
+
+    Repeated lookups of ids that no longer exist fail fast with NotFoundError
+    instead of reaching the server, until the short TTL expires. Entries are
+    scoped by caller identity (see cache_identity()), since Collibra answers 404
+    for resources the caller may not see. Writes made through the connector clear
+    the entries of their endpoint family for every caller, since they may create
+    what was missing. One instance can be shared by sync and async connectors.
+
+    Example:
+        >>> misses = NegativeCache(ttl=30)
+        >>> conn = CollibraConnector(api="...", username="...", password="...", negative_cache=misses)
+        >>> async_conn = AsyncCollibraConnector(api="...", username="...", password="...", negative_cache=misses)
+    """
+
+    def __init__(self, ttl: float = 60.0, max_entries: int = 10000) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds a 404 is remembered.
+            max_entries: Maximum number of remembered lookups.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self._ttl = ttl
+        self._max_entries = max_entries
+        # (identity, url, params) -> (expires_at, family), oldest first
+        self._entries: "OrderedDict[Tuple[Optional[str], str, str], Tuple[float, str]]" = OrderedDict()
+        # Family -> keys of its entries, so a write clears one bucket
+        self._families: Dict[str, set] = {}
+        self._hits = 0
+        self._lock = threading.Lock()
+
+    def hit(self, key: CacheKey, identity: Optional[str] = None) -> bool:
+        """Check whether a lookup made by ``identity`` is known to return 404."""
+        entry_key = (identity,) + key
+        with self._lock:
+            entry = self._entries.get(entry_key)
+            if entry is None:
+                return False
+            if entry[0] <= time.monotonic():
+                self._remove(entry_key)
+                return False
+            self._hits += 1
+            return True
+
+    def add(self, key: CacheKey, identity: Optional[str] = None) -> None:
+        """Remember that a lookup made by ``identity`` returned 404."""
+        entry_key = (identity,) + key
+        family = endpoint_family(key[0])
+        with self._lock:
+            self._entries[entry_key] = (time.monotonic() + self._ttl, family)
+            self._entries.move_to_end(entry_key)
+            self._families.setdefault(family, set()).add(entry_key)
+            while len(self._entries) > self._max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, entry_key: Tuple[Optional[str], str, str]) -> None:
+        """Drop one entry and its family index; must be called with the lock held."""
+        _, family = self._entries.pop(entry_key)
+        keys = self._families[family]
+        keys.discard(entry_key)
+        if not keys:
+            del self._families[family]
+
+    def invalidate(self, url: Optional[str] = None) -> int:
+        """
+        Forget remembered 404s of every caller.
+
+        Args:
+            url: Only forget lookups in this URL's endpoint family (None forgets all).
+
+        Returns:
+            Number of entries removed.
+        """
+        with self._lock:
+            if url is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                self._families.clear()
+                return removed
+            keys = self._families.pop(endpoint_family(url), ())
+            for entry_key in keys:
+                del self._entries[entry_key]
+            return len(keys)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache metrics."""
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self._hits}
+
+    def __repr__(self) -> str:
+        return f"NegativeCache(entries={len(self._entries)}, ttl={self._ttl})"
+
+
+class EntityCache:
+    """
+    In-process LRU cache of single entities (assets, domains, communities, users).
+
+    Entries are keyed by kind and id. Writes made through the same connector
+    keep the cache coherent: the written entity is replaced by the write's
+    response (or dropped on removal), and cached entities that embed a reference
+    to it (an asset's domain, a domain's community) are dropped too, so renamed
+    parents are never served stale. A read that started before a write is not
+    stored once the write completes.
+
+    Entities are returned as copies, so callers may modify them freely.
+
+    Example:
+        >>> conn = CollibraConnector(api="...", username="...", password="...", entity_cache=True)
+        >>> conn.domain.get_domain(domain_id)  # Fetched once...
+        >>> conn.domain.get_domain(domain_id)  # ...then served from memory
+        >>> conn.domain.change_domain(domain_id, name="Sales")  # Cache updated with the result
+    """
+
+    def __init__(self, max_entries: int = 4096, ttl: Optional[float] = 300.0) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached entities.
+            ttl: Seconds an entity is served before being fetched again, bounding
+                staleness from other clients' writes. None keeps entries until evicted.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    @property
+    def generation(self) -> int:
+        """Get the write counter; pass it to put() to discard reads that raced a write."""
+        return self._generation
+
+    def get(self, kind: str, entity_id: str) -> Optional[Dict[str, Any]]:
+        """Get a copy of a cached entity, or None."""
+        key = (kind, entity_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._ttl is not None and time.monotonic() - entry[0] > self._ttl:
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+        return copy.deepcopy(entry[1])
+
+    def put(self, kind: str, entity_id: str, entity: Dict[str, Any], generation: Optional[int] = None) -> bool:
+        """
+        Store an entity.
+
+        Args:
+            kind: Entity kind, e.g. "asset".
+            entity_id: The entity's id.
+            entity: The entity as returned by the API.
+            generation: The generation read before the entity was fetched. If a write
+                happened since, the entity may be stale and is not stored.
+
+        Returns:
+            True if the entity was stored.
+        """
+        entity = copy.deepcopy(entity)
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return False
+            key = (kind, entity_id)
+            self._entries[key] = (time.monotonic(), entity)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return True
+
+    def invalidate(self, kind: Optional[str] = None, entity_id: Optional[str] = None) -> int:
+        """
+        Drop an entity and every cached entity that references it.
+
+        Args:
+            kind: Entity kind; with entity_id None, drops every entity of this kind.
+            entity_id: The entity's id.
+
+        Returns:
+            Number of entries removed (everything when no argument is given).
+        """
+        with self._lock:
+            self._generation += 1
+            if entity_id is None:
+                keys = [key for key in self._entries if kind is None or key[0] == kind]
+            else:
+                keys = [
+                    key for key, (_, entity) in self._entries.items()
+                    if key == (kind, entity_id) or _references(entity, entity_id)
+                ]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache metrics."""
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self._hits, "misses": self._misses}
+
+    def __repr__(self) -> str:
+        return f"EntityCache(entries={len(self._entries)}, max_entries={self._max_entries})"
+
+
+def _references(entity: Dict[str, Any], entity_id: str) -> bool:
+    """Check whether an entity embeds a reference (``{"id": ...}``) to another entity."""
+    return any(isinstance(value, dict) and value.get("id") == entity_id for value in entity.values())
@@ -10,6 +10,7 @@ Installation:
 Usage:
     collibra-sdk --help
     collibra-sdk search "Business Term" --format json
+    collibra-sdk --no-cache list-asset-types
     collibra-sdk export-domain --id "uuid" --output report.csv
     collibra-sdk get-asset --id "uuid"
 """
@@ -31,8 +32,13 @@ if CLICK_AVAILABLE:
     from click import Context, echo, style, secho
 
 
-def get_connector():
-    """Create connector from environment variables."""
+def get_connector(cached: bool = False):
+    """
+    Create connector from environment variables.
+
+    With cached=True, read responses go through the persistent response cache
+    when caching was enabled with ``--cache`` (or COLLIBRA_CACHE=1).
+    """
     from .connector import CollibraConnector
 
     api = os.environ.get("COLLIBRA_URL")
@@ -47,7 +53,9 @@ def get_connector():
             "  COLLIBRA_PASSWORD=your-password"
         )
 
-    return CollibraConnector(api=api, username=username, password=password)
+    ctx = click.get_current_context(silent=True)
+    use_cache = cached and ctx is not None and (ctx.find_root().obj or {}).get("cache", False)
+    return CollibraConnector(api=api, username=username, password=password, response_cache=use_cache)
 
 
 def format_output(data: Any, fmt: str) -> str:
@@ -76,11 +84,29 @@ def format_output(data: Any, fmt: str) -> str:
         return str(data)
 
 
+def _export_incremental(conn: Any, output_file: str, limit: Optional[int], **kwargs: Any) -> None:
+    """Run an incremental export for export-domain/export-community and report the outcome."""
+    from .helpers import IncrementalExporter
+
+    if limit is not None:
+        raise click.ClickException("--limit cannot be combined with --incremental")
+    result = IncrementalExporter(conn).export(output_file, **kwargs)
+    if result.full:
+        secho(f"Exported {result.updated} assets to {output_file}", fg="green")
+    else:
+        secho(
+            f"Updated {result.updated} and removed {result.deleted} assets in {output_file}",
+            fg="green"
+        )
+
+
 if CLICK_AVAILABLE:
     @click.group()
     @click.version_option(version="1.1.0", prog_name="collibra-sdk")
+    @click.option("--cache/--no-cache", default=False, envvar="COLLIBRA_CACHE",
+                  help="Serve metadata and search reads from the on-disk cache (default: off)")
     @click.pass_context
-    def cli(ctx: Context) -> None:
+    def cli(ctx: Context, cache: bool) -> None:
         """
         Collibra SDK - Command line interface for Collibra Data Governance.
 
@@ -93,6 +119,7 @@ if CLICK_AVAILABLE:
           export COLLIBRA_PASSWORD=your-password
         """
         ctx.ensure_object(dict)
+        ctx.obj["cache"] = cache
 
     # ==========================================================================
     # Connection Commands
@@ -161,7 +188,7 @@ if CLICK_AVAILABLE:
           collibra-sdk search "Order" --type "Business Term"
         """
         try:
-            conn = get_connector()
+            conn = get_connector(cached=True)
 
             # Prepare filters
             type_ids = None
@@ -312,18 +339,25 @@ if CLICK_AVAILABLE:
     @cli.command("export-domain")
     @click.option("--id", "domain_id", required=True, help="Domain UUID")
     @click.option("--output", "-o", "output_file", required=True,
-                  help="Output file path (.csv or .json)")
+                  help="Output file path (.csv, .ndjson, .jsonl, .json, .parquet, .arrow or .xlsx)")
     @click.option("--include-attributes", is_flag=True, default=True,
                   help="Include asset attributes")
     @click.option("--include-relations", is_flag=True, default=False,
                   help="Include relation summaries")
-    @click.option("--limit", "-l", default=1000, help="Maximum assets to export")
+    @click.option("--limit", "-l", type=int, default=None,
+                  help="Maximum assets to export (default: all, or 1000 with --no-bulk)")
+    @click.option("--bulk/--no-bulk", default=True,
+                  help="Page through Output Module exports instead of per-asset requests")
+    @click.option("--incremental", is_flag=True, default=False,
+                  help="Only export changes since the previous run into the existing .csv/.ndjson file")
     def export_domain(
         domain_id: str,
         output_file: str,
         include_attributes: bool,
         include_relations: bool,
-        limit: int
+        limit: Optional[int],
+        bulk: bool,
+        incremental: bool
     ) -> None:
         """
         Export all assets in a domain to a file.
@@ -333,20 +367,54 @@ if CLICK_AVAILABLE:
           collibra-sdk export-domain --id "uuid" --output assets.csv
 
           collibra-sdk export-domain --id "uuid" --output data.json --include-relations
+
+          collibra-sdk export-domain --id "uuid" --output assets.ndjson
+
+          collibra-sdk export-domain --id "uuid" --output assets.parquet
+
+          collibra-sdk export-domain --id "uuid" --output assets.ndjson --incremental
         """
         try:
-            from .helpers import DataFrameExporter
+            from .helpers import (
+                ARROW_FORMATS, STREAMING_FORMATS, ArrowExporter, DataFrameExporter, StreamingExporter
+            )
 
             conn = get_connector()
-            exporter = DataFrameExporter(conn)
 
             echo(f"Exporting domain {domain_id}...")
 
+            if incremental:
+                _export_incremental(
+                    conn,
+                    output_file,
+                    limit,
+                    domain_id=domain_id,
+                    include_attributes=include_attributes,
+                    include_relations=include_relations
+                )
+                return
+
+            suffix = os.path.splitext(output_file)[1].lower()
+            if bulk and (suffix in STREAMING_FORMATS or suffix in ARROW_FORMATS):
+                # Rows are written page by page without pandas
+                exporter_class = ArrowExporter if suffix in ARROW_FORMATS else StreamingExporter
+                count = exporter_class(conn).export(
+                    output_file,
+                    domain_id=domain_id,
+                    limit=limit,
+                    include_attributes=include_attributes,
+                    include_relations=include_relations
+                )
+                secho(f"Exported {count} assets to {output_file}", fg="green")
+                return
+
+            exporter = DataFrameExporter(conn)
             df = exporter.assets_to_dataframe(
                 domain_id=domain_id,
-                limit=limit,
+                limit=limit if bulk or limit is not None else 1000,
                 include_attributes=include_attributes,
-                include_relations=include_relations
+                include_relations=include_relations,
+                bulk=bulk
             )
 
             if output_file.endswith(".csv"):
@@ -360,8 +428,8 @@ if CLICK_AVAILABLE:
 
             secho(f"Exported {len(df)} assets to {output_file}", fg="green")
 
-        except ImportError:
-            secho("Pandas is required for export. Install with: pip install pandas", fg="red")
+        except ImportError as e:
+            secho(str(e), fg="red")
             sys.exit(1)
         except Exception as e:
             secho(f"Error: {e}", fg="red")
@@ -370,14 +438,21 @@ if CLICK_AVAILABLE:
     @cli.command("export-community")
     @click.option("--id", "community_id", required=True, help="Community UUID")
     @click.option("--output", "-o", "output_file", required=True,
-                  help="Output file path")
+                  help="Output file path (.csv, .ndjson, .jsonl, .json, .parquet or .arrow)")
     @click.option("--include-attributes", is_flag=True, default=True)
-    @click.option("--limit", "-l", default=1000)
+    @click.option("--limit", "-l", type=int, default=None,
+                  help="Maximum assets to export (default: all, or 1000 with --no-bulk)")
+    @click.option("--bulk/--no-bulk", default=True,
+                  help="Page through Output Module exports instead of per-asset requests")
+    @click.option("--incremental", is_flag=True, default=False,
+                  help="Only export changes since the previous run into the existing .csv/.ndjson file")
     def export_community(
         community_id: str,
         output_file: str,
         include_attributes: bool,
-        limit: int
+        limit: Optional[int],
+        bulk: bool,
+        incremental: bool
     ) -> None:
         """
         Export all assets in a community to a file.
@@ -385,19 +460,46 @@ if CLICK_AVAILABLE:
         Examples:
 
           collibra-sdk export-community --id "uuid" --output assets.csv
+
+          collibra-sdk export-community --id "uuid" --output assets.ndjson --incremental
         """
         try:
-            from .helpers import DataFrameExporter
+            from .helpers import (
+                ARROW_FORMATS, STREAMING_FORMATS, ArrowExporter, DataFrameExporter, StreamingExporter
+            )
 
             conn = get_connector()
-            exporter = DataFrameExporter(conn)
 
             echo(f"Exporting community {community_id}...")
 
+            if incremental:
+                _export_incremental(
+                    conn,
+                    output_file,
+                    limit,
+                    community_id=community_id,
+                    include_attributes=include_attributes
+                )
+                return
+
+            suffix = os.path.splitext(output_file)[1].lower()
+            if bulk and (suffix in STREAMING_FORMATS or suffix in ARROW_FORMATS):
+                exporter_class = ArrowExporter if suffix in ARROW_FORMATS else StreamingExporter
+                count = exporter_class(conn).export(
+                    output_file,
+                    community_id=community_id,
+                    limit=limit,
+                    include_attributes=include_attributes
+                )
+                secho(f"Exported {count} assets to {output_file}", fg="green")
+                return
+
+            exporter = DataFrameExporter(conn)
             df = exporter.assets_to_dataframe(
                 community_id=community_id,
-                limit=limit,
-                include_attributes=include_attributes
+                limit=limit if bulk or limit is not None else 1000,
+                include_attributes=include_attributes,
+                bulk=bulk
             )
 
             if output_file.endswith(".csv"):
@@ -409,8 +511,8 @@ if CLICK_AVAILABLE:
 
             secho(f"Exported {len(df)} assets to {output_file}", fg="green")
 
-        except ImportError:
-            secho("Pandas required. Install with: pip install pandas", fg="red")
+        except ImportError as e:
+            secho(str(e), fg="red")
             sys.exit(1)
         except Exception as e:
             secho(f"Error: {e}", fg="red")
@@ -484,7 +586,7 @@ if CLICK_AVAILABLE:
     def list_asset_types(fmt: str, limit: int) -> None:
         """List all asset types."""
         try:
-            conn = get_connector()
+            conn = get_connector(cached=True)
             result = conn.metadata.get_asset_types()
 
             items = []
@@ -509,7 +611,7 @@ if CLICK_AVAILABLE:
     def list_statuses(fmt: str) -> None:
         """List all statuses."""
         try:
-            conn = get_connector()
+            conn = get_connector(cached=True)
             result = conn.metadata.get_statuses()
 
             items = []
@@ -526,6 +628,16 @@ if CLICK_AVAILABLE:
             secho(f"Error: {e}", fg="red")
             sys.exit(1)
 
+    @cli.command("cache-clear")
+    def cache_clear() -> None:
+        """Remove all responses from the on-disk cache."""
+        from .cache import ResponseCache
+
+        cache = ResponseCache()
+        removed = cache.invalidate()
+        cache.close()
+        secho(f"Removed {removed} cached responses from {cache.path}", fg="green")
+
     # ==========================================================================
     # Bulk Operations
     # ==========================================================================
@@ -0,0 +1,278 @@
+"""
+JSON codecs and response compression for the connectors.
+
+Large pages (``limit=1000`` on /assets or /relations) are multi-megabyte JSON
+documents, so both the transfer and the decoding matter:
+- Responses are requested compressed (gzip/deflate, and brotli when a brotli
+  decoder is installed).
+- Bodies are decoded and request payloads encoded by a pluggable JSONCodec.
+  orjson is used automatically when installed (``pip install orjson``).
+- JSONArrayStream splits a JSON document arriving in chunks into the raw
+  items of one array, so huge exports can be decoded row by row.
+
+Example:
+    >>> from collibra_connector import CollibraConnector, JSONCodec
+    >>>
+    >>> conn = CollibraConnector(api="...", username="...", password="...", json_codec="orjson")
+    >>>
+    >>> # Or plug in any codec with loads()/dumps()
+    >>> class MyCodec(JSONCodec):
+    ...     def loads(self, data): ...
+    ...     def dumps(self, obj): ...
+"""
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, List, Optional, Sequence, Tuple, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import brotli  # noqa: F401
+    BROTLI_AVAILABLE = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        BROTLI_AVAILABLE = True
+    except ImportError:
+        BROTLI_AVAILABLE = False
+
+
+def accept_encoding() -> str:
+    """Return the Accept-Encoding header value for the decoders installed."""
+    return "gzip, deflate, br" if BROTLI_AVAILABLE else "gzip, deflate"
+
+
+class JSONCodec:
+    """
+    Standard library JSON codec.
+
+    Subclass and override ``loads``/``dumps`` to plug in another implementation.
+    """
+
+    name: str = "json"
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Decode a JSON document. Raises ValueError on invalid input."""
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object as UTF-8 JSON bytes."""
+        return json.dumps(obj, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class OrjsonCodec(JSONCodec):
+    """JSON codec backed by orjson (several times faster than the standard library)."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        if not ORJSON_AVAILABLE:
+            raise ImportError(
+                "orjson is required for OrjsonCodec. "
+                "Install it with: pip install orjson"
+            )
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Decode a JSON document. Raises ValueError on invalid input."""
+        return orjson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object as UTF-8 JSON bytes."""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+
+def get_json_codec(codec: Union[str, JSONCodec, None] = None) -> JSONCodec:
+    """
+    Resolve a codec name or instance.
+
+    Args:
+        codec: A JSONCodec instance, "json", "orjson", or None/"auto" for the
+            fastest codec installed.
+
+    Returns:
+        The codec instance.
+
+    Raises:
+        ValueError: If the name is unknown.
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+    if codec is None or codec == "auto":
+        return OrjsonCodec() if ORJSON_AVAILABLE else JSONCodec()
+    if codec == "json":
+        return JSONCodec()
+    if codec == "orjson":
+        return OrjsonCodec()
+    raise ValueError(f"Unknown JSON codec: {codec!r}")
+
+
+_STRUCTURAL = re.compile(rb'["{}\[\],:]')
+_STRING_SPECIAL = re.compile(rb'["\\]')
+
+
+class JSONArrayStream:
+    """
+    Incrementally split a JSON document into the raw items of one array.
+
+    Feed the document in chunks of any size; each call returns the items
+    completed so far as bytes, ready for ``JSONCodec.loads``. Only the bytes of
+    the item being parsed are buffered, so memory stays bounded by the largest
+    item rather than the document.
+
+    The array is located by its object-key path, ignoring array nesting:
+    ``("view", "Asset")`` matches ``{"view": {"Asset": [...]}}``. With no path,
+    the first array in the document is used.
+
+    Example:
+        >>> stream = JSONArrayStream(path=("aaData",))
+        >>> for chunk in response.iter_content(65536):
+        ...     for raw in stream.feed(chunk):
+        ...         row = codec.loads(raw)
+        >>> stream.close()
+    """
+
+    def __init__(self, path: Optional[Sequence[str]] = None) -> None:
+        """
+        Initialize the stream.
+
+        Args:
+            path: Object keys leading to the array, or None for the first array.
+        """
+        self._path: Optional[Tuple[str, ...]] = tuple(path) if path is not None else None
+        self._buf = b""
+        self._pos = 0
+        self._stack: List[bytes] = []
+        self._keys: List[Optional[str]] = []
+        self._expect_key = False
+        self._in_string = False
+        self._string_start = 0
+        self._string_is_key = False
+        self._target_depth: Optional[int] = None
+        self._item_start = 0
+        self._done = False
+        self.count = 0
+
+    @property
+    def done(self) -> bool:
+        """Check whether the target array has been fully read."""
+        return self._done
+
+    def _current_path(self) -> Tuple[str, ...]:
+        return tuple(
+            key for container, key in zip(self._stack, self._keys)
+            if container == b"{" and key is not None
+        )
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        """
+        Add a chunk of the document.
+
+        Returns:
+            Raw bytes of every array item completed by this chunk.
+        """
+        if self._done or not chunk:
+            return []
+        items: List[bytes] = []
+        buf = self._buf + chunk
+        pos = self._pos
+
+        while True:
+            if self._in_string:
+                match = _STRING_SPECIAL.search(buf, pos)
+                if match is None:
+                    pos = len(buf)
+                    break
+                if match.group() == b"\\":
+                    if match.end() >= len(buf):
+                        # Escaped character not received yet
+                        pos = match.start()
+                        break
+                    pos = match.end() + 1
+                    continue
+                self._in_string = False
+                if self._string_is_key:
+                    self._keys[-1] = json.loads(b'"' + buf[self._string_start:match.start()] + b'"')
+                pos = match.end()
+                continue
+
+            match = _STRUCTURAL.search(buf, pos)
+            if match is None:
+                pos = len(buf)
+                break
+            char = match.group()
+            index = match.start()
+            pos = match.end()
+            in_target = self._target_depth is not None and len(self._stack) == self._target_depth
+
+            if char == b'"':
+                self._in_string = True
+                self._string_start = pos
+                self._string_is_key = bool(self._stack) and self._stack[-1] == b"{" and self._expect_key
+            elif char == b"{" or char == b"[":
+                self._stack.append(char)
+                self._keys.append(None)
+                self._expect_key = char == b"{"
+                if (
+                    self._target_depth is None
+                    and char == b"["
+                    and (self._path is None or self._current_path() == self._path)
+                ):
+                    self._target_depth = len(self._stack)
+                    self._item_start = pos
+            elif char == b"}" or char == b"]":
+                if in_target:
+                    item = buf[self._item_start:index].strip()
+                    if item:
+                        items.append(item)
+                    self._done = True
+                    break
+                self._stack.pop()
+                self._keys.pop()
+                self._expect_key = False
+            elif char == b",":
+                if in_target:
+                    items.append(buf[self._item_start:index].strip())
+                    self._item_start = pos
+                elif self._stack and self._stack[-1] == b"{":
+                    self._expect_key = True
+            else:
+                self._expect_key = False
+
+        # Keep only the bytes still needed: the current item or an open string
+        if self._done:
+            keep = len(buf)
+        elif self._target_depth is not None:
+            keep = self._item_start
+        elif self._in_string:
+            keep = self._string_start
+        else:
+            keep = pos
+        keep = min(keep, pos)
+        self._buf = buf[keep:]
+        self._pos = pos - keep
+        self._item_start -= keep
+        self._string_start -= keep
+        self.count += len(items)
+        return items
+
+    def close(self) -> None:
+        """
+        Finish the document.
+
+        Raises:
+            ValueError: If the target array was not found or was truncated.
+        """
+        if self._target_depth is None:
+            where = ".".join(self._path) if self._path else "any path"
+            raise ValueError(f"No JSON array found at {where}")
+        if not self._done:
+            raise ValueError("JSON document ended before the array was complete")
@@ -7,11 +7,16 @@ entry point for interacting with the Collibra Data Governance Center API.
 from __future__ import annotations
 
 import logging
+import threading
+from http import HTTPStatus
 import time
-from typing import Any, Dict, Optional, TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union, TYPE_CHECKING
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from requests.structures import CaseInsensitiveDict
 
 from .api import (
     Activity,
@@ -30,9 +35,24 @@ from .api import (
     Utils,
     Workflow,
 )
+from .auth import SessionAuth
+from .cache import (
+    CacheKey,
+    CachedResponse,
+    ConditionalGetCache,
+    EntityCache,
+    NegativeCache,
+    ResponseCache,
+    cache_identity,
+    request_key,
+)
+from .codec import JSONCodec, accept_encoding, get_json_codec
+from .helpers import RelationTypeRegistry
+from .resilience import CircuitBreakerRegistry, RateLimiter
 
 if TYPE_CHECKING:
     from requests.auth import AuthBase
+    from .helpers import ParallelResult
 
 
 class CollibraConnector:
@@ -75,6 +95,13 @@ class CollibraConnector:
     DEFAULT_MAX_RETRIES: int = 3
     DEFAULT_RETRY_DELAY: float = 1.0
     RETRYABLE_STATUS_CODES: tuple = (429, 500, 502, 503, 504)
+    # Methods that can be replayed safely after any transient failure
+    IDEMPOTENT_METHODS: frozenset = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+    # Statuses on which a non-idempotent request is replayed when the server sent Retry-After
+    REJECTED_STATUS_CODES: tuple = (429, 503)
+    DEFAULT_POOL_CONNECTIONS: int = 10
+    DEFAULT_POOL_MAXSIZE: int = 10
+    DEFAULT_WORKERS: int = 8
 
     def __init__(
         self,
@@ -84,6 +111,17 @@ class CollibraConnector:
         timeout: int = DEFAULT_TIMEOUT,
         max_retries: int = DEFAULT_MAX_RETRIES,
         retry_delay: float = DEFAULT_RETRY_DELAY,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        rate_limit: Optional[float] = None,
+        circuit_breaker: Union[bool, CircuitBreakerRegistry] = True,
+        session_auth: bool = False,
+        json_codec: Union[str, JSONCodec, None] = None,
+        conditional_cache: Union[bool, ConditionalGetCache] = False,
+        response_cache: Union[bool, str, ResponseCache] = False,
+        entity_cache: Union[bool, EntityCache] = False,
+        negative_cache: Union[bool, NegativeCache] = False,
         **kwargs: Any
     ) -> None:
         """
@@ -99,8 +137,42 @@ class CollibraConnector:
             timeout: Request timeout in seconds. Defaults to 30.
             max_retries: Maximum number of retry attempts for failed requests. Defaults to 3.
             retry_delay: Base delay between retries in seconds (uses exponential backoff). Defaults to 1.0.
+            pool_connections: Number of per-host connection pools to keep. Defaults to 10.
+            pool_maxsize: Maximum number of keep-alive connections per host. Defaults to 10.
+            pool_block: If True, block when the pool is exhausted instead of opening
+                extra (non-pooled) connections. Defaults to False.
+            rate_limit: Maximum requests per second shared by all threads of this connector.
+                The rate adapts down on 429 responses. Retry-After and rate-limit headers
+                are honored even when no limit is set. Defaults to None (unlimited).
+            circuit_breaker: Fail fast per endpoint family (/assets, /search, ...) after
+                repeated 5xx responses or connection errors. Pass a CircuitBreakerRegistry
+                to tune thresholds or share breakers, or False to disable. Defaults to True.
+            session_auth: If True, log in once via /auth/sessions and reuse the session
+                cookie and CSRF token on every request instead of sending Basic auth.
+                Expired sessions are re-established transparently. Defaults to False.
+            json_codec: Codec for response bodies and request payloads: a JSONCodec,
+                "json", "orjson", or None to use orjson when it is installed.
+            conditional_cache: If True (or a ConditionalGetCache), GET responses carrying an
+                ETag or Last-Modified header are kept in a bounded LRU cache and revalidated
+                with If-None-Match/If-Modified-Since, so unchanged resources cost a 304.
+                Defaults to False.
+            response_cache: Persistent SQLite cache of read responses with per-endpoint TTLs:
+                True for the default file, a file path, or a ResponseCache. Writes made
+                through this connector invalidate the affected endpoint family.
+                Defaults to False.
+            entity_cache: If True (or an EntityCache), get_asset, get_domain, get_community
+                and get_user results are kept in an in-process LRU cache that this connector's
+                own writes keep up to date. Defaults to False.
+            negative_cache: If True (or a NegativeCache), GETs that returned 404 are answered
+                with a 404 locally for a short TTL (60s by default) instead of reaching the
+                server again. Defaults to False.
             **kwargs: Additional keyword arguments.
                 - uuids (bool): If True, fetches all UUIDs on initialization.
+                - uuids_snapshot (str or bool): Opt in to a local snapshot of the UUIDs,
+                  fetched and saved if missing and refreshed in the background once older
+                  than an hour. True uses a file per instance and user in the cache
+                  directory; a string names the file. Defaults to False (nothing is read
+                  from or written to disk).
 
         Raises:
             ValueError: If api, username, or password is empty and not in env vars.
@@ -122,13 +194,44 @@ class CollibraConnector:
         if not password or not password.strip():
             raise ValueError("Password cannot be empty")
 
-        self.__auth: AuthBase = HTTPBasicAuth(username, password)
         self.__api: str = api.rstrip("/") + "/rest/2.0"
+        self.__auth: AuthBase = (
+            SessionAuth(self.__api, username, password, timeout, session=self._get_session)
+            if session_auth else HTTPBasicAuth(username, password)
+        )
         self.__base_url: str = api.rstrip("/")
         self.__timeout: int = timeout
         self.__max_retries: int = max_retries
         self.__retry_delay: float = retry_delay
-        self.__session: Optional[requests.Session] = None
+        self.__pool_connections: int = pool_connections
+        self.__pool_maxsize: int = pool_maxsize
+        self.__pool_block: bool = pool_block
+        # One adapter (connection pool) is shared by per-thread sessions
+        self.__adapter: Optional[HTTPAdapter] = None
+        self.__adapter_lock = threading.Lock()
+        self.__executor: Optional[ThreadPoolExecutor] = None
+        self.__local = threading.local()
+        self.__generation: int = 0
+        self.__rate_limiter: RateLimiter = RateLimiter(rate=rate_limit)
+        self.__json_codec: JSONCodec = get_json_codec(json_codec)
+        if circuit_breaker is True:
+            circuit_breaker = CircuitBreakerRegistry()
+        self.__circuit_breakers: Optional[CircuitBreakerRegistry] = circuit_breaker or None
+        if conditional_cache is True:
+            conditional_cache = ConditionalGetCache()
+        self.__conditional_cache: Optional[ConditionalGetCache] = conditional_cache or None
+        if response_cache is True:
+            response_cache = ResponseCache()
+        elif isinstance(response_cache, str):
+            response_cache = ResponseCache(response_cache)
+        self.__response_cache: Optional[ResponseCache] = response_cache or None
+        self.__cache_identity: str = cache_identity(self.__api, username)
+        if entity_cache is True:
+            entity_cache = EntityCache()
+        self.__entity_cache: Optional[EntityCache] = entity_cache or None
+        if negative_cache is True:
+            negative_cache = NegativeCache()
+        self.__negative_cache: Optional[NegativeCache] = negative_cache or None
 
         # Initialize all API classes
         self.activity: Activity = Activity(self)
@@ -147,29 +250,30 @@ class CollibraConnector:
         self.utils: Utils = Utils(self)
         self.workflow: Workflow = Workflow(self)
 
+        # Relation types, loaded in bulk on first use and shared by all API classes
+        self.relation_types: RelationTypeRegistry = RelationTypeRegistry(self)
+
         # Initialize Logger without basicConfig
         self.logger: logging.Logger = logging.getLogger(__name__)
         self.logger.addHandler(logging.NullHandler())
 
         self.uuids: Dict[str, Dict[str, str]] = {}
         if kwargs.get('uuids'):
-            self.uuids = self.utils.get_uuids() or {}
+            snapshot = kwargs.get('uuids_snapshot', False)
+            if not snapshot:
+                self.uuids = self.utils.get_uuids() or {}
+            else:
+                path = snapshot if isinstance(snapshot, str) else None
+                self.uuids = self.utils.load_uuids(path) or {}
 
     def __enter__(self) -> "CollibraConnector":
-        """Enter context manager, creating a session for connection pooling."""
-        self.__session = requests.Session()
-        self.__session.auth = self.__auth
-        self.__session.headers.update({
-            "Content-Type": "application/json",
-            "Accept": "application/json"
-        })
+        """Enter context manager, opening the pooled session eagerly."""
+        self._get_session()
         return self
 
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Exit context manager, closing the session."""
-        if self.__session:
-            self.__session.close()
-            self.__session = None
+        self.close()
 
     def __repr__(self) -> str:
         """Return string representation of the connector."""
@@ -209,10 +313,212 @@ class CollibraConnector:
         """Get the base retry delay in seconds."""
         return self.__retry_delay
 
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        """Get the rate limiter shared by all requests of this connector."""
+        return self.__rate_limiter
+
+    @property
+    def json_codec(self) -> JSONCodec:
+        """Get the codec used to decode responses and encode request payloads."""
+        return self.__json_codec
+
+    @property
+    def circuit_breakers(self) -> Optional[CircuitBreakerRegistry]:
+        """Get the per-endpoint circuit breakers (None if disabled)."""
+        return self.__circuit_breakers
+
+    @property
+    def conditional_cache(self) -> Optional[ConditionalGetCache]:
+        """Get the ETag/Last-Modified cache for GET responses (None if disabled)."""
+        return self.__conditional_cache
+
+    @property
+    def response_cache(self) -> Optional[ResponseCache]:
+        """Get the persistent response cache (None if disabled)."""
+        return self.__response_cache
+
+    @property
+    def cache_identity(self) -> str:
+        """Get the fingerprint of this connector's API and user that scopes shared cache entries."""
+        return self.__cache_identity
+
+    @property
+    def entity_cache(self) -> Optional[EntityCache]:
+        """Get the entity cache (None if disabled)."""
+        return self.__entity_cache
+
+    @property
+    def negative_cache(self) -> Optional[NegativeCache]:
+        """Get the cache of lookups that returned 404 (None if disabled)."""
+        return self.__negative_cache
+
     @property
     def session(self) -> Optional[requests.Session]:
-        """Get the current session (if using context manager)."""
-        return self.__session
+        """Get the calling thread's pooled session (None until it makes a request)."""
+        if getattr(self.__local, "generation", None) != self.__generation:
+            return None
+        return getattr(self.__local, "session", None)
+
+    def _get_adapter(self) -> HTTPAdapter:
+        """Return the shared HTTP adapter, creating its connection pool on first use."""
+        with self.__adapter_lock:
+            if self.__adapter is None:
+                self.__adapter = HTTPAdapter(
+                    pool_connections=self.__pool_connections,
+                    pool_maxsize=self.__pool_maxsize,
+                    pool_block=self.__pool_block,
+                )
+            return self.__adapter
+
+    def _create_session(self) -> requests.Session:
+        """
+        Create a session mounted on the shared, keep-alive connection pool.
+
+        Content-Type is deliberately not set at session level so that multipart
+        uploads (attachments) can set their own boundary header.
+        """
+        session = requests.Session()
+        session.auth = self.__auth
+        session.headers.update({
+            "Accept": "application/json",
+            "Accept-Encoding": accept_encoding()
+        })
+        adapter = self._get_adapter()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def _get_session(self) -> requests.Session:
+        """
+        Return the calling thread's session, creating it on first use.
+
+        ``requests.Session`` objects are not guaranteed to be thread-safe, so each
+        thread gets its own session while all of them share one urllib3 pool.
+        """
+        session = self.session
+        if session is None:
+            session = self._create_session()
+            self.__local.session = session
+            self.__local.generation = self.__generation
+        return session
+
+    def close(self) -> None:
+        """
+        Close the connection pool, stop the shared worker threads and drop the
+        sessions of all threads.
+
+        With session_auth the Collibra session is logged out as well. The
+        connector stays usable; a new pool (and session) is opened on the next request.
+        """
+        if isinstance(self.__auth, SessionAuth):
+            self.__auth.logout()
+        with self.__adapter_lock:
+            if self.__adapter is not None:
+                self.__adapter.close()
+                self.__adapter = None
+            executor, self.__executor = self.__executor, None
+            self.__generation += 1
+        self.__local.session = None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def map(
+        self,
+        fn: Callable[[Any], Any],
+        items: Iterable[Any],
+        workers: int = DEFAULT_WORKERS,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        shared_pool: bool = False
+    ) -> "ParallelResult":
+        """
+        Apply a function to every item using a bounded pool of threads.
+
+        All threads share the connector's connection pool, so ``workers`` should not
+        exceed ``pool_maxsize`` if every worker is meant to keep its connection alive.
+        An exception raised for one item does not stop the others. Called from a
+        worker of another map(), the items run sequentially in that worker instead
+        of nesting a second pool.
+
+        Args:
+            fn: Callable invoked once per item, e.g. ``conn.asset.get_asset``.
+            items: Items to process.
+            workers: Maximum number of concurrent threads. Defaults to 8.
+            progress_callback: Optional callback(completed, total) for progress updates.
+            shared_pool: If True, run on the connector's long-lived pool of DEFAULT_WORKERS
+                threads (``workers`` is ignored) instead of starting threads for this call.
+                Meant for small fan-outs repeated many times, like get_full_profile().
+
+        Returns:
+            ParallelResult with results and errors in the same order as ``items``.
+
+        Example:
+            >>> result = conn.map(conn.asset.get_asset, asset_ids, workers=16)
+            >>> for asset_id, error in result.failures:
+            ...     print(f"{asset_id} failed: {error}")
+            >>> assets = result.results
+        """
+        from .helpers import ParallelResult
+
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+
+        items = list(items)
+        total = len(items)
+        nested = getattr(self.__local, "map_worker", False)
+        if workers > self.__pool_maxsize and not nested and not shared_pool:
+            self.logger.warning(
+                f"map() uses {workers} workers but pool_maxsize is {self.__pool_maxsize}; "
+                f"connections beyond the pool size will not be kept alive"
+            )
+
+        completed = 0
+        progress_lock = threading.Lock()
+
+        def run(item: Any) -> Tuple[Any, Optional[Exception]]:
+            nonlocal completed
+            try:
+                outcome: Tuple[Any, Optional[Exception]] = (fn(item), None)
+            except Exception as e:
+                outcome = (None, e)
+            if progress_callback:
+                with progress_lock:
+                    completed += 1
+                    progress_callback(completed, total)
+            return outcome
+
+        if nested:
+            outcomes = [run(item) for item in items]
+        elif shared_pool:
+            outcomes = list(self._get_executor().map(run, items))
+        else:
+            with ThreadPoolExecutor(
+                max_workers=workers,
+                thread_name_prefix="collibra",
+                initializer=self._mark_map_worker
+            ) as executor:
+                outcomes = list(executor.map(run, items))
+
+        return ParallelResult(
+            items=items,
+            results=[result for result, _ in outcomes],
+            errors=[error for _, error in outcomes],
+        )
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the connector's shared worker pool, creating it on first use."""
+        with self.__adapter_lock:
+            if self.__executor is None:
+                self.__executor = ThreadPoolExecutor(
+                    max_workers=self.DEFAULT_WORKERS,
+                    thread_name_prefix="collibra-shared",
+                    initializer=self._mark_map_worker
+                )
+            return self.__executor
+
+    def _mark_map_worker(self) -> None:
+        """Flag the calling thread as a map() worker, so map() calls made from it run inline."""
+        self.__local.map_worker = True
 
     def test_connection(self) -> bool:
         """
@@ -248,7 +554,16 @@ class CollibraConnector:
         """
         Make an HTTP request with automatic retry logic.
 
-        This method handles retries with exponential backoff for transient errors.
+        All API modules send their requests through this method, so every call
+        reuses the connector's pooled session and gets the same retry handling.
+        Retries use exponential backoff for transient errors, or the server's
+        Retry-After delay when rate limited. Idempotent methods (GET, HEAD,
+        OPTIONS, PUT, DELETE) are retried on 5xx, 429, timeouts and connection
+        errors. POST and PATCH may already have been applied after such
+        failures, so they are only retried on 429/503 with Retry-After or when
+        the connection could not be established. Every attempt first waits for the
+        connector's rate limiter. With the conditional cache enabled, GETs are
+        revalidated and a 304 is returned as the cached 200 response.
 
         Args:
             method: HTTP method (GET, POST, PUT, PATCH, DELETE).
@@ -259,30 +574,67 @@ class CollibraConnector:
             The response object from the request.
 
         Raises:
+            CircuitOpenError: If the endpoint's circuit breaker is open.
             requests.RequestException: If all retry attempts fail.
         """
         kwargs.setdefault("timeout", self.__timeout)
         kwargs.setdefault("auth", self.__auth)
-
-        request_func = self.__session.request if self.__session else requests.request
+        if kwargs.get("json") is not None:
+            # Encode once with the connector's codec instead of per attempt by requests
+            kwargs["data"] = self.__json_codec.dumps(kwargs.pop("json"))
+            headers = dict(kwargs.get("headers") or {})
+            if not any(key.lower() == "content-type" for key in headers):
+                headers["Content-Type"] = "application/json"
+            kwargs["headers"] = headers
+
+        cache_key: Optional[CacheKey] = None
+        cached: Optional[CachedResponse] = None
+        if self.__conditional_cache is not None and method.upper() == "GET" and not kwargs.get("stream"):
+            cache_key = request_key(url, kwargs.get("params"))
+            cached, conditional_headers = self.__conditional_cache.validators(cache_key)
+            if conditional_headers:
+                kwargs["headers"] = {**(kwargs.get("headers") or {}), **conditional_headers}
+
+        request_func = self._get_session().request
+        idempotent = method.upper() in self.IDEMPOTENT_METHODS
+        breaker = self.__circuit_breakers.for_url(url) if self.__circuit_breakers else None
         last_exception: Optional[Exception] = None
 
         for attempt in range(self.__max_retries):
+            if breaker is not None:
+                breaker.before_request()
             try:
+                self.__rate_limiter.acquire()
                 response = request_func(method, url, **kwargs)
+                if breaker is not None:
+                    breaker.record_response(response.status_code)
+                retry_after = self.__rate_limiter.update(
+                    response.status_code, getattr(response, "headers", None)
+                )
 
                 # Don't retry on success or client errors (except rate limiting)
                 if response.status_code < 500 and response.status_code != 429:
+                    if cache_key is not None:
+                        response = self._revalidate(cache_key, cached, response)
                     return response
 
                 # Retry on server errors and rate limiting
-                if response.status_code in self.RETRYABLE_STATUS_CODES:
+                if idempotent:
+                    retryable = response.status_code in self.RETRYABLE_STATUS_CODES
+                else:
+                    retryable = response.status_code in self.REJECTED_STATUS_CODES and retry_after is not None
+                if retryable:
                     if attempt < self.__max_retries - 1:
-                        delay = self.__retry_delay * (2 ** attempt)
+                        if retry_after is not None:
+                            delay = retry_after
+                        else:
+                            delay = self.__retry_delay * (2 ** attempt)
                         self.logger.warning(
                             f"Request failed with status {response.status_code}, "
                             f"retrying in {delay:.1f}s (attempt {attempt + 1}/{self.__max_retries})"
                         )
+                        # Return the connection to the pool; streamed bodies are never read
+                        response.close()
                         time.sleep(delay)
                         continue
 
@@ -290,7 +642,11 @@ class CollibraConnector:
 
             except (requests.ConnectionError, requests.Timeout) as e:
                 last_exception = e
-                if attempt < self.__max_retries - 1:
+                if breaker is not None:
+                    breaker.record_failure()
+                # A connect timeout never reached the server; anything else may have been applied
+                replayable = idempotent or isinstance(e, requests.ConnectTimeout)
+                if replayable and attempt < self.__max_retries - 1:
                     delay = self.__retry_delay * (2 ** attempt)
                     self.logger.warning(
                         f"Request failed with {type(e).__name__}, "
@@ -305,6 +661,42 @@ class CollibraConnector:
             raise last_exception
         raise requests.RequestException("Request failed after all retries")
 
+    def _revalidate(
+        self,
+        key: CacheKey,
+        cached: Optional[CachedResponse],
+        response: requests.Response
+    ) -> requests.Response:
+        """
+        Resolve a conditional GET against the conditional cache.
+
+        A 304 is replaced by the cached response as a 200; a 200 is stored.
+        """
+        cache = self.__conditional_cache
+        if response.status_code == 304 and cached is not None:
+            cache.record(True)
+            response.close()
+            revalidated = self._build_response(cached, response.url)
+            revalidated.request = response.request
+            revalidated.elapsed = response.elapsed
+            return revalidated
+        if response.status_code == 200:
+            cache.record(False)
+            cache.store(key, response.content, response.headers)
+        return response
+
+    @staticmethod
+    def _build_response(cached: CachedResponse, url: str, status_code: int = 200) -> requests.Response:
+        """Build a response from a cached body and headers."""
+        response = requests.Response()
+        response.status_code = status_code
+        response.reason = HTTPStatus(status_code).phrase
+        response._content = cached.content
+        response.headers = CaseInsensitiveDict(cached.headers)
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.url = url
+        return response
+
     def get_version(self) -> str:
         """
         Get the version of this connector library.
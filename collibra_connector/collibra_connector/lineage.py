@@ -468,11 +468,15 @@ class LineageBuilder:
             return self._relation_type_cache[role]
 
         try:
-            # Search for relation type by role
-            result = self.connector.metadata.get_relation_types(role=role, limit=1)
-            types = result.get("results", [])
-            if types:
-                type_id = types[0].get("id")
+            registry = getattr(self.connector, "relation_types", None)
+            if registry is not None:
+                # Look up the role in the connector-wide relation type registry
+                type_id = registry.resolve(role)
+            else:
+                result = self.connector.metadata.get_relation_types(role=role, limit=1)
+                types = result.get("results", [])
+                type_id = types[0].get("id") if types else None
+            if type_id:
                 self._relation_type_cache[role] = type_id
                 return type_id
         except Exception:
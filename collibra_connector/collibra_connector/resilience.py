@@ -0,0 +1,746 @@
+"""
+Resilience primitives shared by the sync and async connectors.
+
+This module provides the building blocks that keep bulk jobs fast without
+overloading a Collibra instance:
+- RateLimiter: adaptive token bucket that honors Retry-After and rate-limit headers
+- AdaptiveConcurrencyLimiter: AIMD-tuned concurrency limit for async batch operations
+- CircuitBreaker / CircuitBreakerRegistry: fail fast per endpoint family during outages
+- HedgingPolicy: when to send a backup request for a slow idempotent GET
+
+RateLimiter and the circuit breakers are guarded by a ``threading.Lock`` and
+never block while holding it, so one instance can be shared by every thread
+and coroutine of a connector.
+
+Example:
+    >>> from collibra_connector import CollibraConnector
+    >>>
+    >>> # At most 20 requests/second across all threads of this connector
+    >>> conn = CollibraConnector(api="...", username="...", password="...", rate_limit=20)
+    >>> print(conn.rate_limiter.rate)
+"""
+from __future__ import annotations
+
+import asyncio
+import bisect
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Deque, Dict, List, Mapping, Optional
+from urllib.parse import urlsplit
+
+from .api.Exceptions import CircuitOpenError
+
+
+def _normalize_headers(headers: Any) -> Dict[str, str]:
+    """Return headers as a lower-cased dict (empty for anything that is not a mapping)."""
+    if not isinstance(headers, Mapping):
+        return {}
+    return {str(key).lower(): value for key, value in headers.items()}
+
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """
+    Parse a Retry-After header value into a delay in seconds.
+
+    Args:
+        value: Header value, either delta-seconds ("120") or an HTTP date.
+        now: Current epoch time (defaults to time.time()).
+
+    Returns:
+        Non-negative delay in seconds, or None if the value cannot be parsed.
+    """
+    if value is None:
+        return None
+    value = str(value).strip()
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    now = time.time() if now is None else now
+    return max(0.0, when.timestamp() - now)
+
+
+class RateLimiter:
+    """
+    Adaptive, thread-safe token bucket rate limiter.
+
+    Callers reserve a token before each request and sleep for the returned
+    delay outside the lock, which makes the same instance usable from threads
+    (``acquire``) and coroutines (``acquire_async``).
+
+    The limiter learns from responses:
+    - ``429`` halves the current rate (never below ``min_rate``) and pauses all
+      callers for the ``Retry-After`` delay when the server provides one.
+    - ``RateLimit-Remaining: 0`` / ``X-RateLimit-Remaining: 0`` pauses all
+      callers until the advertised reset.
+    - Successful responses raise the rate additively back towards the configured
+      ceiling.
+
+    With ``rate=None`` no token bucket is applied, but server-requested pauses
+    are still honored.
+
+    Example:
+        >>> limiter = RateLimiter(rate=10, burst=20)
+        >>> limiter.acquire()  # Blocks until a token is available
+        >>> limiter.update(429, {"Retry-After": "5"})
+        >>> limiter.rate
+        5.0
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        min_rate: float = 0.5,
+        increase_step: float = 0.1,
+        decrease_factor: float = 0.5
+    ) -> None:
+        """
+        Initialize the rate limiter.
+
+        Args:
+            rate: Maximum requests per second (None for no client-side limit).
+            burst: Bucket capacity. Defaults to max(1, rate).
+            min_rate: Lower bound for the adaptive rate after repeated 429s.
+            increase_step: Requests/second regained per successful response.
+            decrease_factor: Multiplier applied to the rate on every 429.
+        """
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be positive")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+
+        self._max_rate: Optional[float] = float(rate) if rate is not None else None
+        self._rate: Optional[float] = self._max_rate
+        self._min_rate = min(min_rate, self._max_rate) if self._max_rate else min_rate
+        self._burst = float(burst if burst is not None else max(1.0, rate or 1.0))
+        self._increase_step = increase_step
+        self._decrease_factor = decrease_factor
+        self._tokens = self._burst
+        self._last_refill = time.monotonic()
+        self._blocked_until = 0.0
+        self._throttled_count = 0
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> Optional[float]:
+        """Get the current (adapted) rate in requests per second."""
+        return self._rate
+
+    @property
+    def max_rate(self) -> Optional[float]:
+        """Get the configured rate ceiling."""
+        return self._max_rate
+
+    @property
+    def throttled_count(self) -> int:
+        """Get the number of 429 responses seen so far."""
+        return self._throttled_count
+
+    def _refill(self, now: float) -> None:
+        """Add tokens for the time elapsed since the last refill."""
+        if self._rate is not None:
+            elapsed = now - self._last_refill
+            self._tokens = min(self._burst, self._tokens + elapsed * self._rate)
+        self._last_refill = now
+
+    def reserve(self) -> float:
+        """
+        Take one token and return how long the caller must wait before sending.
+
+        Tokens may go negative, which queues later callers behind earlier ones.
+
+        Returns:
+            Delay in seconds (0.0 when the request may be sent immediately).
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            delay = max(0.0, self._blocked_until - now)
+            if self._rate is not None:
+                self._tokens -= 1.0
+                if self._tokens < 0:
+                    delay = max(delay, -self._tokens / self._rate)
+            return delay
+
+    def acquire(self) -> None:
+        """Block the calling thread until a request may be sent."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Suspend the calling coroutine until a request may be sent."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """Block all callers for the given number of seconds."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    def update(self, status_code: int, headers: Any = None) -> Optional[float]:
+        """
+        Learn from a response.
+
+        Args:
+            status_code: HTTP status code of the response.
+            headers: Response headers (any mapping; other values are ignored).
+
+        Returns:
+            The server-requested delay in seconds, if the response carried one.
+        """
+        headers = _normalize_headers(headers)
+        retry_after = parse_retry_after(headers.get("retry-after"))
+
+        if retry_after is None:
+            remaining = headers.get("ratelimit-remaining", headers.get("x-ratelimit-remaining"))
+            reset = headers.get("ratelimit-reset", headers.get("x-ratelimit-reset"))
+            if remaining is not None and reset is not None:
+                try:
+                    if int(float(remaining)) <= 0:
+                        reset_value = float(reset)
+                        # Large values are epoch timestamps, small ones are deltas
+                        if reset_value > 1e9:
+                            reset_value -= datetime.now(timezone.utc).timestamp()
+                        retry_after = max(0.0, reset_value)
+                except ValueError:
+                    pass
+
+        with self._lock:
+            if status_code == 429:
+                self._throttled_count += 1
+                if self._rate is not None:
+                    self._rate = max(self._min_rate, self._rate * self._decrease_factor)
+            elif status_code < 400 and self._rate is not None and self._max_rate is not None:
+                self._rate = min(self._max_rate, self._rate + self._increase_step)
+
+            if retry_after is not None:
+                self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+
+        return retry_after
+
+    def __repr__(self) -> str:
+        return f"RateLimiter(rate={self._rate}, max_rate={self._max_rate}, throttled={self._throttled_count})"
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD (additive increase, multiplicative decrease) concurrency limiter for asyncio.
+
+    Each request holds a slot while in flight and reports its outcome. While
+    responses stay healthy the limit grows by roughly one slot per window of
+    ``limit`` completions; a 429, a 5xx, a transport error or a latency spike
+    (``latency_tolerance`` times the healthy baseline) cuts it by
+    ``backoff_factor``. At most one decrease is applied per baseline round trip,
+    so a burst of failures from the same window counts once.
+
+    Example:
+        >>> limiter = AdaptiveConcurrencyLimiter(initial_limit=10, max_limit=200)
+        >>> await limiter.acquire()
+        >>> try:
+        ...     response = await client.get(url)
+        ... finally:
+        ...     limiter.release()
+        >>> limiter.record(latency=0.12, status_code=response.status_code)
+        >>> limiter.limit
+        10
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        backoff_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+        smoothing: float = 0.1
+    ) -> None:
+        """
+        Initialize the limiter.
+
+        Args:
+            initial_limit: Starting number of concurrent requests.
+            min_limit: Lower bound for the limit.
+            max_limit: Upper bound for the limit.
+            backoff_factor: Multiplier applied to the limit on an unhealthy outcome.
+            latency_tolerance: Latency above this multiple of the baseline counts as a spike.
+            smoothing: Weight of new samples in the latency baseline (EWMA).
+        """
+        if not 1 <= min_limit <= max_limit:
+            raise ValueError("limits must satisfy 1 <= min_limit <= max_limit")
+        if not 0 < backoff_factor < 1:
+            raise ValueError("backoff_factor must be between 0 and 1")
+
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._backoff_factor = backoff_factor
+        self._latency_tolerance = latency_tolerance
+        self._smoothing = smoothing
+        self._baseline: Optional[float] = None
+        self._last_decrease = 0.0
+        self._in_flight = 0
+        self._waiters: Deque["asyncio.Future[None]"] = deque()
+        self._decreases = 0
+
+    @property
+    def limit(self) -> int:
+        """Get the current concurrency limit."""
+        return int(self._limit)
+
+    @property
+    def max_limit(self) -> int:
+        """Get the upper bound of the concurrency limit."""
+        return self._max_limit
+
+    @property
+    def in_flight(self) -> int:
+        """Get the number of requests currently holding a slot."""
+        return self._in_flight
+
+    @property
+    def baseline_latency(self) -> Optional[float]:
+        """Get the smoothed latency of healthy responses in seconds."""
+        return self._baseline
+
+    def stats(self) -> Dict[str, Any]:
+        """Return current limiter metrics."""
+        return {
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "waiting": len(self._waiters),
+            "baseline_latency": self._baseline,
+            "decreases": self._decreases,
+        }
+
+    async def acquire(self) -> None:
+        """Wait for a free slot."""
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return
+        future: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over just before cancellation; give it back
+                self.release()
+            else:
+                self._waiters.remove(future)
+            raise
+
+    def release(self) -> None:
+        """Free a slot and hand it to waiters if the limit allows."""
+        self._in_flight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        """Hand free slots to queued waiters in FIFO order."""
+        while self._waiters and self._in_flight < self.limit:
+            future = self._waiters.popleft()
+            if not future.done():
+                self._in_flight += 1
+                future.set_result(None)
+
+    def record(
+        self,
+        latency: float,
+        status_code: Optional[int] = None,
+        error: bool = False
+    ) -> None:
+        """
+        Report the outcome of one request.
+
+        Args:
+            latency: Request duration in seconds.
+            status_code: HTTP status code (None if no response was received).
+            error: True if the request failed with a transport error.
+        """
+        throttled = error or status_code == 429 or (status_code is not None and status_code >= 500)
+        spike = (
+            self._baseline is not None
+            and latency > self._baseline * self._latency_tolerance
+        )
+
+        if throttled or spike:
+            now = time.monotonic()
+            if now - self._last_decrease >= (self._baseline or 0.0):
+                self._limit = max(float(self._min_limit), self._limit * self._backoff_factor)
+                self._last_decrease = now
+                self._decreases += 1
+            return
+
+        if self._baseline is None:
+            self._baseline = latency
+        else:
+            self._baseline += self._smoothing * (latency - self._baseline)
+        self._limit = min(float(self._max_limit), self._limit + 1.0 / self._limit)
+        self._wake()
+
+    def __repr__(self) -> str:
+        return f"AdaptiveConcurrencyLimiter(limit={self.limit}, in_flight={self._in_flight})"
+
+
+def endpoint_family(url: str) -> str:
+    """
+    Return the endpoint family of a URL or path, used to key circuit breakers.
+
+    The REST prefix (``/rest/2.0``) is skipped and the first remaining path
+    segment is kept, so ``https://x/rest/2.0/assets/123/tags`` maps to ``/assets``.
+
+    Args:
+        url: Absolute URL or API path.
+
+    Returns:
+        The endpoint family, e.g. "/assets" or "/outputModule".
+    """
+    segments = [segment for segment in urlsplit(url).path.split("/") if segment]
+    if segments and segments[0] == "rest":
+        segments = segments[1:]
+        if segments and segments[0][:1].isdigit():
+            segments = segments[1:]
+    return "/" + segments[0] if segments else "/"
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker for one endpoint family.
+
+    - ``closed``: requests flow; consecutive failures are counted.
+    - ``open``: after ``failure_threshold`` consecutive failures every request is
+      rejected with CircuitOpenError until ``recovery_timeout`` has elapsed.
+    - ``half_open``: up to ``half_open_max_calls`` probe requests are let through.
+      A successful probe closes the circuit, a failed one opens it again.
+
+    Only server-side failures count (5xx responses and transport errors);
+    client errors and 429s, which the RateLimiter handles, count as successes.
+
+    Example:
+        >>> breaker = CircuitBreaker("/assets", failure_threshold=5)
+        >>> breaker.before_request()  # Raises CircuitOpenError when open
+        >>> breaker.record_failure()
+        >>> breaker.state
+        'closed'
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1
+    ) -> None:
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            name: Endpoint family this breaker protects.
+            failure_threshold: Consecutive failures that open the circuit.
+            recovery_timeout: Seconds to stay open before probing again.
+            half_open_max_calls: Probe requests allowed while half-open.
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        if half_open_max_calls < 1:
+            raise ValueError("half_open_max_calls must be at least 1")
+
+        self.name = name
+        self._failure_threshold = failure_threshold
+        self._recovery_timeout = recovery_timeout
+        self._half_open_max_calls = half_open_max_calls
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes: Deque[float] = deque()
+        self._open_count = 0
+        self._rejected_count = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Get the current state ("closed", "open" or "half_open")."""
+        with self._lock:
+            return self._current_state(time.monotonic())
+
+    def _current_state(self, now: float) -> str:
+        """Move from open to half-open once the recovery timeout has elapsed."""
+        if self._state == self.OPEN and now - self._opened_at >= self._recovery_timeout:
+            self._state = self.HALF_OPEN
+            self._probes.clear()
+        return self._state
+
+    def before_request(self) -> None:
+        """
+        Check whether a request may be sent.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with all
+                probe slots taken.
+        """
+        with self._lock:
+            now = time.monotonic()
+            state = self._current_state(now)
+            if state == self.CLOSED:
+                return
+            if state == self.HALF_OPEN:
+                # Probes that never reported back expire after the recovery timeout
+                while self._probes and now - self._probes[0] >= self._recovery_timeout:
+                    self._probes.popleft()
+                if len(self._probes) < self._half_open_max_calls:
+                    self._probes.append(now)
+                    return
+                retry_after = self._recovery_timeout - (now - self._probes[0])
+            else:
+                retry_after = self._recovery_timeout - (now - self._opened_at)
+            self._rejected_count += 1
+        raise CircuitOpenError(self.name, max(0.0, retry_after))
+
+    def record_success(self) -> None:
+        """Report a healthy response; closes a half-open circuit."""
+        with self._lock:
+            self._failures = 0
+            if self._state == self.HALF_OPEN:
+                self._state = self.CLOSED
+                self._probes.clear()
+
+    def record_failure(self) -> None:
+        """Report a server-side failure; may open the circuit."""
+        with self._lock:
+            now = time.monotonic()
+            state = self._current_state(now)
+            self._failures += 1
+            if state == self.HALF_OPEN or (
+                state == self.CLOSED and self._failures >= self._failure_threshold
+            ):
+                self._state = self.OPEN
+                self._opened_at = now
+                self._probes.clear()
+                self._open_count += 1
+
+    def record_response(self, status_code: int) -> None:
+        """Report a response: 5xx counts as a failure, anything else as a success."""
+        if status_code >= 500:
+            self.record_failure()
+        else:
+            self.record_success()
+
+    def reset(self) -> None:
+        """Force the circuit closed."""
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probes.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return breaker metrics."""
+        with self._lock:
+            return {
+                "state": self._current_state(time.monotonic()),
+                "consecutive_failures": self._failures,
+                "open_count": self._open_count,
+                "rejected_count": self._rejected_count,
+            }
+
+    def __repr__(self) -> str:
+        return f"CircuitBreaker(name={self.name!r}, state={self.state!r})"
+
+
+class CircuitBreakerRegistry:
+    """
+    Circuit breakers keyed by endpoint family, created on first use.
+
+    An outage of one family (say ``/search``) does not block unrelated calls
+    such as ``/assets``.
+
+    Example:
+        >>> registry = CircuitBreakerRegistry(failure_threshold=3)
+        >>> breaker = registry.for_url("https://x/rest/2.0/assets/123")
+        >>> registry.states()
+        {'/assets': 'closed'}
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1
+    ) -> None:
+        """
+        Initialize the registry.
+
+        Args:
+            failure_threshold: Consecutive failures that open a circuit.
+            recovery_timeout: Seconds a circuit stays open before probing.
+            half_open_max_calls: Probe requests allowed while half-open.
+        """
+        # Validate once up front rather than on first use of each family
+        CircuitBreaker("", failure_threshold, recovery_timeout, half_open_max_calls)
+        self._failure_threshold = failure_threshold
+        self._recovery_timeout = recovery_timeout
+        self._half_open_max_calls = half_open_max_calls
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, family: str) -> CircuitBreaker:
+        """Get (or create) the breaker for an endpoint family."""
+        with self._lock:
+            breaker = self._breakers.get(family)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    family,
+                    self._failure_threshold,
+                    self._recovery_timeout,
+                    self._half_open_max_calls
+                )
+                self._breakers[family] = breaker
+            return breaker
+
+    def for_url(self, url: str) -> CircuitBreaker:
+        """Get the breaker for the endpoint family of a URL or path."""
+        return self.get(endpoint_family(url))
+
+    def states(self) -> Dict[str, str]:
+        """Return the state of every known endpoint family."""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {breaker.name: breaker.state for breaker in breakers}
+
+    def reset(self) -> None:
+        """Close every circuit."""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        for breaker in breakers:
+            breaker.reset()
+
+
+class HedgingPolicy:
+    """
+    Decide when to hedge (duplicate) a slow idempotent request.
+
+    Latencies are tracked per endpoint family over a sliding window. Once a
+    family has ``min_samples`` observations, a request that has not completed
+    after the ``percentile`` latency gets a backup request; the first response
+    wins and the other request is cancelled.
+
+    Extra load is capped by a token budget: every request earns
+    ``max_extra_ratio`` tokens (up to ``burst``) and every hedge spends one, so
+    with the default ratio of 0.05 at most about 5% more requests are sent.
+
+    Example:
+        >>> policy = HedgingPolicy(percentile=0.95, max_extra_ratio=0.05)
+        >>> for latency in observed:
+        ...     policy.record("/assets", latency)
+        >>> policy.hedge_delay("/assets")
+        0.42
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        min_delay: float = 0.01,
+        max_extra_ratio: float = 0.05,
+        burst: float = 10.0,
+        window: int = 500,
+        min_samples: int = 20
+    ) -> None:
+        """
+        Initialize the hedging policy.
+
+        Args:
+            percentile: Latency percentile (0-1) after which a hedge is sent.
+            min_delay: Lower bound for the hedge delay in seconds.
+            max_extra_ratio: Maximum fraction of extra (hedged) requests.
+            burst: Maximum number of hedges that may be saved up.
+            window: Number of recent latencies kept per endpoint family.
+            min_samples: Observations required before a family is hedged.
+        """
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be between 0 and 1")
+        if not 0 < max_extra_ratio <= 1:
+            raise ValueError("max_extra_ratio must be between 0 and 1")
+
+        self._percentile = percentile
+        self._min_delay = min_delay
+        self._max_extra_ratio = max_extra_ratio
+        self._burst = burst
+        self._window = window
+        self._min_samples = max(1, min_samples)
+        self._latencies: Dict[str, Deque[float]] = {}
+        # The same window kept sorted, so a percentile is one index lookup
+        self._sorted: Dict[str, List[float]] = {}
+        self._delays: Dict[str, Optional[float]] = {}
+        self._tokens = 0.0
+        self._requests = 0
+        self._hedged = 0
+        self._hedge_wins = 0
+
+    def hedge_delay(self, family: str) -> Optional[float]:
+        """
+        Get the delay after which a request to ``family`` should be hedged.
+
+        Returns:
+            Delay in seconds, or None while there are too few samples.
+        """
+        return self._delays.get(family)
+
+    def record(self, family: str, latency: float) -> None:
+        """Record the latency of a completed request."""
+        samples = self._latencies.get(family)
+        if samples is None:
+            samples = self._latencies[family] = deque(maxlen=self._window)
+            self._sorted[family] = []
+        ordered = self._sorted[family]
+        if len(samples) == self._window:
+            del ordered[bisect.bisect_left(ordered, samples[0])]
+        samples.append(latency)
+        bisect.insort(ordered, latency)
+        if len(ordered) >= self._min_samples:
+            index = min(len(ordered) - 1, int(self._percentile * len(ordered)))
+            self._delays[family] = max(self._min_delay, ordered[index])
+
+    def on_request(self) -> None:
+        """Count a primary request and earn hedge budget."""
+        self._requests += 1
+        self._tokens = min(self._burst, self._tokens + self._max_extra_ratio)
+
+    def try_hedge(self) -> bool:
+        """Spend budget for a hedge; returns False if the budget is exhausted."""
+        if self._tokens < 1.0:
+            return False
+        self._tokens -= 1.0
+        self._hedged += 1
+        return True
+
+    def on_hedge_win(self) -> None:
+        """Count a hedge that answered before the primary request."""
+        self._hedge_wins += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hedging metrics."""
+        return {
+            "requests": self._requests,
+            "hedged": self._hedged,
+            "hedge_wins": self._hedge_wins,
+            "delays": dict(self._delays),
+        }
+
+    def __repr__(self) -> str:
+        return f"HedgingPolicy(percentile={self._percentile}, hedged={self._hedged}/{self._requests})"
@@ -35,7 +35,7 @@ import uuid
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Callable, Dict, Generator, List, Optional, TypeVar, Union
+from typing import Any, Callable, Dict, Generator, Iterator, List, Optional, TypeVar, Union
 from unittest.mock import MagicMock, patch
 
 from .models import (
@@ -326,6 +326,37 @@ class MockAssetAPI:
             responsibilities=[ResponsibilitySummary(role="Data Steward", owner="Mock User", owner_id=generate_uuid())]
         )
 
+    def get_full_profiles(
+        self,
+        asset_ids: Optional[List[str]] = None,
+        domain_id: Optional[str] = None,
+        **kwargs: Any
+    ) -> List[AssetProfileModel]:
+        """Get full profiles for several assets or a domain."""
+        if asset_ids is None:
+            asset_ids = [asset.id for asset in self.find_assets(domain_id=domain_id, limit=1000).results]
+        return [self.get_full_profile(asset_id) for asset_id in asset_ids]
+
+    def iter_full_profiles(
+        self,
+        asset_ids: Optional[List[str]] = None,
+        domain_id: Optional[str] = None,
+        **kwargs: Any
+    ) -> Iterator[AssetProfileModel]:
+        """Lazily yield full profiles for several assets or a domain."""
+        yield from self.get_full_profiles(asset_ids=asset_ids, domain_id=domain_id)
+
+    def get_modified_asset_ids(
+        self,
+        since: int,
+        domain_id: Optional[str] = None,
+        community_id: Optional[str] = None,
+        **kwargs: Any
+    ) -> List[str]:
+        """Get ids of assets modified at or after since."""
+        assets = self.find_assets(community_id=community_id, domain_id=domain_id, limit=1000).results
+        return sorted(asset.id for asset in assets if (asset.last_modified_on or 0) >= since)
+
 
 class MockAttributeAPI:
     """Mock Attribute API."""
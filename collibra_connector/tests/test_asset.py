@@ -214,44 +214,47 @@ class TestAssetTags:
                 assert kwargs['url'].endswith("/asset-id/tags")
                 assert kwargs['data'] == {"tagNames": ["tag1", "tag2"]}
 
-    def test_remove_tags_success(self, asset_api):
+    def test_remove_tags_success(self, asset_api, connector):
         """Test removing tags successfully."""
-        with patch('requests.delete') as mock_delete:
+        with patch.object(connector, '_make_request') as mock_request:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.text = "{}"
-            mock_delete.return_value = mock_response
-            
+            mock_request.return_value = mock_response
+
             with patch.object(asset_api, '_handle_response') as mock_handle:
                 mock_handle.return_value = {}
-                
+
                 asset_api.remove_tags("asset-id", ["tag1"])
-                
-                mock_delete.assert_called_once()
-                args, kwargs = mock_delete.call_args
-                assert args[0].endswith("/asset-id/tags")
+
+                mock_request.assert_called_once()
+                args, kwargs = mock_request.call_args
+                assert args[0] == "DELETE"
+                assert args[1].endswith("/asset-id/tags")
                 assert kwargs['json'] == ["tag1"]
 
 
 class TestAssetAttachments:
     """Tests for attachment methods."""
 
-    def test_add_attachment_success(self, asset_api):
+    def test_add_attachment_success(self, asset_api, connector):
         """Test adding attachment successfully."""
         with patch('os.path.exists', return_value=True):
             with patch('builtins.open', create=True) as mock_open:
-                with patch('requests.post') as mock_post:
+                with patch.object(connector, '_make_request') as mock_post:
                     mock_response = Mock()
                     mock_response.status_code = 201
                     mock_response.text = '{"id": "file-id"}'
+                    mock_response.content = b'{"id": "file-id"}'
                     mock_response.json.return_value = {"id": "file-id"}
                     mock_post.return_value = mock_response
-                    
+
                     result = asset_api.add_attachment("asset-id", "/path/to/file.txt")
-                    
+
                     assert result == {"id": "file-id"}
                     mock_post.assert_called_once()
                     args, kwargs = mock_post.call_args
+                    assert args[0] == "POST"
                     assert 'files' in kwargs
                     assert kwargs['files']['file'][0] == 'file.txt'
 
@@ -266,3 +269,229 @@ class TestAssetAttachments:
                 
                 assert len(result) == 1
                 assert result[0]["id"] == "att-1"
+
+
+class TestAssetGetFullProfile:
+    """Tests for get_full_profile."""
+
+    ASSET_ID = "12345678-1234-1234-1234-123456789012"
+    ASSET = {
+        "id": ASSET_ID,
+        "name": "Customer",
+        "type": {"id": "t1", "name": "Table"},
+        "status": {"id": "s1", "name": "Accepted"},
+        "domain": {"id": "d1", "name": "Sales"},
+    }
+
+    def test_sub_resources_fetched_concurrently(self, connector, asset_api):
+        """Test that sub-resource calls overlap instead of running one after another."""
+        import threading
+        barrier = threading.Barrier(3, timeout=5)
+
+        def waiting(value):
+            def call(*args, **kwargs):
+                barrier.wait()
+                return value
+            return call
+
+        with patch.object(asset_api, "get_asset", side_effect=waiting(self.ASSET)), \
+                patch.object(connector.attribute, "get_attributes_as_dict", side_effect=waiting({"Description": "x"})), \
+                patch.object(connector.relation, "get_asset_relations", side_effect=waiting({"outgoing_count": 2})), \
+                patch.object(asset_api, "_get", return_value=Mock(status_code=200, content=b'{"results": []}')):
+            profile = asset_api.get_full_profile(self.ASSET_ID)
+
+        assert profile.asset.name == "Customer"
+        assert profile.attributes == {"Description": "x"}
+        assert profile.relations.outgoing_count == 2
+
+    def test_responsibilities_filtered_by_resource(self, asset_api):
+        """Test that responsibilities are requested for the asset only."""
+        body = b'{"results": [{"role": {"name": "Owner"}, "owner": {"id": "u1", "firstName": "Ada", "lastName": "Lovelace"}}]}'
+        with patch.object(asset_api, "get_asset", return_value=self.ASSET), \
+                patch.object(asset_api, "_get", return_value=Mock(status_code=200, content=body)) as mock_get:
+            profile = asset_api.get_full_profile(
+                self.ASSET_ID, include_attributes=False, include_relations=False
+            )
+
+        assert mock_get.call_args.kwargs["params"] == {"resourceIds": self.ASSET_ID, "limit": 50}
+        assert mock_get.call_args.kwargs["url"].endswith("/responsibilities")
+        assert profile.responsibilities[0].owner == "Ada Lovelace"
+
+    def test_optional_failures_ignored_and_asset_failure_raised(self, connector, asset_api):
+        """Test that failed sub-resources fall back to defaults while asset errors propagate."""
+        with patch.object(asset_api, "get_asset", return_value=self.ASSET), \
+                patch.object(connector.attribute, "get_attributes_as_dict", side_effect=RuntimeError("boom")), \
+                patch.object(connector.relation, "get_asset_relations", side_effect=RuntimeError("boom")), \
+                patch.object(asset_api, "_get", side_effect=RuntimeError("boom")):
+            profile = asset_api.get_full_profile(self.ASSET_ID)
+        assert profile.attributes == {}
+        assert profile.responsibilities == []
+
+        with patch.object(asset_api, "get_asset", side_effect=LookupError("missing")):
+            with pytest.raises(LookupError):
+                asset_api.get_full_profile(
+                    self.ASSET_ID, include_attributes=False, include_relations=False, include_responsibilities=False
+                )
+
+
+def declared_names(node):
+    """Yield the column names declared anywhere in an Output Module view."""
+    if isinstance(node, list):
+        for item in node:
+            yield from declared_names(item)
+    elif isinstance(node, dict):
+        for key, value in node.items():
+            if key == "Filter":
+                continue
+            if key == "name" and isinstance(value, str):
+                yield value
+            else:
+                yield from declared_names(value)
+
+
+def filtered_names(node):
+    """Yield the field names referenced by an Output Module filter."""
+    if isinstance(node, list):
+        for item in node:
+            yield from filtered_names(item)
+    elif isinstance(node, dict):
+        if "Field" in node:
+            yield node["Field"]["name"]
+        for key in ("AND", "OR"):
+            yield from filtered_names(node.get(key, []))
+
+
+class TestAssetGetFullProfiles:
+    """Tests for bulk profile retrieval through the Output Module."""
+
+    IDS = [f"00000000-0000-0000-0000-00000000000{i}" for i in range(1, 6)]
+
+    def row(self, asset_id):
+        return {
+            "id": asset_id, "name": f"Asset {asset_id[-1]}", "createdOn": "1700000000000",
+            "typeId": "t1", "typeName": "Table", "statusId": "s1", "statusName": "Accepted",
+            "domainId": "d1", "domainName": "Sales",
+            "stringAttributes": [{"stringAttributesType": "Description", "stringAttributesValue": "<p>Hi</p>"}],
+            "booleanAttributes": [{"booleanAttributesType": None, "booleanAttributesValue": None}],
+            "outgoingRelations": [{
+                "outgoingRelationsId": "r1", "outgoingRelationsTypeId": "rt1",
+                "outgoingRelationsAssetId": "c1", "outgoingRelationsAssetName": "Column",
+                "outgoingRelationsAssetType": "Column", "outgoingRelationsAssetStatus": None,
+            }],
+            "incomingRelations": [{"incomingRelationsId": None}],
+            "responsibilities": [
+                {"responsibilitiesRole": "Steward", "responsibilitiesUserId": "u1",
+                 "responsibilitiesFirstName": "Ada", "responsibilitiesLastName": "Lovelace"},
+                {"responsibilitiesRole": "Owner", "responsibilitiesGroupId": "g1",
+                 "responsibilitiesGroupName": "Data Office"},
+            ],
+        }
+
+    def test_assets_fetched_in_batches_and_mapped(self, connector, asset_api):
+        """Test that ids are exported in batches and rows become profiles in input order."""
+        configs = []
+
+        def stream_json(config, validation_enabled=False, path=None):
+            configs.append(config)
+            ids = config["TableViewConfig"]["Resources"]["Asset"]["Filter"]["AND"][0]["Field"]["values"]
+            return iter([self.row(asset_id) for asset_id in ids if asset_id != self.IDS[3]])
+
+        requested = list(reversed(self.IDS))
+        with patch.object(connector.output_module, "stream_json", side_effect=stream_json), \
+                patch.object(connector.relation_types, "get", return_value={"role": "contains", "coRole": "is part of"}):
+            profiles = asset_api.get_full_profiles(asset_ids=requested, batch_size=2)
+
+        assert len(configs) == 3
+        assert [p.asset.id for p in profiles] == [i for i in requested if i != self.IDS[3]]
+        profile = profiles[0]
+        assert profile.asset.type_name == "Table"
+        assert profile.asset.created_on == 1700000000000
+        assert profile.attributes == {"Description": "<p>Hi</p>"}
+        assert profile.relations.outgoing["contains"][0].target_name == "Column"
+        assert profile.relations.outgoing_count == 1
+        assert profile.relations.incoming_count == 0
+        assert [(r.role, r.owner) for r in profile.responsibilities] == [("Steward", "Ada Lovelace"), ("Owner", "Data Office")]
+        assert asset_api.flatten_profile(profile)["attr_description"] == "Hi"
+
+    def test_domain_paginated(self, connector, asset_api):
+        """Test that a domain is exported page by page until a short page."""
+        pages = [[self.row(i) for i in self.IDS[:2]], [self.row(i) for i in self.IDS[2:4]], [self.row(self.IDS[4])]]
+        with patch.object(connector.output_module, "stream_json", side_effect=[iter(p) for p in pages]) as stream, \
+                patch.object(connector.relation_types, "get", return_value=None):
+            profiles = asset_api.get_full_profiles(domain_id=self.IDS[0], batch_size=2, include_responsibilities=False)
+
+        assert len(profiles) == 5
+        assert profiles[0].relations.outgoing["Unknown"][0].id == "r1"
+        starts = [c.args[0]["TableViewConfig"]["displayStart"] for c in stream.call_args_list]
+        assert starts == [0, 2, 4]
+        fields = stream.call_args_list[0].args[0]["TableViewConfig"]["Resources"]["Asset"]
+        assert "Responsibility" not in fields
+        assert fields["Filter"]["AND"][0]["Field"]["value"] == self.IDS[0]
+
+    def test_arguments_validated(self, asset_api):
+        """Test that exactly one selector with valid UUIDs is required."""
+        with pytest.raises(ValueError):
+            asset_api.get_full_profiles()
+        with pytest.raises(ValueError):
+            asset_api.get_full_profiles(asset_ids=self.IDS, domain_id=self.IDS[0])
+        with pytest.raises(ValueError):
+            asset_api.get_full_profiles(asset_ids=["not-a-uuid"])
+
+    def test_community_type_filters_and_limit(self, connector, asset_api):
+        """Test community and asset type filters and that limit caps the last page."""
+        def stream_json(config, **kwargs):
+            view = config["TableViewConfig"]
+            start, length = view["displayStart"], view["displayLength"]
+            return iter([self.row(i) for i in self.IDS[start:start + length]])
+
+        with patch.object(connector.output_module, "stream_json", side_effect=stream_json) as stream, \
+                patch.object(connector.relation_types, "get", return_value=None):
+            profiles = asset_api.get_full_profiles(
+                community_id=self.IDS[0], asset_type_ids=[self.IDS[1]], limit=3, batch_size=2
+            )
+
+        assert [p.asset.id for p in profiles] == self.IDS[:3]
+        lengths = [c.args[0]["TableViewConfig"]["displayLength"] for c in stream.call_args_list]
+        assert lengths == [2, 1]
+        conditions = stream.call_args_list[0].args[0]["TableViewConfig"]["Resources"]["Asset"]["Filter"]["AND"]
+        assert [c["Field"]["name"] for c in conditions] == ["communityId", "typeId"]
+
+    def test_iter_full_profiles_yields_before_next_page(self, connector, asset_api):
+        """Test that profiles of a page are yielded before the next page is requested."""
+        pages = [[self.row(i) for i in self.IDS[:2]], [self.row(i) for i in self.IDS[2:3]]]
+        with patch.object(connector.output_module, "stream_json", side_effect=[iter(p) for p in pages]) as stream, \
+                patch.object(connector.relation_types, "get", return_value=None):
+            profiles = asset_api.iter_full_profiles(domain_id=self.IDS[0], batch_size=2)
+            assert next(profiles).asset.id == self.IDS[0]
+            assert stream.call_count == 1
+            assert [p.asset.id for p in profiles] == self.IDS[1:3]
+        assert stream.call_count == 2
+
+    def test_modified_asset_ids_filter_on_asset_and_attribute_dates(self, connector, asset_api):
+        """Test that modified assets are found with one id-only export over asset and attribute dates."""
+        with patch.object(connector.output_module, "stream_json",
+                          return_value=iter([{"id": self.IDS[1]}, {"id": self.IDS[2]}])) as stream:
+            ids = asset_api.get_modified_asset_ids(1700000000000, domain_id=self.IDS[0], batch_size=10)
+
+        assert ids == self.IDS[1:3]
+        view = stream.call_args.args[0]["TableViewConfig"]
+        resource = view["Resources"]["Asset"]
+        assert "Relation" not in resource and "stringAttributesLastModified" in str(resource["StringAttribute"])
+        scope, changed = resource["Filter"]["AND"]
+        assert scope["Field"]["value"] == self.IDS[0]
+        assert [c["Field"]["name"] for c in changed["OR"]][:2] == ["lastModifiedOn", "stringAttributesLastModified"]
+        assert {c["Field"]["value"] for c in changed["OR"]} == {"1700000000000"}
+        declared = set(declared_names(resource))
+        assert {"domainId", "communityId", "typeId", "lastModifiedOn"} <= declared
+        assert set(filtered_names(resource["Filter"])) <= declared
+        with pytest.raises(ValueError):
+            asset_api.get_modified_asset_ids(-1, domain_id=self.IDS[0])
+
+    def test_profile_filters_reference_declared_fields(self, connector, asset_api):
+        """Test that every field a profile export filters on is declared in its view."""
+        with patch.object(connector.output_module, "stream_json", return_value=iter([])) as stream:
+            list(asset_api.iter_full_profiles(
+                community_id=self.IDS[0], domain_id=self.IDS[1], asset_type_ids=[self.IDS[2]]
+            ))
+        resource = stream.call_args.args[0]["TableViewConfig"]["Resources"]["Asset"]
+        assert set(filtered_names(resource["Filter"])) <= set(declared_names(resource))
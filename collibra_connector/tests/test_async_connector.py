@@ -0,0 +1,390 @@
+"""Tests for the AsyncCollibraConnector transport."""
+import asyncio
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from collibra_connector import AsyncCollibraConnector, CircuitBreakerRegistry, HedgingPolicy
+from collibra_connector.api.Exceptions import (
+    CircuitOpenError,
+    ForbiddenError,
+    NotFoundError,
+    ServerError,
+)
+
+
+def make_connector(handler, **kwargs):
+    """Create a connector whose client is served by an httpx MockTransport."""
+    connector = AsyncCollibraConnector(
+        api="https://test.collibra.com",
+        username="testuser",
+        password="testpass",
+        retry_delay=0,
+        **kwargs
+    )
+    connector._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return connector
+
+
+class TestAsyncSingleFlight:
+    """Tests for single-flight coalescing of identical GETs."""
+
+    def test_identical_gets_share_one_request(self):
+        """Test that concurrent identical GETs hit the server once."""
+        calls = []
+
+        async def handler(request):
+            calls.append(str(request.url))
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"id": "123", "name": "Asset"})
+
+        async def run():
+            conn = make_connector(handler, single_flight=True)
+            results = await asyncio.gather(*[
+                conn._request("GET", "/assets/123") for _ in range(5)
+            ])
+            other = await conn._request("GET", "/assets/123", params={"x": 1})
+            await conn._client.aclose()
+            return conn, results, other
+
+        conn, results, other = asyncio.run(run())
+        assert len(calls) == 2
+        assert conn.coalesced_count == 4
+        assert all(r == {"id": "123", "name": "Asset"} for r in results)
+        # Each caller gets its own copy of a shared result
+        assert len({id(r) for r in results}) == 5
+        assert other["id"] == "123"
+
+    def test_errors_are_shared(self):
+        """Test that every coalesced caller sees the shared failure."""
+        calls = []
+
+        async def handler(request):
+            calls.append(request)
+            await asyncio.sleep(0.01)
+            return httpx.Response(404, text="missing")
+
+        async def run():
+            conn = make_connector(handler, single_flight=True)
+            results = await asyncio.gather(
+                *[conn._request("GET", "/assets/404") for _ in range(3)],
+                return_exceptions=True
+            )
+            await conn._client.aclose()
+            return results
+
+        results = asyncio.run(run())
+        assert len(calls) == 1
+        assert all(isinstance(r, NotFoundError) for r in results)
+
+    def test_disabled_by_default(self):
+        """Test that GETs are not coalesced unless enabled."""
+        calls = []
+
+        async def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json={})
+
+        async def run():
+            conn = make_connector(handler)
+            await asyncio.gather(*[conn._request("GET", "/assets/1") for _ in range(3)])
+            await conn._client.aclose()
+
+        asyncio.run(run())
+        assert len(calls) == 3
+
+    def test_cancelled_caller_does_not_cancel_others(self):
+        """Test that the shared request survives one caller being cancelled."""
+        async def handler(request):
+            await asyncio.sleep(0.02)
+            return httpx.Response(200, json={"ok": True})
+
+        async def run():
+            conn = make_connector(handler, single_flight=True)
+            first = asyncio.ensure_future(conn._request("GET", "/assets/1"))
+            second = asyncio.ensure_future(conn._request("GET", "/assets/1"))
+            await asyncio.sleep(0.005)
+            first.cancel()
+            result = await second
+            await conn._client.aclose()
+            return result
+
+        assert asyncio.run(run()) == {"ok": True}
+
+
+class TestAsyncCircuitBreaker:
+    """Tests for circuit breaking in the async connector."""
+
+    def test_server_errors_open_circuit(self):
+        """Test that repeated 5xx responses open the endpoint's circuit."""
+        calls = []
+
+        async def handler(request):
+            calls.append(request)
+            return httpx.Response(503, text="down")
+
+        async def run():
+            conn = make_connector(
+                handler,
+                max_retries=2,
+                circuit_breaker=CircuitBreakerRegistry(failure_threshold=2, recovery_timeout=60)
+            )
+            with pytest.raises(ServerError):
+                await conn._request("GET", "/assets/1")
+            with pytest.raises(CircuitOpenError):
+                await conn._request("GET", "/assets/2")
+            await conn._client.aclose()
+            return conn
+
+        conn = asyncio.run(run())
+        assert len(calls) == 2
+        assert conn.circuit_breakers.states() == {"/assets": "open"}
+
+
+class TestAsyncHedging:
+    """Tests for hedged GET requests."""
+
+    @staticmethod
+    def make_policy(**kwargs):
+        """Create a policy primed with a 10ms latency for /assets and a full budget."""
+        policy = HedgingPolicy(min_samples=1, max_extra_ratio=1.0, **kwargs)
+        policy.record("/assets", 0.01)
+        return policy
+
+    def test_slow_request_is_hedged(self):
+        """Test that a backup request wins when the primary is slow."""
+        calls = []
+
+        async def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                await asyncio.sleep(1)
+            return httpx.Response(200, json={"attempt": len(calls)})
+
+        async def run():
+            conn = make_connector(handler, hedging=self.make_policy())
+            result = await conn._request("GET", "/assets/1")
+            await conn._client.aclose()
+            return conn, result
+
+        conn, result = asyncio.run(run())
+        assert result == {"attempt": 2}
+        assert conn.hedging.stats()["hedge_wins"] == 1
+
+    def test_fast_request_is_not_hedged(self):
+        """Test that no backup is sent when the primary answers in time."""
+        calls = []
+
+        async def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json={})
+
+        async def run():
+            conn = make_connector(handler, hedging=self.make_policy(min_delay=0.5))
+            await conn._request("GET", "/assets/1")
+            await conn._client.aclose()
+            return conn
+
+        conn = asyncio.run(run())
+        assert len(calls) == 1
+        assert conn.hedging.stats()["hedged"] == 0
+
+    def test_budget_caps_extra_requests(self):
+        """Test that hedges stop once the budget is spent."""
+        policy = HedgingPolicy(max_extra_ratio=0.5, min_samples=1)
+        policy.on_request()
+        assert not policy.try_hedge()
+        policy.on_request()
+        assert policy.try_hedge()
+        assert not policy.try_hedge()
+
+    def test_writes_are_never_hedged(self):
+        """Test that non-GET requests are sent once."""
+        calls = []
+
+        async def handler(request):
+            calls.append(request)
+            await asyncio.sleep(0.05)
+            return httpx.Response(201, json={})
+
+        async def run():
+            conn = make_connector(handler, hedging=self.make_policy())
+            await conn._request("POST", "/assets", json={"name": "x"})
+            await conn._client.aclose()
+
+        asyncio.run(run())
+        assert len(calls) == 1
+
+
+class TestAsyncHttp2:
+    """Tests for the HTTP/2 transport option."""
+
+    def test_http2_requires_h2(self):
+        """Test that a missing h2 package is reported clearly."""
+        with patch("collibra_connector.async_connector.H2_AVAILABLE", False):
+            with pytest.raises(ImportError, match="httpx\\[http2\\]"):
+                AsyncCollibraConnector(api="https://x", username="u", password="p", http2=True)
+
+    def test_http2_client_configuration(self):
+        """Test that HTTP/2 mode uses a few fully kept-alive connections."""
+        with patch("collibra_connector.async_connector.H2_AVAILABLE", True), \
+                patch("httpx.AsyncClient") as mock_client:
+            conn = AsyncCollibraConnector(
+                api="https://x", username="u", password="p",
+                http2=True, adaptive_concurrency=True
+            )
+            asyncio.run(conn.__aenter__())
+
+        kwargs = mock_client.call_args.kwargs
+        assert kwargs["http2"] is True
+        assert kwargs["limits"].max_connections == AsyncCollibraConnector.DEFAULT_HTTP2_CONNECTIONS
+        assert kwargs["limits"].max_keepalive_connections == AsyncCollibraConnector.DEFAULT_HTTP2_CONNECTIONS
+        assert conn.concurrency_limiter._max_limit == 400
+
+    def test_http11_is_default(self):
+        """Test that HTTP/1.1 keeps its previous pool sizing."""
+        with patch("httpx.AsyncClient") as mock_client:
+            conn = AsyncCollibraConnector(api="https://x", username="u", password="p")
+            asyncio.run(conn.__aenter__())
+
+        kwargs = mock_client.call_args.kwargs
+        assert kwargs["http2"] is False
+        assert kwargs["limits"].max_connections == 100
+        assert kwargs["limits"].max_keepalive_connections == 50
+        assert conn.http2 is False
+
+
+class TestAsyncGatherLimited:
+    """Tests for bounded gathering of batch coroutines."""
+
+    def test_adaptive_mode_bounds_running_coroutines(self):
+        """Test that the adaptive limiter's max_limit caps the coroutines started at once."""
+        conn = AsyncCollibraConnector(
+            api="https://x", username="u", password="p", adaptive_concurrency=True, max_connections=5
+        )
+        running = 0
+        peak = 0
+
+        async def item():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+            return True
+
+        results = asyncio.run(conn.gather_with_concurrency([item() for _ in range(50)]))
+        assert results == [True] * 50
+        assert peak == conn.concurrency_limiter.max_limit == 5
+
+
+class TestAsyncSessionAuth:
+    """Tests for session-cookie authentication in the async connector."""
+
+    def test_login_once_and_renew_on_401(self):
+        """Test that concurrent requests share one login and a 401 renews it."""
+        logins = []
+        seen = []
+
+        async def handler(request):
+            if request.url.path.endswith("/auth/sessions"):
+                logins.append(request)
+                session_id = f"s{len(logins)}"
+                return httpx.Response(
+                    200,
+                    json={"csrfToken": f"csrf-{session_id}"},
+                    headers={"Set-Cookie": f"JSESSIONID={session_id}; Path=/"}
+                )
+            seen.append(request)
+            assert "authorization" not in request.headers
+            if request.headers["cookie"] == "JSESSIONID=s1" and request.url.path.endswith("/expire"):
+                return httpx.Response(401, text="expired")
+            return httpx.Response(200, json={"csrf": request.headers.get("x-csrf-token")})
+
+        async def run():
+            conn = make_connector(handler, session_auth=True)
+            await asyncio.gather(*[conn._request("GET", "/assets/1") for _ in range(5)])
+            renewed = await conn._request("POST", "/expire", json={})
+            await conn._client.aclose()
+            return renewed
+
+        renewed = asyncio.run(run())
+        assert len(logins) == 2
+        assert renewed == {"csrf": "csrf-s2"}
+        assert all("x-csrf-token" not in r.headers for r in seen[:5])
+
+    def test_stream_renews_session_on_401(self):
+        """Test that a streaming request re-logs in once and replays after an expired session."""
+        logins = []
+        streamed = []
+
+        async def handler(request):
+            if request.url.path.endswith("/auth/sessions"):
+                logins.append(request)
+                return httpx.Response(
+                    200,
+                    json={"csrfToken": "csrf"},
+                    headers={"Set-Cookie": f"JSESSIONID=s{len(logins)}; Path=/"}
+                )
+            streamed.append(request.headers["cookie"])
+            if request.headers["cookie"] == "JSESSIONID=s1":
+                return httpx.Response(401, text="expired")
+            return httpx.Response(200, content=b"[]")
+
+        async def run():
+            conn = make_connector(handler, session_auth=True)
+            async with conn._stream("POST", "/outputModule/export/json", content=b"{}") as response:
+                body = await response.aread()
+            await conn._client.aclose()
+            return body
+
+        assert asyncio.run(run()) == b"[]"
+        assert len(logins) == 2
+        assert streamed == ["JSESSIONID=s1", "JSESSIONID=s2"]
+
+
+class TestAsyncOutputModule:
+    """Tests for streaming Output Module exports."""
+
+    def test_stream_json_yields_rows(self):
+        """Test that rows are parsed from a chunked response body."""
+        rows = [{"id": str(i)} for i in range(50)]
+        raw = json.dumps({"view": {"Asset": rows}}).encode()
+
+        async def body():
+            for i in range(0, len(raw), 13):
+                yield raw[i:i + 13]
+
+        async def handler(request):
+            assert request.url.params["validationEnabled"] == "true"
+            return httpx.Response(200, content=body())
+
+        async def run():
+            conn = make_connector(handler)
+            result = [
+                row async for row in conn.output_module.stream_json(
+                    {"ViewConfig": {}}, validation_enabled=True, path=("view", "Asset")
+                )
+            ]
+            await conn._client.aclose()
+            return result
+
+        assert asyncio.run(run()) == rows
+
+    def test_stream_json_error(self):
+        """Test that error statuses raise the mapped exception."""
+        async def handler(request):
+            return httpx.Response(403, text="nope")
+
+        async def run():
+            conn = make_connector(handler)
+            try:
+                with pytest.raises(ForbiddenError):
+                    async for _ in conn.output_module.stream_json("{}"):
+                        pass
+            finally:
+                await conn._client.aclose()
+
+        asyncio.run(run())
@@ -0,0 +1,690 @@
+"""Tests for the HTTP response caches."""
+from unittest.mock import Mock, patch
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from collibra_connector import AsyncCollibraConnector, CollibraConnector
+from collibra_connector.api.Exceptions import NotFoundError
+from collibra_connector.cache import (
+    ConditionalGetCache,
+    EntityCache,
+    NegativeCache,
+    ResponseCache,
+    cache_identity,
+    default_cache_path,
+    request_key,
+)
+
+
+def make_response(status_code, content=b"", headers=None):
+    """Create a mock requests response."""
+    return Mock(
+        status_code=status_code, content=content, text=content.decode(), headers=headers or {}, url="u", elapsed=None
+    )
+
+
+class TestConditionalGetCache:
+    """Tests for the conditional GET cache."""
+
+    def test_request_key_ignores_param_order(self):
+        """Test that params in a different order share a key."""
+        assert request_key("u", {"a": 1, "b": 2}) == request_key("u", {"b": 2, "a": 1})
+        assert request_key("u", {"a": 1}) != request_key("u", {"a": 2})
+
+    def test_store_requires_validators(self):
+        """Test that responses without ETag or Last-Modified are not stored."""
+        cache = ConditionalGetCache()
+        assert not cache.store(("u", "null"), b"{}", {"Content-Type": "application/json"})
+        assert cache.get(("u", "null")) is None
+
+    def test_validators(self):
+        """Test that stored validators become conditional headers."""
+        cache = ConditionalGetCache()
+        key = ("u", "null")
+        cache.store(key, b"{}", {"ETag": '"v1"', "Last-Modified": "Tue, 01 Oct 2024 10:00:00 GMT"})
+
+        entry, headers = cache.validators(key)
+        assert entry.content == b"{}"
+        assert headers == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Tue, 01 Oct 2024 10:00:00 GMT",
+        }
+
+    def test_no_store_is_respected(self):
+        """Test that Cache-Control: no-store responses are not cached."""
+        cache = ConditionalGetCache()
+        assert not cache.store(("u", "null"), b"{}", {"ETag": '"v1"', "Cache-Control": "no-store"})
+
+    def test_transfer_headers_are_dropped(self):
+        """Test that encoding headers of the original transfer are not replayed."""
+        cache = ConditionalGetCache()
+        cache.store(("u", "null"), b"{}", {"ETag": '"v1"', "Content-Encoding": "gzip", "Content-Length": "20"})
+        assert cache.get(("u", "null")).headers == {"ETag": '"v1"'}
+
+    def test_lru_eviction_by_entries(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = ConditionalGetCache(max_entries=2)
+        cache.store(("a", ""), b"1", {"ETag": "a"})
+        cache.store(("b", ""), b"2", {"ETag": "b"})
+        cache.get(("a", ""))
+        cache.store(("c", ""), b"3", {"ETag": "c"})
+
+        assert cache.get(("b", "")) is None
+        assert cache.get(("a", "")) is not None
+        assert cache.stats()["entries"] == 2
+
+    def test_eviction_by_bytes(self):
+        """Test that the total body size stays within max_bytes."""
+        cache = ConditionalGetCache(max_bytes=10)
+        cache.store(("a", ""), b"123456", {"ETag": "a"})
+        cache.store(("b", ""), b"123456", {"ETag": "b"})
+        assert cache.get(("a", "")) is None
+        assert cache.stats()["bytes"] == 6
+        assert not cache.store(("c", ""), b"x" * 11, {"ETag": "c"})
+
+    def test_invalidate_prefix(self):
+        """Test removing entries by URL prefix."""
+        cache = ConditionalGetCache()
+        cache.store(("https://x/assets/1", ""), b"1", {"ETag": "a"})
+        cache.store(("https://x/domains/1", ""), b"2", {"ETag": "b"})
+        assert cache.invalidate("https://x/assets") == 1
+        assert cache.stats() == {"entries": 1, "bytes": 1, "hits": 0, "misses": 0}
+        assert cache.invalidate() == 1
+
+    def test_invalid_max_entries(self):
+        """Test that the cache needs room for at least one entry."""
+        with pytest.raises(ValueError):
+            ConditionalGetCache(max_entries=0)
+
+
+class TestConnectorConditionalCache:
+    """Tests for conditional GETs in the sync connector."""
+
+    @pytest.fixture
+    def connector(self):
+        return CollibraConnector(
+            api="https://test.collibra.com",
+            username="testuser",
+            password="testpass",
+            conditional_cache=True
+        )
+
+    def test_disabled_by_default(self):
+        """Test that the cache is opt-in."""
+        conn = CollibraConnector(api="https://test.collibra.com", username="u", password="p")
+        assert conn.conditional_cache is None
+
+    def test_not_modified_served_from_cache(self, connector):
+        """Test that a 304 is returned as the cached 200 body."""
+        url = f"{connector.api}/assets/1"
+        body = b'{"id": "1", "name": "Orders"}'
+        with patch('requests.Session.request') as mock_request:
+            mock_request.side_effect = [
+                make_response(200, body, {"ETag": '"v1"', "Content-Type": "application/json"}),
+                make_response(304, headers={"ETag": '"v1"'}),
+            ]
+            first = connector._make_request("GET", url, params={"a": 1})
+            second = connector._make_request("GET", url, params={"a": 1})
+
+        assert first.content == body
+        assert second.status_code == 200
+        assert second.content == body
+        assert second.headers["content-type"] == "application/json"
+        assert connector.asset._handle_response(second) == {"id": "1", "name": "Orders"}
+        assert "If-None-Match" not in (mock_request.call_args_list[0].kwargs.get("headers") or {})
+        assert mock_request.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"v1"'
+        assert connector.conditional_cache.stats()["hits"] == 1
+
+    def test_changed_resource_replaces_entry(self, connector):
+        """Test that a new 200 replaces the cached body and validators."""
+        url = f"{connector.api}/assets/1"
+        with patch('requests.Session.request') as mock_request:
+            mock_request.side_effect = [
+                make_response(200, b'{"v": 1}', {"ETag": '"v1"'}),
+                make_response(200, b'{"v": 2}', {"ETag": '"v2"'}),
+            ]
+            connector._make_request("GET", url)
+            response = connector._make_request("GET", url)
+
+        assert response.content == b'{"v": 2}'
+        _, headers = connector.conditional_cache.validators(request_key(url))
+        assert headers == {"If-None-Match": '"v2"'}
+
+    def test_caller_headers_not_mutated(self, connector):
+        """Test that conditional headers are added to a copy of the caller's headers."""
+        url = f"{connector.api}/assets/1"
+        connector.conditional_cache.store(request_key(url), b"{}", {"ETag": '"v1"'})
+        headers = {"Accept": "application/json"}
+        with patch('requests.Session.request') as mock_request:
+            mock_request.return_value = make_response(304)
+            connector._make_request("GET", url, headers=headers)
+
+        assert headers == {"Accept": "application/json"}
+
+    def test_writes_and_streams_bypass_cache(self, connector):
+        """Test that only buffered GETs are revalidated."""
+        url = f"{connector.api}/assets/1"
+        connector.conditional_cache.store(request_key(url), b"{}", {"ETag": '"v1"'})
+        with patch('requests.Session.request') as mock_request:
+            mock_request.return_value = make_response(200, b"{}", {"ETag": '"v2"'})
+            connector._make_request("PATCH", url, data=b"{}")
+            connector._make_request("GET", url, stream=True)
+
+        for call in mock_request.call_args_list:
+            assert "If-None-Match" not in (call.kwargs.get("headers") or {})
+        assert connector.conditional_cache.stats()["misses"] == 0
+
+
+class TestAsyncConditionalCache:
+    """Tests for conditional GETs in the async connector."""
+
+    def test_not_modified_served_from_cache(self):
+        """Test that a 304 is decoded from the cached body."""
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json={"id": "1"}, headers={"ETag": '"v1"'})
+
+        connector = AsyncCollibraConnector(
+            api="https://test.collibra.com",
+            username="testuser",
+            password="testpass",
+            retry_delay=0,
+            conditional_cache=True
+        )
+        connector._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        async def run():
+            first = await connector._request("GET", "/assets/1")
+            second = await connector._request("GET", "/assets/1")
+            await connector._client.aclose()
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert first == second == {"id": "1"}
+        assert seen == [None, '"v1"']
+        assert connector.conditional_cache.stats()["hits"] == 1
+
+
+class TestResponseCache:
+    """Tests for the persistent SQLite response cache."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        cache = ResponseCache(str(tmp_path / "responses.sqlite3"))
+        yield cache
+        cache.close()
+
+    def test_round_trip(self, cache):
+        """Test that stored bodies and headers are returned."""
+        url = "https://x/rest/2.0/assets/1"
+        key = cache.key("GET", url, {"a": 1})
+        assert cache.get(key) is None
+        assert cache.set(key, url, b'{"id": "1"}', {"Content-Type": "application/json", "Content-Encoding": "gzip"})
+
+        entry = cache.get(key)
+        assert entry.content == b'{"id": "1"}'
+        assert entry.headers == {"Content-Type": "application/json"}
+        assert cache.stats() == {"entries": 1, "bytes": 11, "hits": 1, "misses": 1}
+
+    def test_key_includes_params_and_body(self):
+        """Test that requests differing in params or body get different keys."""
+        assert ResponseCache.key("GET", "u", {"a": 1, "b": 2}) == ResponseCache.key("get", "u", {"b": 2, "a": 1})
+        assert ResponseCache.key("GET", "u", {"a": 1}) != ResponseCache.key("GET", "u", {"a": 2})
+        assert ResponseCache.key("POST", "u", None, {"q": 1}) != ResponseCache.key("POST", "u", None, {"q": 2})
+
+    def test_key_includes_identity(self):
+        """Test that the same request made by different users gets different keys."""
+        alice = cache_identity("https://x", "alice")
+        bob = cache_identity("https://x", "bob")
+        assert alice != bob
+        assert alice == cache_identity("https://x/", "alice")
+        assert ResponseCache.key("GET", "u", None, None, alice) != ResponseCache.key("GET", "u", None, None, bob)
+
+    def test_per_endpoint_ttls(self, tmp_path):
+        """Test that metadata lives longer and a TTL of 0 disables caching."""
+        cache = ResponseCache(str(tmp_path / "c.sqlite3"), ttl=60, ttls={"/users": 0})
+        assert cache.ttl_for("https://x/rest/2.0/assetTypes?limit=10") == 3600
+        assert cache.ttl_for("https://x/rest/2.0/assets/1") == 60
+        assert not cache.set(cache.key("GET", "https://x/rest/2.0/users"), "https://x/rest/2.0/users", b"{}")
+        cache.close()
+
+    def test_expired_entries_are_misses(self, cache):
+        """Test that entries are not served after their TTL."""
+        url = "https://x/rest/2.0/assets/1"
+        key = cache.key("GET", url)
+        with patch("collibra_connector.cache.time.time", return_value=1000.0):
+            cache.set(key, url, b"{}", ttl=10)
+        with patch("collibra_connector.cache.time.time", return_value=1011.0):
+            assert cache.get(key) is None
+        assert cache.stats()["entries"] == 0
+
+    def test_size_cap_evicts_least_recently_used(self, tmp_path):
+        """Test that the least recently read entries are evicted past max_bytes."""
+        cache = ResponseCache(str(tmp_path / "c.sqlite3"), max_bytes=10)
+        now = time.time()
+        step = ResponseCache.ACCESS_RESOLUTION
+        with patch("collibra_connector.cache.time.time", side_effect=[now, now + step, now + 2 * step, now + 3 * step]):
+            cache.set("a", "https://x/rest/2.0/assets/a", b"12345")
+            cache.set("b", "https://x/rest/2.0/assets/b", b"12345")
+            cache.get("a")
+            cache.set("c", "https://x/rest/2.0/assets/c", b"12345")
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        cache.close()
+
+    def test_hits_rarely_write(self, cache):
+        """Test that a hit only refreshes the LRU position once per ACCESS_RESOLUTION."""
+        url = "https://x/rest/2.0/assets/1"
+        with patch("collibra_connector.cache.time.time", return_value=1000.0):
+            cache.set("k", url, b"{}")
+        accessed = lambda: cache._db.execute("SELECT accessed_at FROM responses").fetchone()[0]
+        with patch("collibra_connector.cache.time.time", return_value=1001.0):
+            assert cache.get("k") is not None
+        assert accessed() == 1000.0
+        with patch("collibra_connector.cache.time.time", return_value=1000.0 + cache.ACCESS_RESOLUTION):
+            assert cache.get("k") is not None
+        assert accessed() == 1000.0 + cache.ACCESS_RESOLUTION
+
+    def test_size_is_tracked_without_rescanning(self, tmp_path):
+        """Test that stores under the cap do not recount the file, and eviction corrects the total."""
+        cache = ResponseCache(str(tmp_path / "c.sqlite3"), max_bytes=10)
+        with patch.object(cache, "_evict", wraps=cache._evict) as evict:
+            cache.set("a", "https://x/rest/2.0/assets/a", b"1234")
+            cache.set("b", "https://x/rest/2.0/assets/b", b"1234")
+            evict.assert_not_called()
+            cache.set("c", "https://x/rest/2.0/assets/c", b"1234")
+            evict.assert_called_once()
+        assert cache._total == cache.stats()["bytes"] == 8
+        cache.close()
+
+    def test_invalidate(self, cache):
+        """Test invalidation by family, URL prefix and in full."""
+        for url in ("https://x/rest/2.0/assets/1", "https://x/rest/2.0/assets/2", "https://x/rest/2.0/domains/1"):
+            cache.set(cache.key("GET", url), url, b"{}")
+        assert cache.invalidate_related("https://x/rest/2.0/assets/9/tags") == 2
+        assert cache.invalidate(url_prefix="https://x/rest/2.0/dom") == 1
+        cache.set(cache.key("GET", "https://x/rest/2.0/roles"), "https://x/rest/2.0/roles", b"{}")
+        assert cache.invalidate() == 1
+
+    def test_invalidate_related_drops_derived_families(self, cache):
+        """Test that asset, attribute and relation writes also drop search and export results."""
+        for family in ("/search", "/outputModule/export/json", "/roles"):
+            url = f"https://x/rest/2.0{family}"
+            cache.set(cache.key("GET", url), url, b"{}")
+        assert cache.invalidate_related("https://x/rest/2.0/attributes/1") == 2
+        assert cache.get(cache.key("GET", "https://x/rest/2.0/roles")) is not None
+
+    def test_shared_between_instances(self, tmp_path):
+        """Test that a second process-like instance starts warm from the same file."""
+        path = str(tmp_path / "c.sqlite3")
+        url = "https://x/rest/2.0/statuses"
+        first = ResponseCache(path)
+        first.set(first.key("GET", url), url, b'{"results": []}')
+        first.close()
+
+        second = ResponseCache(path)
+        assert second.get(second.key("GET", url)).content == b'{"results": []}'
+        second.close()
+
+    def test_default_path_respects_env(self, monkeypatch, tmp_path):
+        """Test that COLLIBRA_CACHE_DIR selects the cache directory."""
+        monkeypatch.setenv("COLLIBRA_CACHE_DIR", str(tmp_path))
+        assert default_cache_path() == str(tmp_path / "responses.sqlite3")
+
+
+class TestConnectorResponseCache:
+    """Tests for the response cache beneath BaseAPI."""
+
+    @pytest.fixture
+    def connector(self, tmp_path):
+        return CollibraConnector(
+            api="https://test.collibra.com",
+            username="testuser",
+            password="testpass",
+            response_cache=str(tmp_path / "responses.sqlite3")
+        )
+
+    def test_get_served_from_disk(self, connector):
+        """Test that a repeated GET does not reach the server."""
+        with patch('requests.Session.request') as mock_request:
+            mock_request.return_value = make_response(
+                200, b'{"results": [{"id": "s1"}]}', {"Content-Type": "application/json"}
+            )
+            first = connector.metadata.get_statuses()
+            second = connector.metadata.get_statuses()
+
+        assert first == second == {"results": [{"id": "s1"}]}
+        assert mock_request.call_count == 1
+
+    def test_search_is_cached_by_body(self, connector):
+        """Test that read-only search POSTs are cached per query."""
+        with patch('requests.Session.request') as mock_request:
+            mock_request.return_value = make_response(200, b'{"total": 0, "results": []}')
+            connector.search.find("orders")
+            connector.search.find("orders")
+            connector.search.find("customers")
+
+        assert mock_request.call_count == 2
+
+    def test_errors_are_not_cached(self, connector):
+        """Test that only 200 responses are stored."""
+        with patch('requests.Session.request') as mock_request:
+            mock_request.return_value = make_response(404, b"missing")
+            connector.domain._get(url=f"{connector.api}/domains/1")
+            connector.domain._get(url=f"{connector.api}/domains/1")
+
+        assert mock_request.call_count == 2
+
+    def test_writes_invalidate_family(self, connector):
+        """Test that a write drops cached reads of the same endpoint family."""
+        url = f"{connector.api}/assets/1"
+        with patch('requests.Session.request') as mock_request:
+            mock_request.return_value = make_response(200, b'{"id": "1"}')
+            connector.asset._get(url=url)
+            connector.asset._patch(url=url, data={"name": "x"})
+            connector.asset._get(url=url)
+
+        assert [call.args[0] for call in mock_request.call_args_list] == ["GET", "PATCH", "GET"]
+
+    def test_shared_file_is_scoped_per_user(self, connector):
+        """Test that a cache file shared by two accounts never serves one user's reads to the other."""
+        other = CollibraConnector(
+            api="https://test.collibra.com",
+            username="otheruser",
+            password="testpass",
+            response_cache=connector.response_cache
+        )
+        with patch('requests.Session.request') as mock_request:
+            mock_request.return_value = make_response(200, b'{"results": []}')
+            connector.metadata.get_statuses()
+            other.metadata.get_statuses()
+            connector.metadata.get_statuses()
+
+        assert mock_request.call_count == 2
+
+
+class TestAsyncResponseCache:
+    """Tests for the response cache beneath AsyncBaseAPI."""
+
+    def test_get_served_from_disk_and_invalidated(self, tmp_path):
+        """Test that repeated GETs hit the cache until a write to the family."""
+        calls = []
+
+        def handler(request):
+            calls.append(request.method)
+            return httpx.Response(200, json={"id": "1"})
+
+        connector = AsyncCollibraConnector(
+            api="https://test.collibra.com",
+            username="testuser",
+            password="testpass",
+            response_cache=str(tmp_path / "responses.sqlite3")
+        )
+        connector._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        async def run():
+            first = await connector.domain._get("/domains/1")
+            second = await connector.domain._get("/domains/1")
+            await connector.domain._patch("/domains/1", {"name": "x"})
+            await connector.domain._get("/domains/1")
+            await connector._client.aclose()
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert first == second == {"id": "1"}
+        assert calls == ["GET", "PATCH", "GET"]
+
+
+ASSET_ID = "00000000-0000-0000-0000-00000000000a"
+DOMAIN_ID = "00000000-0000-0000-0000-00000000000d"
+
+
+class TestEntityCache:
+    """Tests for the entity cache."""
+
+    def test_get_returns_copies(self):
+        """Test that callers cannot modify cached entities."""
+        cache = EntityCache()
+        cache.put("asset", "a", {"id": "a", "name": "x"})
+        entity = cache.get("asset", "a")
+        entity["name"] = "changed"
+        assert cache.get("asset", "a")["name"] == "x"
+        assert cache.stats() == {"entries": 1, "hits": 2, "misses": 0}
+
+    def test_lru_and_ttl(self):
+        """Test eviction by size and expiry by TTL."""
+        cache = EntityCache(max_entries=2, ttl=10)
+        with patch("collibra_connector.cache.time.monotonic", return_value=100.0):
+            cache.put("asset", "a", {"id": "a"})
+            cache.put("asset", "b", {"id": "b"})
+            cache.get("asset", "a")
+            cache.put("asset", "c", {"id": "c"})
+            assert cache.get("asset", "b") is None
+            assert cache.get("asset", "a") is not None
+        with patch("collibra_connector.cache.time.monotonic", return_value=111.0):
+            assert cache.get("asset", "a") is None
+
+    def test_invalidate_drops_referencing_entities(self):
+        """Test that changing a domain drops cached assets embedding it."""
+        cache = EntityCache()
+        cache.put("domain", "d", {"id": "d", "name": "Sales"})
+        cache.put("asset", "a", {"id": "a", "domain": {"id": "d", "name": "Sales"}})
+        cache.put("asset", "b", {"id": "b", "domain": {"id": "other"}})
+
+        assert cache.invalidate("domain", "d") == 2
+        assert cache.get("asset", "b") is not None
+        assert cache.invalidate("asset") == 1
+
+    def test_read_racing_a_write_is_not_stored(self):
+        """Test that a read started before a write is discarded."""
+        cache = EntityCache()
+        generation = cache.generation
+        cache.invalidate("asset", "a")
+        assert not cache.put("asset", "a", {"id": "a"}, generation)
+        assert cache.get("asset", "a") is None
+
+
+class TestConnectorEntityCache:
+    """Tests for the entity cache in the sync connector."""
+
+    @pytest.fixture
+    def connector(self):
+        return CollibraConnector(
+            api="https://test.collibra.com",
+            username="testuser",
+            password="testpass",
+            entity_cache=True
+        )
+
+    def test_get_asset_cached(self, connector):
+        """Test that repeated lookups are served from memory."""
+        with patch('requests.Session.request') as mock_request:
+            mock_request.return_value = make_response(200, b'{"id": "%s", "name": "Orders"}' % ASSET_ID.encode())
+            connector.asset.get_asset(ASSET_ID)
+            asset = connector.asset.get_asset(ASSET_ID)
+
+        assert asset["name"] == "Orders"
+        assert mock_request.call_count == 1
+
+    def test_change_writes_through(self, connector):
+        """Test that an update replaces the cached entity with the API's result."""
+        with patch('requests.Session.request') as mock_request:
+            mock_request.side_effect = [
+                make_response(200, b'{"id": "%s", "name": "Old"}' % DOMAIN_ID.encode()),
+                make_response(200, b'{"id": "%s", "name": "New"}' % DOMAIN_ID.encode()),
+            ]
+            connector.domain.get_domain(DOMAIN_ID)
+            connector.domain.change_domain(DOMAIN_ID, name="New")
+            domain = connector.domain.get_domain(DOMAIN_ID)
+
+        assert domain["name"] == "New"
+        assert mock_request.call_count == 2
+
+    def test_remove_invalidates(self, connector):
+        """Test that a removed asset is fetched again."""
+        with patch('requests.Session.request') as mock_request:
+            mock_request.side_effect = [
+                make_response(200, b'{"id": "%s"}' % ASSET_ID.encode()),
+                make_response(204),
+                make_response(404, b"gone"),
+            ]
+            connector.asset.get_asset(ASSET_ID)
+            connector.asset.remove_asset(ASSET_ID)
+            with pytest.raises(NotFoundError):
+                connector.asset.get_asset(ASSET_ID)
+
+
+class TestAsyncEntityCache:
+    """Tests for the entity cache in the async connector."""
+
+    def test_get_and_change_asset(self):
+        """Test caching and write-through in the async connector."""
+        calls = []
+
+        def handler(request):
+            calls.append(request.method)
+            name = "New" if request.method == "PATCH" else "Old"
+            return httpx.Response(200, json={
+                "id": ASSET_ID,
+                "name": name,
+                "type": {"id": "t", "name": "Column"},
+                "status": {"id": "s", "name": "Accepted"},
+                "domain": {"id": DOMAIN_ID, "name": "Sales"},
+            })
+
+        connector = AsyncCollibraConnector(
+            api="https://test.collibra.com",
+            username="testuser",
+            password="testpass",
+            entity_cache=True
+        )
+        connector._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        async def run():
+            await connector.asset.get_asset(ASSET_ID)
+            first = await connector.asset.get_asset(ASSET_ID)
+            await connector.asset.change_asset(ASSET_ID, name="New")
+            second = await connector.asset.get_asset(ASSET_ID)
+            await connector._client.aclose()
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert (first.name, second.name) == ("Old", "New")
+        assert calls == ["GET", "PATCH"]
+
+
+class TestNegativeCache:
+    """Tests for negative caching of 404 lookups."""
+
+    def test_ttl_and_bound(self):
+        """Test that misses expire and the cache stays bounded."""
+        cache = NegativeCache(ttl=10, max_entries=2)
+        with patch("collibra_connector.cache.time.monotonic", return_value=100.0):
+            for key in ("a", "b", "c"):
+                cache.add((key, "null"))
+            assert not cache.hit(("a", "null"))
+            assert cache.hit(("c", "null"))
+        with patch("collibra_connector.cache.time.monotonic", return_value=111.0):
+            assert not cache.hit(("c", "null"))
+
+    def test_invalidate_family(self):
+        """Test that invalidation is scoped to the endpoint family."""
+        cache = NegativeCache()
+        cache.add(("https://x/rest/2.0/assets/1", "null"))
+        cache.add(("https://x/rest/2.0/users/1", "null"))
+        assert cache.invalidate("https://x/rest/2.0/assets") == 1
+        assert cache.hit(("https://x/rest/2.0/users/1", "null"))
+        assert cache.invalidate("https://x/rest/2.0/assets") == 0
+        assert cache.stats()["entries"] == 1
+
+    def test_scoped_by_identity(self):
+        """Test that a 404 seen by one caller is not served to another, and writes clear both."""
+        cache = NegativeCache()
+        key = ("https://x/rest/2.0/assets/1", "null")
+        cache.add(key, "alice")
+        assert cache.hit(key, "alice")
+        assert not cache.hit(key, "bob")
+        cache.add(key, "bob")
+        assert cache.invalidate("https://x/rest/2.0/assets/2") == 2
+        assert not cache.hit(key, "alice")
+
+    def test_sync_misses_not_shared_between_users(self):
+        """Test that connectors of different users sharing a cache each reach the server."""
+        shared = NegativeCache()
+        connectors = [
+            CollibraConnector(api="https://test.collibra.com", username=name, password="p", negative_cache=shared)
+            for name in ("u", "v")
+        ]
+        with patch('requests.Session.request') as mock_request:
+            mock_request.return_value = make_response(404, b"missing")
+            for connector in connectors + connectors:
+                with pytest.raises(NotFoundError):
+                    connector.asset.get_asset(ASSET_ID)
+        assert mock_request.call_count == 2
+
+    def test_sync_repeated_miss_is_local(self):
+        """Test that a repeated 404 lookup does not reach the server until a write."""
+        connector = CollibraConnector(
+            api="https://test.collibra.com", username="u", password="p", negative_cache=True
+        )
+        with patch('requests.Session.request') as mock_request:
+            mock_request.return_value = make_response(404, b"missing")
+            for _ in range(3):
+                with pytest.raises(NotFoundError):
+                    connector.asset.get_asset(ASSET_ID)
+            assert mock_request.call_count == 1
+
+            mock_request.return_value = make_response(201, b'{"id": "%s"}' % ASSET_ID.encode())
+            connector.asset.add_asset(name="x", domain_id=DOMAIN_ID, _id=ASSET_ID)
+            mock_request.return_value = make_response(404, b"missing")
+            with pytest.raises(NotFoundError):
+                connector.asset.get_asset(ASSET_ID)
+            assert mock_request.call_count == 3
+
+    def test_username_misses_are_cached(self):
+        """Test that unknown usernames are looked up once."""
+        connector = CollibraConnector(
+            api="https://test.collibra.com", username="u", password="p", negative_cache=True
+        )
+        with patch('requests.Session.request') as mock_request:
+            mock_request.return_value = make_response(200, b'{"total": 0, "results": []}')
+            assert connector.user.get_user_by_username("departed") is None
+            assert connector.user.get_user_by_username("departed") is None
+        assert mock_request.call_count == 1
+
+    def test_shared_with_async_connector(self):
+        """Test that a miss recorded by the sync connector is honored by the async one."""
+        shared = NegativeCache()
+        sync_connector = CollibraConnector(
+            api="https://test.collibra.com", username="u", password="p", negative_cache=shared
+        )
+        with patch('requests.Session.request') as mock_request:
+            mock_request.return_value = make_response(404, b"missing")
+            with pytest.raises(NotFoundError):
+                sync_connector.domain.get_domain(DOMAIN_ID)
+
+        def handler(request):
+            raise AssertionError("request should not be sent")
+
+        connector = AsyncCollibraConnector(
+            api="https://test.collibra.com", username="u", password="p", negative_cache=shared
+        )
+        connector._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        async def run():
+            try:
+                with pytest.raises(NotFoundError):
+                    await connector.domain.get_domain(DOMAIN_ID)
+            finally:
+                await connector._client.aclose()
+
+        asyncio.run(run())
@@ -0,0 +1,163 @@
+"""Tests for JSON codecs and compression negotiation."""
+from unittest.mock import Mock, patch
+
+import json
+import random
+
+import pytest
+
+from collibra_connector import CollibraConnector
+from collibra_connector.codec import (
+    ORJSON_AVAILABLE,
+    JSONArrayStream,
+    JSONCodec,
+    OrjsonCodec,
+    accept_encoding,
+    get_json_codec,
+)
+
+
+@pytest.fixture
+def connector():
+    """Create a connector using the standard library codec."""
+    return CollibraConnector(
+        api="https://test.collibra.com",
+        username="testuser",
+        password="testpass",
+        json_codec="json"
+    )
+
+
+class TestJSONCodec:
+    """Tests for codec resolution and round trips."""
+
+    def test_stdlib_round_trip(self):
+        """Test that the stdlib codec encodes compact UTF-8 bytes."""
+        codec = JSONCodec()
+        payload = {"name": "Café", "ids": [1, 2]}
+        encoded = codec.dumps(payload)
+        assert isinstance(encoded, bytes)
+        assert b" " not in encoded
+        assert codec.loads(encoded) == payload
+
+    @pytest.mark.skipif(not ORJSON_AVAILABLE, reason="orjson not installed")
+    def test_orjson_round_trip(self):
+        """Test that orjson produces the same documents as the stdlib codec."""
+        payload = {"results": [{"id": "a", "value": 1.5, "flag": True, "none": None}]}
+        assert OrjsonCodec().loads(JSONCodec().dumps(payload)) == payload
+        assert JSONCodec().loads(OrjsonCodec().dumps(payload)) == payload
+
+    def test_resolution(self):
+        """Test codec names and instances."""
+        custom = JSONCodec()
+        assert get_json_codec(custom) is custom
+        assert type(get_json_codec("json")) is JSONCodec
+        expected = OrjsonCodec if ORJSON_AVAILABLE else JSONCodec
+        assert type(get_json_codec(None)) is expected
+        with pytest.raises(ValueError):
+            get_json_codec("yaml")
+
+    def test_invalid_json_raises_value_error(self):
+        """Test that decode errors are ValueErrors for every codec."""
+        with pytest.raises(ValueError):
+            get_json_codec().loads(b"{not json")
+
+    def test_accept_encoding(self):
+        """Test that gzip is always requested."""
+        assert accept_encoding().startswith("gzip, deflate")
+
+
+class TestConnectorCodec:
+    """Tests for codec use in the sync transport."""
+
+    def test_handle_response_uses_codec(self, connector):
+        """Test that responses are decoded from raw bytes by the connector codec."""
+        codec = Mock(spec=JSONCodec)
+        codec.loads.return_value = {"id": "1"}
+        response = Mock(status_code=200, content=b'{"id": "1"}')
+
+        with patch.object(CollibraConnector, "json_codec", codec):
+            assert connector.asset._handle_response(response) == {"id": "1"}
+        codec.loads.assert_called_once_with(b'{"id": "1"}')
+
+    def test_blank_response_is_empty_dict(self, connector):
+        """Test that whitespace-only bodies are treated as empty."""
+        response = Mock(status_code=200, content=b"  \n")
+        assert connector.asset._handle_response(response) == {}
+
+    def test_json_payload_encoded_once(self, connector):
+        """Test that request bodies are encoded by the codec before sending."""
+        with patch('requests.Session.request') as mock_request:
+            mock_request.return_value = Mock(status_code=201, headers={})
+            connector._make_request("POST", f"{connector.api}/assets", json={"name": "x"})
+
+        kwargs = mock_request.call_args.kwargs
+        assert "json" not in kwargs
+        assert kwargs["data"] == b'{"name":"x"}'
+        assert kwargs["headers"]["Content-Type"] == "application/json"
+
+    def test_session_requests_compression(self, connector):
+        """Test that the pooled session asks for compressed responses."""
+        assert connector._get_session().headers["Accept-Encoding"] == accept_encoding()
+
+
+class TestJSONArrayStream:
+    """Tests for incremental array splitting."""
+
+    DOCUMENT = {
+        "meta": {"columns": ["a", "b"], "note": "quotes \\\" and [brackets], {braces}"},
+        "view": {"Asset": [
+            {"id": i, "name": f"n\\\"{i},]", "nested": {"list": [1, {"k": "]"}]}}
+            for i in range(30)
+        ]},
+        "after": [9],
+    }
+
+    def feed_randomly(self, stream, raw):
+        items = []
+        position = 0
+        while position < len(raw):
+            size = random.randint(1, 16)
+            items.extend(stream.feed(raw[position:position + size]))
+            position += size
+        stream.close()
+        return [json.loads(item) for item in items]
+
+    def test_path_selects_array_across_chunk_boundaries(self):
+        """Test that items are identical regardless of how the input is chunked."""
+        raw = json.dumps(self.DOCUMENT).encode()
+        for _ in range(20):
+            assert self.feed_randomly(JSONArrayStream(("view", "Asset")), raw) == self.DOCUMENT["view"]["Asset"]
+
+    def test_default_is_first_array(self):
+        """Test that without a path the first array is streamed."""
+        raw = json.dumps(self.DOCUMENT).encode()
+        assert self.feed_randomly(JSONArrayStream(), raw) == ["a", "b"]
+
+    def test_scalar_and_empty_arrays(self):
+        """Test scalar items and empty arrays."""
+        stream = JSONArrayStream()
+        assert stream.feed(b'{"aaData": [1, "a,b", null , true]}') == [b"1", b'"a,b"', b"null", b"true"]
+        stream = JSONArrayStream()
+        assert stream.feed(b"[ ]") == []
+        stream.close()
+
+    def test_buffer_stays_bounded(self):
+        """Test that consumed items are released from the buffer."""
+        stream = JSONArrayStream()
+        stream.feed(b"[")
+        for i in range(1000):
+            stream.feed(b'{"id": %d, "padding": "%s"},' % (i, b"x" * 100))
+        assert len(stream._buf) < 200
+        assert stream.count == 1000
+
+    def test_missing_or_truncated_array(self):
+        """Test errors for documents without a complete target array."""
+        stream = JSONArrayStream(("view", "Asset"))
+        stream.feed(b'{"view": {"Domain": []}}')
+        with pytest.raises(ValueError):
+            stream.close()
+        stream = JSONArrayStream()
+        stream.feed(b'[{"id": 1}, {"id"')
+        with pytest.raises(ValueError):
+            stream.close()
@@ -1,10 +1,15 @@
 """Tests for the CollibraConnector class."""
+import threading
+import time
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 import requests
 
-from collibra_connector import CollibraConnector
+from collibra_connector import CircuitBreakerRegistry, CollibraConnector
+from collibra_connector.auth import SessionAuth
 from collibra_connector.api.Exceptions import (
+    CircuitOpenError,
     CollibraAPIError,
     UnauthorizedError,
     ForbiddenError,
@@ -105,6 +110,187 @@ class TestCollibraConnectorContextManager:
         assert connector.session is None
 
 
+class TestCollibraConnectorTransport:
+    """Tests for the pooled transport shared by all API modules."""
+
+    def test_session_created_lazily_and_reused(self):
+        """Test that requests outside a context manager reuse one pooled session."""
+        connector = CollibraConnector(
+            api="https://test.collibra.com",
+            username="testuser",
+            password="testpass"
+        )
+
+        with patch('requests.Session.request') as mock_request:
+            mock_request.return_value = Mock(status_code=200)
+
+            connector._make_request("GET", "https://test.com/api")
+            session = connector.session
+            connector._make_request("GET", "https://test.com/api")
+
+            assert session is not None
+            assert connector.session is session
+            assert mock_request.call_count == 2
+
+    def test_pool_configuration(self):
+        """Test that the HTTP adapter uses the configured pool size."""
+        connector = CollibraConnector(
+            api="https://test.collibra.com",
+            username="testuser",
+            password="testpass",
+            pool_connections=4,
+            pool_maxsize=32
+        )
+
+        with connector as conn:
+            adapter = conn.session.get_adapter("https://test.collibra.com")
+            assert adapter._pool_connections == 4
+            assert adapter._pool_maxsize == 32
+
+    def test_close_releases_session(self):
+        """Test that close() drops the session and a new one is opened on demand."""
+        connector = CollibraConnector(
+            api="https://test.collibra.com",
+            username="testuser",
+            password="testpass"
+        )
+
+        with connector:
+            first = connector.session
+        connector.close()
+        assert connector.session is None
+
+        with connector:
+            assert connector.session is not first
+
+    def test_base_api_routes_through_make_request(self):
+        """Test that BaseAPI verbs use the connector transport with retries."""
+        connector = CollibraConnector(
+            api="https://test.collibra.com",
+            username="testuser",
+            password="testpass"
+        )
+
+        with patch.object(connector, '_make_request') as mock_request:
+            mock_request.return_value = Mock(status_code=200)
+
+            connector.asset._get(url="https://test.com/api", params={"limit": 1})
+            connector.asset._post(url="https://test.com/api", data={"name": "x"})
+
+            methods = [call.args[0] for call in mock_request.call_args_list]
+            assert methods == ["GET", "POST"]
+            assert mock_request.call_args_list[0].kwargs["params"] == {"limit": 1}
+            assert mock_request.call_args_list[1].kwargs["json"] == {"name": "x"}
+
+
+class TestCollibraConnectorMap:
+    """Tests for thread-pool execution with map()."""
+
+    def test_map_preserves_order_and_collects_errors(self):
+        """Test that results are ordered and per-item errors are captured."""
+        connector = CollibraConnector(
+            api="https://test.collibra.com",
+            username="testuser",
+            password="testpass"
+        )
+
+        def work(value):
+            if value == 3:
+                raise ValueError("bad item")
+            time.sleep(0.001 * (5 - value))
+            return value * 10
+
+        result = connector.map(work, range(5), workers=4)
+
+        assert result.results == [0, 10, 20, None, 40]
+        assert result.errors[3] is not None
+        assert result.success_count == 4
+        assert result.error_count == 1
+        assert result.failures[0][0] == 3
+        with pytest.raises(ValueError, match="bad item"):
+            result.raise_for_errors()
+
+    def test_map_threads_get_own_sessions_sharing_one_pool(self):
+        """Test that worker threads use distinct sessions on a shared adapter."""
+        connector = CollibraConnector(
+            api="https://test.collibra.com",
+            username="testuser",
+            password="testpass"
+        )
+        barrier = threading.Barrier(3)
+
+        def grab_session(_):
+            session = connector._get_session()
+            barrier.wait(timeout=5)
+            return session
+
+        result = connector.map(grab_session, range(3), workers=3)
+        sessions = result.results
+
+        assert len({id(s) for s in sessions}) == 3
+        adapters = {id(s.get_adapter("https://test.collibra.com")) for s in sessions}
+        assert len(adapters) == 1
+
+    def test_map_progress_callback(self):
+        """Test that the progress callback sees every completion."""
+        connector = CollibraConnector(
+            api="https://test.collibra.com",
+            username="testuser",
+            password="testpass"
+        )
+        progress = []
+
+        connector.map(lambda x: x, range(6), workers=2,
+                      progress_callback=lambda done, total: progress.append((done, total)))
+
+        assert sorted(progress) == [(i, 6) for i in range(1, 7)]
+
+    def test_nested_map_runs_inline_in_worker(self):
+        """Test that map() called from a map() worker does not start another pool."""
+        connector = CollibraConnector(
+            api="https://test.collibra.com",
+            username="testuser",
+            password="testpass"
+        )
+
+        def profile(value):
+            outer = threading.get_ident()
+            inner = connector.map(lambda part: (part, threading.get_ident()), ["a", "b"], workers=2)
+            return [(part, thread == outer) for part, thread in inner.results]
+
+        result = connector.map(profile, range(3), workers=3)
+
+        assert result.results == [[("a", True), ("b", True)]] * 3
+
+    def test_shared_pool_reuses_threads(self):
+        """Test that shared_pool calls reuse the connector's worker threads until close()."""
+        connector = CollibraConnector(
+            api="https://test.collibra.com",
+            username="testuser",
+            password="testpass"
+        )
+        threads = set()
+        for _ in range(20):
+            result = connector.map(lambda _: threading.current_thread(), range(3), shared_pool=True)
+            threads.update(result.results)
+
+        assert len(threads) <= CollibraConnector.DEFAULT_WORKERS
+        assert all(thread.name.startswith("collibra-shared") for thread in threads)
+        executor = connector._get_executor()
+        connector.close()
+        assert connector._get_executor() is not executor
+
+    def test_map_rejects_invalid_workers(self):
+        """Test that workers must be positive."""
+        connector = CollibraConnector(
+            api="https://test.collibra.com",
+            username="testuser",
+            password="testpass"
+        )
+        with pytest.raises(ValueError, match="workers must be at least 1"):
+            connector.map(lambda x: x, [1], workers=0)
+
+
 class TestCollibraConnectorRepresentation:
     """Tests for string representations."""
 
@@ -140,7 +326,7 @@ class TestCollibraConnectorRetry:
             retry_delay=0.01  # Short delay for testing
         )
 
-        with patch('requests.request') as mock_request:
+        with patch('requests.Session.request') as mock_request:
             mock_request.side_effect = [
                 requests.ConnectionError("Connection failed"),
                 requests.ConnectionError("Connection failed"),
@@ -161,7 +347,7 @@ class TestCollibraConnectorRetry:
             retry_delay=0.01
         )
 
-        with patch('requests.request') as mock_request:
+        with patch('requests.Session.request') as mock_request:
             mock_request.side_effect = [
                 Mock(status_code=503),
                 Mock(status_code=503),
@@ -172,6 +358,24 @@ class TestCollibraConnectorRetry:
             assert response.status_code == 200
             assert mock_request.call_count == 3
 
+    def test_retried_responses_are_closed(self):
+        """Test that a response being retried releases its pooled connection."""
+        connector = CollibraConnector(
+            api="https://test.collibra.com",
+            username="testuser",
+            password="testpass",
+            max_retries=3,
+            retry_delay=0.01
+        )
+        failed = Mock(status_code=502, headers={})
+        ok = Mock(status_code=200, headers={})
+
+        with patch('requests.Session.request', side_effect=[failed, ok]):
+            assert connector._make_request("GET", "https://test.com/api", stream=True) is ok
+
+        failed.close.assert_called_once()
+        ok.close.assert_not_called()
+
     def test_no_retry_on_client_error(self):
         """Test that client errors (4xx except 429) don't trigger retry."""
         connector = CollibraConnector(
@@ -182,7 +386,7 @@ class TestCollibraConnectorRetry:
             retry_delay=0.01
         )
 
-        with patch('requests.request') as mock_request:
+        with patch('requests.Session.request') as mock_request:
             mock_request.return_value = Mock(status_code=404)
 
             response = connector._make_request("GET", "https://test.com/api")
@@ -199,7 +403,7 @@ class TestCollibraConnectorRetry:
             retry_delay=0.01
         )
 
-        with patch('requests.request') as mock_request:
+        with patch('requests.Session.request') as mock_request:
             mock_request.side_effect = [
                 Mock(status_code=429),
                 Mock(status_code=200),
@@ -210,6 +414,214 @@ class TestCollibraConnectorRetry:
             assert mock_request.call_count == 2
 
 
+    def test_retry_after_header_sets_delay(self):
+        """Test that a 429 Retry-After overrides exponential backoff."""
+        connector = CollibraConnector(
+            api="https://test.collibra.com",
+            username="testuser",
+            password="testpass",
+            max_retries=2,
+            retry_delay=10
+        )
+
+        with patch('requests.Session.request') as mock_request, patch('time.sleep') as mock_sleep:
+            mock_request.side_effect = [
+                Mock(status_code=429, headers={"Retry-After": "0"}),
+                Mock(status_code=200, headers={}),
+            ]
+
+            response = connector._make_request("GET", "https://test.com/api")
+
+            assert response.status_code == 200
+            mock_sleep.assert_called_once_with(0.0)
+            assert connector.rate_limiter.throttled_count == 1
+
+
+    def test_post_not_replayed_after_read_timeout(self):
+        """Test that a POST that may have reached the server is not sent twice."""
+        connector = CollibraConnector(
+            api="https://test.collibra.com",
+            username="testuser",
+            password="testpass",
+            max_retries=3,
+            retry_delay=0.01
+        )
+
+        with patch('requests.Session.request') as mock_request:
+            mock_request.side_effect = [requests.ReadTimeout("timed out"), Mock(status_code=201)]
+
+            with pytest.raises(requests.ReadTimeout):
+                connector._make_request("POST", "https://test.com/api/assets", json={"name": "A"})
+            assert mock_request.call_count == 1
+
+            mock_request.reset_mock(side_effect=True)
+            mock_request.side_effect = [Mock(status_code=502, headers={}), Mock(status_code=201)]
+            response = connector._make_request("PATCH", "https://test.com/api/assets/1", json={})
+            assert response.status_code == 502
+            assert mock_request.call_count == 1
+
+    def test_post_retried_when_not_applied(self):
+        """Test that a POST is retried after a connect timeout or a 429 with Retry-After."""
+        connector = CollibraConnector(
+            api="https://test.collibra.com",
+            username="testuser",
+            password="testpass",
+            max_retries=3,
+            retry_delay=0.01
+        )
+
+        with patch('requests.Session.request') as mock_request, patch('time.sleep'):
+            mock_request.side_effect = [
+                requests.ConnectTimeout("no connection"),
+                Mock(status_code=429, headers={"Retry-After": "0"}),
+                Mock(status_code=201, headers={}),
+            ]
+
+            response = connector._make_request("POST", "https://test.com/api/assets", json={"name": "A"})
+            assert response.status_code == 201
+            assert mock_request.call_count == 3
+
+
+class TestCollibraConnectorCircuitBreaker:
+    """Tests for per-endpoint circuit breaking."""
+
+    def test_open_circuit_fails_fast(self):
+        """Test that an outage stops requests for that endpoint family only."""
+        connector = CollibraConnector(
+            api="https://test.collibra.com",
+            username="testuser",
+            password="testpass",
+            max_retries=1,
+            circuit_breaker=CircuitBreakerRegistry(failure_threshold=2, recovery_timeout=60)
+        )
+        assets_url = f"{connector.api}/assets/123"
+
+        with patch('requests.Session.request') as mock_request:
+            mock_request.return_value = Mock(status_code=503, headers={})
+            connector._make_request("GET", assets_url)
+            connector._make_request("GET", assets_url)
+
+            with pytest.raises(CircuitOpenError) as exc_info:
+                connector._make_request("GET", assets_url)
+            assert exc_info.value.endpoint == "/assets"
+            assert mock_request.call_count == 2
+
+            mock_request.return_value = Mock(status_code=200, headers={})
+            response = connector._make_request("GET", f"{connector.api}/domains/1")
+            assert response.status_code == 200
+
+        assert connector.circuit_breakers.states() == {"/assets": "open", "/domains": "closed"}
+
+    def test_circuit_breaker_can_be_disabled(self):
+        """Test that circuit_breaker=False keeps the plain retry behaviour."""
+        connector = CollibraConnector(
+            api="https://test.collibra.com",
+            username="testuser",
+            password="testpass",
+            max_retries=1,
+            circuit_breaker=False
+        )
+        assert connector.circuit_breakers is None
+
+        with patch('requests.Session.request') as mock_request:
+            mock_request.return_value = Mock(status_code=503, headers={})
+            for _ in range(10):
+                connector._make_request("GET", f"{connector.api}/assets")
+            assert mock_request.call_count == 10
+
+
+class TestCollibraConnectorSessionAuth:
+    """Tests for session-cookie authentication."""
+
+    @staticmethod
+    def login_response(cookie="abc", csrf="token-1"):
+        """Build a mocked /auth/sessions response."""
+        response = Mock(status_code=200, headers={})
+        response.cookies.get_dict.return_value = {"JSESSIONID": cookie}
+        response.json.return_value = {"csrfToken": csrf}
+        return response
+
+    def test_session_auth_applies_cookie_and_csrf(self):
+        """Test that requests carry the session instead of Basic credentials."""
+        connector = CollibraConnector(
+            api="https://test.collibra.com",
+            username="testuser",
+            password="testpass",
+            session_auth=True
+        )
+        assert isinstance(connector.auth, SessionAuth)
+
+        with patch('requests.Session.post', autospec=True) as mock_login:
+            mock_login.return_value = self.login_response()
+            get = connector.auth(requests.Request("GET", f"{connector.api}/assets").prepare())
+            post = connector.auth(requests.Request("POST", f"{connector.api}/assets").prepare())
+            connector.auth(requests.Request("GET", f"{connector.api}/domains").prepare())
+
+        assert mock_login.call_count == 1
+        # Login reuses the connector's pooled session instead of a one-off connection
+        assert mock_login.call_args.args[0] is connector.session
+        assert mock_login.call_args.kwargs["json"] == {"username": "testuser", "password": "testpass"}
+        assert get.headers["Cookie"] == "JSESSIONID=abc"
+        assert "Authorization" not in get.headers
+        assert "X-CSRF-TOKEN" not in get.headers
+        assert post.headers["X-CSRF-TOKEN"] == "token-1"
+
+    def test_expired_session_is_renewed_and_replayed(self):
+        """Test that a 401 triggers one re-login and a replay of the request."""
+        auth = SessionAuth("https://test.collibra.com/rest/2.0", "testuser", "testpass")
+
+        with patch('collibra_connector.auth.requests.post') as mock_login:
+            mock_login.side_effect = [self.login_response("old"), self.login_response("new", "token-2")]
+            prepared = auth(requests.Request("DELETE", "https://test.collibra.com/rest/2.0/assets/1").prepare())
+
+            expired = requests.Response()
+            expired.status_code = 401
+            expired.request = prepared
+            expired._content = b""
+            expired.connection = Mock()
+            expired.connection.send.return_value = requests.Response()
+
+            replay = prepared.hooks["response"][0](expired)
+
+        assert mock_login.call_count == 2
+        replayed_request = expired.connection.send.call_args.args[0]
+        assert replayed_request.headers["Cookie"] == "JSESSIONID=new"
+        assert replayed_request.headers["X-CSRF-TOKEN"] == "token-2"
+        assert replayed_request.hooks["response"] == []
+        assert replay.history == [expired]
+
+    def test_failed_login_raises_unauthorized(self):
+        """Test that rejected credentials surface as UnauthorizedError."""
+        auth = SessionAuth("https://test.collibra.com/rest/2.0", "testuser", "wrong")
+
+        with patch('collibra_connector.auth.requests.post') as mock_login:
+            mock_login.return_value = Mock(status_code=401, headers={})
+            with pytest.raises(UnauthorizedError):
+                auth(requests.Request("GET", "https://test.collibra.com/rest/2.0/assets").prepare())
+
+    def test_close_logs_out(self):
+        """Test that close() ends the Collibra session."""
+        connector = CollibraConnector(
+            api="https://test.collibra.com",
+            username="testuser",
+            password="testpass",
+            session_auth=True
+        )
+
+        with patch('requests.Session.request') as mock_request:
+            mock_request.side_effect = [self.login_response(), Mock(status_code=204)]
+            connector.auth.get_token()
+            connector.close()
+
+        assert [call.args[0] for call in mock_request.call_args_list] == ["POST", "DELETE"]
+        logout = mock_request.call_args
+        assert logout.args[1].endswith("/auth/sessions/current")
+        prepared = logout.kwargs["auth"](requests.Request("DELETE", logout.args[1]).prepare())
+        assert prepared.headers["Cookie"] == "JSESSIONID=abc"
+        assert prepared.headers["X-CSRF-TOKEN"] == "token-1"
+        assert connector.auth.token is None
+
+
 class TestCollibraConnectorTestConnection:
     """Tests for test_connection method."""
 
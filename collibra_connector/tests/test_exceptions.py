@@ -7,6 +7,7 @@ from collibra_connector import (
     ForbiddenError,
     NotFoundError,
     ServerError,
+    CircuitOpenError,
 )
 
 
@@ -29,6 +30,14 @@ class TestExceptionHierarchy:
         """Test ServerError inherits from CollibraAPIError."""
         assert issubclass(ServerError, CollibraAPIError)
 
+    def test_circuit_open_error_is_server_error(self):
+        """Test CircuitOpenError inherits from ServerError."""
+        assert issubclass(CircuitOpenError, ServerError)
+        error = CircuitOpenError("/assets", retry_after=12.5)
+        assert error.endpoint == "/assets"
+        assert error.retry_after == 12.5
+        assert "/assets" in str(error)
+
     def test_collibra_error_is_exception(self):
         """Test CollibraAPIError inherits from Exception."""
         assert issubclass(CollibraAPIError, Exception)
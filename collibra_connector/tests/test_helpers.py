@@ -1,16 +1,30 @@
 """Tests for helper utilities."""
 import pytest
-from unittest.mock import Mock, MagicMock
+from unittest.mock import Mock, MagicMock, patch
+import asyncio
+import gc
+import json
+import threading
 import time
+import weakref
+import requests
 
 from collibra_connector import (
     Paginator,
     PaginatedResponse,
     BatchProcessor,
     BatchResult,
+    CachedMetadata,
+    AsyncCachedMetadata,
     DataTransformer,
+    DataFrameExporter,
+    StreamingExporter,
+    ArrowExporter,
+    IncrementalExporter,
     timed_cache,
 )
+from collibra_connector.cache import cache_identity
+from collibra_connector.helpers import METADATA_SNAPSHOT_VERSION
 
 
 class TestPaginatedResponse:
@@ -364,6 +378,525 @@ class TestDataTransformer:
         assert mapping == {"Item A": "1", "Item B": "2"}
 
 
+API_URL = "https://test.collibra.com/rest/2.0"
+
+
+def metadata_connector(pages=None, gate=None):
+    """Build a sync connector stub serving list endpoints for CachedMetadata."""
+    connector = Mock(api=API_URL, cache_identity=cache_identity(API_URL, "u"))
+    pages = {} if pages is None else pages
+    pages.setdefault("relationTypes", [{
+        "id": "relationTypes-1", "sourceType": {"name": "Term"}, "targetType": {"name": "Table"}
+    }])
+
+    def make_request(method, url, params=None):
+        if gate is not None:
+            gate.wait(5)
+        endpoint = url.rsplit("/", 1)[1]
+        items = pages.get(endpoint, [{"id": f"{endpoint}-1", "name": "Name"}])
+        page = items[params["offset"]:params["offset"] + params["limit"]]
+        response = Mock()
+        response.json.return_value = {"results": page, "total": len(items)}
+        return response
+
+    connector._make_request.side_effect = make_request
+    return connector
+
+
+class TestCachedMetadata:
+    """Tests for CachedMetadata."""
+
+    def test_first_lookup_fetches_all_pages(self):
+        """Test that a cold category is fetched synchronously, page by page."""
+        statuses = [{"id": f"s-{i}", "name": f"Status {i}"} for i in range(1500)]
+        connector = metadata_connector({"statuses": statuses})
+        cache = CachedMetadata(connector)
+
+        assert cache.get_status_id("Status 1499") == "s-1499"
+        assert connector._make_request.call_count == 2
+        assert cache.get_asset_type_id("Name") == "assetTypes-1"
+
+    def test_expired_category_served_stale_while_refreshing(self):
+        """Test that an expired category is returned at once and refreshed in the background."""
+        gate = threading.Event()
+        gate.set()
+        pages = {"roles": [{"id": "roles-1", "name": "Name"}]}
+        cache = CachedMetadata(metadata_connector(pages, gate), ttl=60)
+        assert cache.get_role_id("Name") == "roles-1"
+
+        gate.clear()
+        cache._expires["roles"] = 0
+        pages["roles"] = [{"id": "roles-2", "name": "Name"}]
+        assert cache.get_role_id("Name") == "roles-1"
+        thread = cache._threads["roles"]
+        assert cache.refresh_in_background("roles") is None
+        gate.set()
+        thread.join(5)
+
+        assert cache.get_role_id("Name") == "roles-2"
+
+    def test_failed_refresh_keeps_stale_data(self):
+        """Test that a failing refresh keeps serving the previous data."""
+        connector = metadata_connector()
+        cache = CachedMetadata(connector)
+        cache.get_status_id("Name")
+        connector._make_request.side_effect = ConnectionError("down")
+
+        cache._expires["statuses"] = 0
+        cache.get_status_id("Name")
+        cache._threads["statuses"].join(5)
+
+        assert cache.get_status_id("Name") == "statuses-1"
+        assert not cache._is_expired("statuses")
+
+    def test_warm_start_from_disk(self, tmp_path):
+        """Test that a saved cache is served by a new instance without requests."""
+        path = str(tmp_path / "metadata.json")
+        cache = CachedMetadata(metadata_connector(), path=path)
+        cache.refresh_all()
+
+        connector = metadata_connector()
+        warm = CachedMetadata(connector, path=path)
+        assert warm.get_domain_type_id("Name") == "domainTypes-1"
+        assert warm.get_relation_type_id("Term_Table") == "relationTypes-1"
+        connector._make_request.assert_not_called()
+
+    def test_file_from_other_instance_ignored(self, tmp_path):
+        """Test that a file written for another Collibra instance is not loaded."""
+        path = str(tmp_path / "metadata.json")
+        CachedMetadata(metadata_connector(), path=path).refresh_all()
+        other = metadata_connector()
+        other.api = "https://other.collibra.com/rest/2.0"
+
+        assert CachedMetadata(other, path=path).load() is False
+
+    def test_file_from_other_user_ignored(self, tmp_path):
+        """Test that a file written for another user of the same instance is not loaded."""
+        path = str(tmp_path / "metadata.json")
+        CachedMetadata(metadata_connector(), path=path).refresh_all()
+        other = metadata_connector()
+        other.cache_identity = cache_identity(API_URL, "v")
+
+        assert CachedMetadata(other, path=path).load() is False
+
+    def test_malformed_categories_skipped(self, tmp_path):
+        """Test that truncated or hand-edited entries are skipped instead of raising."""
+        path = tmp_path / "metadata.json"
+        connector = metadata_connector()
+        path.write_text(json.dumps({
+            "version": METADATA_SNAPSHOT_VERSION,
+            "api": connector.api,
+            "identity": connector.cache_identity,
+            "categories": {
+                "statuses": {"fetched_at": time.time(), "items": {"Name": "statuses-1"}},
+                "roles": {"items": {"Name": "roles-1"}},
+                "assetTypes": ["not", "an", "entry"],
+                "domainTypes": {"fetched_at": "yesterday", "items": {}},
+            },
+        }))
+        cache = CachedMetadata(connector, path=str(path))
+
+        assert cache.load() is True
+        assert set(cache._cache) == {"statuses"}
+        path.write_text(json.dumps({
+            "version": METADATA_SNAPSHOT_VERSION, "api": connector.api,
+            "identity": connector.cache_identity, "categories": None,
+        }))
+        assert cache.load() is False
+
+
+class TestAsyncCachedMetadata:
+    """Tests for AsyncCachedMetadata."""
+
+    def make_connector(self, calls):
+        connector = Mock(api=API_URL, cache_identity=cache_identity(API_URL, "u"))
+
+        async def request(method, endpoint, params=None):
+            calls.append(endpoint)
+            await asyncio.sleep(0.01)
+            name = endpoint.strip("/")
+            return {"results": [{"id": f"{name}-{len(calls)}", "name": "Name"}], "total": 1}
+
+        connector._request = request
+        return connector
+
+    def test_concurrent_cold_lookups_fetch_once(self):
+        """Test that concurrent first lookups of a category share one fetch."""
+        calls = []
+        cache = AsyncCachedMetadata(self.make_connector(calls))
+
+        async def run():
+            return await asyncio.gather(*(cache.get_status_id("Name") for _ in range(5)))
+
+        assert asyncio.run(run()) == ["statuses-1"] * 5
+        assert calls == ["/statuses"]
+
+    def test_stale_while_revalidate_and_disk(self, tmp_path):
+        """Test background refresh of an expired category and saving to disk."""
+        calls = []
+        path = str(tmp_path / "metadata.json")
+        cache = AsyncCachedMetadata(self.make_connector(calls), path=path)
+
+        async def run():
+            first = await cache.get_role_id("Name")
+            cache._expires["roles"] = 0
+            stale = await cache.get_role_id("Name")
+            await cache._tasks["roles"]
+            return first, stale, await cache.get_role_id("Name")
+
+        assert asyncio.run(run()) == ("roles-1", "roles-1", "roles-2")
+        warm = CachedMetadata(metadata_connector(), path=path)
+        assert warm._cache["roles"] == {"Name": "roles-2"}
+
+
+RELATION_TYPES = [
+    {
+        "id": "11111111-1111-1111-1111-111111111111", "role": "is source for", "coRole": "is target for",
+        "sourceType": {"name": "Table"}, "targetType": {"name": "Table"},
+    },
+    {
+        "id": "22222222-2222-2222-2222-222222222222", "role": "groups", "coRole": "is grouped by",
+        "sourceType": {"name": "Business Term"}, "targetType": {"name": "Column"},
+    },
+]
+
+
+def relation_types_response(url, params=None):
+    """Serve paginated /relationTypes responses."""
+    page = RELATION_TYPES[params["offset"]:params["offset"] + params["limit"]]
+    response = Mock()
+    response.json.return_value = {"results": page, "total": len(RELATION_TYPES)}
+    return response
+
+
+class TestRelationTypeRegistry:
+    """Tests for RelationTypeRegistry."""
+
+    @pytest.fixture
+    def connector(self):
+        from collibra_connector import CollibraConnector
+        return CollibraConnector(api="https://test.collibra.com", username="u", password="p")
+
+    def test_bulk_load_indexes_id_role_and_co_role(self, connector):
+        """Test that all pages are loaded once and indexed."""
+        registry = connector.relation_types
+        with patch.object(registry, "PAGE_SIZE", 1), \
+                patch.object(connector, "_make_request", side_effect=lambda m, url, params: relation_types_response(url, params)) as request:
+            assert registry.get(RELATION_TYPES[1]["id"])["role"] == "groups"
+            assert registry.by_role("Is Source For") == [RELATION_TYPES[0]]
+            assert registry.by_co_role("is grouped by") == [RELATION_TYPES[1]]
+            assert registry.resolve("is target for") == RELATION_TYPES[0]["id"]
+            assert registry.resolve("unknown") is None
+
+        assert request.call_count == 2
+
+    def test_unknown_id_fetched_individually(self, connector):
+        """Test that ids created after the bulk load are fetched and indexed."""
+        registry = connector.relation_types
+        extra = {"id": "33333333-3333-3333-3333-333333333333", "role": "uses", "coRole": "is used by"}
+        with patch.object(connector, "_make_request", side_effect=lambda m, url, params: relation_types_response(url, params)), \
+                patch.object(connector.relation, "get_relation_type", return_value=extra) as get_one:
+            assert registry.get(extra["id"]) == extra
+            assert registry.resolve("uses") == extra["id"]
+            assert registry.get(extra["id"]) == extra
+        get_one.assert_called_once()
+
+    def test_missing_id_remembered_for_miss_ttl(self, connector):
+        """Test that unknown or deleted ids are not refetched until the miss TTL expires."""
+        from collibra_connector.api.Exceptions import NotFoundError
+        registry = connector.relation_types
+        missing = "55555555-5555-5555-5555-555555555555"
+        with patch.object(connector, "_make_request", side_effect=lambda m, url, params: relation_types_response(url, params)), \
+                patch.object(connector.relation, "get_relation_type", side_effect=NotFoundError("gone")) as get_one:
+            registry.get(RELATION_TYPES[0]["id"])
+            now = time.monotonic()
+            with patch("collibra_connector.helpers.time.monotonic", return_value=now):
+                assert registry.get(missing) is None
+                assert registry.get(missing) is None
+            assert get_one.call_count == 1
+            with patch("collibra_connector.helpers.time.monotonic", return_value=now + registry.miss_ttl + 1):
+                assert registry.get(missing) is None
+            assert get_one.call_count == 2
+
+    def test_transient_errors_are_not_remembered(self, connector):
+        """Test that failures other than not found are retried on the next lookup."""
+        registry = connector.relation_types
+        missing = "55555555-5555-5555-5555-555555555555"
+        with patch.object(connector, "_make_request", side_effect=lambda m, url, params: relation_types_response(url, params)), \
+                patch.object(connector.relation, "get_relation_type", side_effect=ConnectionError) as get_one:
+            assert registry.get(missing) is None
+            assert registry.get(missing) is None
+        assert get_one.call_count == 2
+
+    def test_failed_bulk_load_falls_back_and_backs_off(self, connector):
+        """Test that a failed bulk load does not raise and is not retried on every lookup."""
+        registry = connector.relation_types
+        with patch.object(connector, "_make_request", side_effect=requests.Timeout("slow")) as request, \
+                patch.object(connector.relation, "get_relation_type", return_value=RELATION_TYPES[0]) as get_one:
+            assert registry.get(RELATION_TYPES[0]["id"]) == RELATION_TYPES[0]
+            assert registry.by_role("groups") == []
+            assert registry.get(RELATION_TYPES[0]["id"]) == RELATION_TYPES[0]
+        assert request.call_count == 1
+        get_one.assert_called_once()
+
+    def test_asset_relations_use_registry(self, connector):
+        """Test that repeated get_asset_relations calls share one bulk load."""
+        relations = {"results": [{
+            "id": "r1", "type": {"id": RELATION_TYPES[1]["id"]},
+            "target": {"id": "t1", "name": "Customer"}, "source": {"id": "s1", "name": "Client"},
+        }], "total": 1}
+        asset_id = "44444444-4444-4444-4444-444444444444"
+
+        with patch.object(connector, "_make_request", side_effect=lambda m, url, params: relation_types_response(url, params)) as request, \
+                patch.object(connector.relation, "find_relations", return_value=relations):
+            for _ in range(3):
+                result = connector.relation.get_asset_relations(asset_id)
+
+        assert request.call_count == 1
+        assert result["outgoing"]["groups"][0]["target_type"] == "Column"
+        assert result["incoming"]["is grouped by"][0]["source_type"] == "Business Term"
+
+
+class TestDataFrameExporter:
+    """Tests for DataFrameExporter."""
+
+    def profile(self, asset_id, attributes, outgoing=0):
+        from collibra_connector import AssetProfileModel, RelationsGrouped
+        return AssetProfileModel(
+            asset={
+                "id": asset_id, "name": f"Asset {asset_id}", "type": {"id": "t", "name": "Table"},
+                "status": {"id": "s", "name": "Accepted"}, "domain": {"id": "d", "name": "Sales"},
+            },
+            attributes=attributes,
+            relations=RelationsGrouped(outgoing_count=outgoing),
+        )
+
+    def test_bulk_mode_builds_sparse_columns_without_per_asset_calls(self):
+        """Test that bulk mode uses bulk profiles and fills missing attributes with None."""
+        pytest.importorskip("pandas")
+        connector = Mock()
+        connector.asset.get_full_profiles.return_value = [
+            self.profile("a1", {"Description": "<b>Orders</b>"}, outgoing=2),
+            self.profile("a2", {"Owner Team": "Sales"}),
+        ]
+
+        df = DataFrameExporter(connector).assets_to_dataframe(
+            domain_id="d", limit=None, include_relations=True, bulk=True
+        )
+
+        assert list(df["id"]) == ["a1", "a2"]
+        assert df["attr_description"][0] == "Orders" and df["attr_description"].isna()[1]
+        assert df["attr_owner_team"].isna()[0] and df["attr_owner_team"][1] == "Sales"
+        assert list(df["relations_outgoing"]) == [2, 0]
+        kwargs = connector.asset.get_full_profiles.call_args.kwargs
+        assert kwargs["domain_id"] == "d" and kwargs["limit"] is None
+        connector.attribute.get_attributes_as_dict.assert_not_called()
+        connector.asset.find_assets.assert_not_called()
+
+
+class TestStreamingExporter:
+    """Tests for StreamingExporter."""
+
+    ATTRIBUTE_TYPES = [{"id": f"at-{i}", "name": name} for i, name in enumerate(["Owner Team", "Description", "Note"])]
+
+    def connector(self, profiles):
+        """Stub connector with paged attribute types and the given profile generator."""
+        connector = Mock()
+        connector.api = "https://test.collibra.com/rest/2.0"
+
+        def make_request(method, url, params=None):
+            page = self.ATTRIBUTE_TYPES[params["offset"]:params["offset"] + 2]
+            return Mock(json=Mock(return_value={"results": page, "total": len(self.ATTRIBUTE_TYPES)}))
+
+        connector._make_request.side_effect = make_request
+        connector.asset.iter_full_profiles.side_effect = lambda **kwargs: profiles
+        return connector
+
+    profile = TestDataFrameExporter.profile
+
+    def test_columns_discovered_from_attribute_types(self):
+        """Test that attribute columns come from every page of /attributeTypes."""
+        with patch.object(StreamingExporter, "PAGE_SIZE", 2):
+            exporter = StreamingExporter(self.connector(iter([])))
+            columns = exporter.columns(include_relations=True)
+
+        assert columns == StreamingExporter.BASE_COLUMNS + [
+            "attr_description", "attr_note", "attr_owner_team", "relations_outgoing", "relations_incoming"
+        ]
+        assert exporter.connector._make_request.call_count == 2
+
+    def test_csv_rows_written_as_profiles_arrive(self):
+        """Test that the header and first row are written before the next profile is fetched."""
+        import csv
+        import io
+
+        output = io.StringIO()
+
+        def profiles():
+            yield self.profile("a1", {"Description": "<b>Orders</b>"})
+            assert output.getvalue().count("\n") == 2
+            yield self.profile("a2", {"Owner Team": "Sales"})
+
+        connector = self.connector(profiles())
+        count = StreamingExporter(connector).write(output, "csv", domain_id="d", attribute_types=["Description"])
+
+        assert count == 2
+        rows = list(csv.DictReader(io.StringIO(output.getvalue())))
+        assert list(rows[0]) == StreamingExporter.BASE_COLUMNS + ["attr_description"]
+        assert rows[0]["attr_description"] == "Orders" and rows[1]["attr_description"] == ""
+        kwargs = connector.asset.iter_full_profiles.call_args.kwargs
+        assert kwargs["include_attributes"] is True and kwargs["include_relations"] is False
+        connector._make_request.assert_not_called()
+
+    def test_ndjson_and_json_records_share_columns(self, tmp_path):
+        """Test that every record has the discovered columns and formats follow the suffix."""
+        import json
+
+        for name in ("assets.ndjson", "assets.json"):
+            connector = self.connector(iter([
+                self.profile("a1", {"Note": "x"}, outgoing=3), self.profile("a2", {"Unknown": "y"}),
+            ]))
+            path = tmp_path / name
+            assert StreamingExporter(connector).export(str(path), community_id="c", include_relations=True) == 2
+            text = path.read_text()
+            records = json.loads(text) if name.endswith(".json") else [json.loads(line) for line in text.splitlines()]
+            assert [set(r) for r in records] == [set(records[0])] * 2
+            assert records[0]["attr_note"] == "x" and records[0]["relations_outgoing"] == 3
+            assert "attr_unknown" not in records[1]
+
+        with pytest.raises(ValueError):
+            StreamingExporter(self.connector(iter([]))).export(str(tmp_path / "assets.txt"), domain_id="d")
+
+
+class TestArrowExporter:
+    """Tests for ArrowExporter."""
+
+    connector = TestStreamingExporter.connector
+    ATTRIBUTE_TYPES = TestStreamingExporter.ATTRIBUTE_TYPES
+
+    def profile(self, asset_id, type_name, community=None, attributes=None):
+        from collibra_connector import AssetProfileModel
+        return AssetProfileModel(
+            asset={
+                "id": asset_id, "name": f"Asset {asset_id}", "createdOn": 1700000000000,
+                "type": {"id": "t", "name": type_name}, "status": {"id": "s", "name": "Accepted"},
+                "domain": {"id": "d", "name": "Sales", "community": {"id": "c", "name": community}},
+            },
+            attributes=attributes or {},
+        )
+
+    def test_missing_pyarrow_raises_import_error(self):
+        """Test that a helpful ImportError is raised without pyarrow."""
+        with patch.dict("sys.modules", {"pyarrow": None}):
+            with pytest.raises(ImportError, match="pip install pyarrow"):
+                ArrowExporter(Mock()).schema(StreamingExporter.BASE_COLUMNS)
+
+    @pytest.mark.parametrize("name", ["assets.parquet", "assets.arrow"])
+    def test_batches_written_with_shared_dictionaries(self, tmp_path, name):
+        """Test that batches share growing dictionaries and typed columns round-trip."""
+        pa = pytest.importorskip("pyarrow")
+        profiles = [
+            self.profile("a1", "Table", "Finance", {"Note": True}),
+            self.profile("a2", "Table", None),
+            self.profile("a3", "Column", "Finance", {"Description": "<i>Id</i>"}),
+        ]
+        path = str(tmp_path / name)
+        count = ArrowExporter(self.connector(iter(profiles))).export(path, domain_id="d", batch_size=2)
+
+        if name.endswith(".parquet"):
+            import pyarrow.parquet as pq
+            assert pq.ParquetFile(path).metadata.num_row_groups == 2
+            table = pq.read_table(path)
+        else:
+            import pyarrow.ipc as ipc
+            reader = ipc.open_file(path)
+            assert reader.num_record_batches == 2
+            table = reader.read_all()
+
+        assert count == table.num_rows == 3
+        assert pa.types.is_dictionary(table.schema.field("type").type)
+        assert table.schema.field("created_on").type == pa.timestamp("ms", tz="UTC")
+        assert table.column("type").to_pylist() == ["Table", "Table", "Column"]
+        assert table.column("community").to_pylist() == ["Finance", None, "Finance"]
+        assert table.column("attr_note").to_pylist() == ["true", None, None]
+        assert table.column("attr_description").to_pylist() == [None, None, "Id"]
+
+
+class TestIncrementalExporter:
+    """Tests for IncrementalExporter."""
+
+    ATTRIBUTE_TYPES = TestStreamingExporter.ATTRIBUTE_TYPES
+
+    def profile(self, asset_id, modified, note=None):
+        from collibra_connector import AssetProfileModel
+        return AssetProfileModel(
+            asset={
+                "id": asset_id, "name": f"Asset {asset_id}", "lastModifiedOn": modified,
+                "type": {"id": "t", "name": "Table"}, "status": {"id": "s", "name": "Accepted"},
+                "domain": {"id": "d", "name": "Sales"},
+            },
+            attributes={"Note": note} if note else {},
+        )
+
+    def connector(self, catalog):
+        """Stub connector serving the profiles in catalog, by scope or by id."""
+        connector = TestStreamingExporter.connector(self, None)
+
+        def iter_full_profiles(asset_ids=None, **kwargs):
+            return iter([catalog[i] for i in sorted(catalog) if asset_ids is None or i in asset_ids])
+
+        connector.asset.iter_full_profiles.side_effect = iter_full_profiles
+        connector.asset.get_modified_asset_ids.return_value = []
+        connector.activity.find_activities.return_value = {"results": []}
+        return connector
+
+    def read(self, path):
+        import json
+        return {r["id"]: r for r in map(json.loads, path.read_text().splitlines())}
+
+    def test_changes_and_deletions_merged_into_previous_output(self, tmp_path):
+        """Test that a second run fetches only changed assets and merges them with deletions."""
+        path = tmp_path / "assets.ndjson"
+        catalog = {"a1": self.profile("a1", 1000), "a2": self.profile("a2", 5000), "a3": self.profile("a3", 2000)}
+        connector = self.connector(catalog)
+
+        first = IncrementalExporter(connector).export(str(path), domain_id="d")
+        assert (first.full, first.updated, first.watermark) == (True, 3, 5000)
+        connector.asset.get_modified_asset_ids.assert_not_called()
+
+        catalog["a1"] = self.profile("a1", 9000, note="changed")
+        catalog["a4"] = self.profile("a4", 8000)
+        del catalog["a3"]
+        connector.asset.get_modified_asset_ids.return_value = ["a1", "a4"]
+        connector.activity.find_activities.return_value = {"results": [{"contextId": "a3"}, {"contextId": "zz"}]}
+        connector.asset.iter_full_profiles.reset_mock()
+
+        second = IncrementalExporter(connector).export(str(path), domain_id="d", overlap=1)
+        assert (second.full, second.updated, second.deleted, second.watermark) == (False, 2, 1, 9000)
+        records = self.read(path)
+        assert sorted(records) == ["a1", "a2", "a4"]
+        assert records["a1"]["attr_note"] == "changed" and records["a2"]["last_modified_on"] == 5000
+        assert connector.asset.get_modified_asset_ids.call_args.args[0] == 4000
+        assert connector.activity.find_activities.call_args.kwargs["start_date"] == 4000
+        assert connector.asset.iter_full_profiles.call_args.kwargs["asset_ids"] == ["a1", "a4"]
+        assert not [p for p in tmp_path.iterdir() if p.name.startswith(".export-")]
+
+    def test_changed_scope_or_missing_output_forces_full_export(self, tmp_path):
+        """Test that the watermark is only reused for the same scope and an existing file."""
+        path = tmp_path / "assets.csv"
+        connector = self.connector({"a1": self.profile("a1", 1000)})
+        exporter = IncrementalExporter(connector)
+
+        assert exporter.export(str(path), domain_id="d").full
+        assert not exporter.export(str(path), domain_id="d").full
+        assert exporter.export(str(path), domain_id="d", attribute_types=["Note"]).full
+        path.unlink()
+        assert exporter.export(str(path), domain_id="d", attribute_types=["Note"]).full
+        assert path.read_text().splitlines()[0].endswith("attr_note")
+        with pytest.raises(ValueError):
+            exporter.export(str(tmp_path / "assets.json"), domain_id="d")
+
+
 class TestTimedCache:
     """Tests for timed_cache decorator."""
 
@@ -416,3 +949,157 @@ class TestTimedCache:
         expensive_func(5)
 
         assert call_count == 2
+
+    def test_lru_eviction_and_cache_info(self):
+        """Test that the least recently used entry is evicted and stats are reported."""
+        calls = []
+
+        @timed_cache(ttl_seconds=60, maxsize=2)
+        def func(x):
+            calls.append(x)
+            return x
+
+        func(1)
+        func(2)
+        func(1)
+        func(3)
+        func(2)
+
+        assert calls == [1, 2, 3, 2]
+        info = func.cache_info()
+        assert (info.hits, info.misses, info.maxsize, info.currsize) == (1, 4, 2, 2)
+        func.cache_clear()
+        assert func.cache_info().currsize == 0
+
+    def test_entries_expire_individually(self):
+        """Test that each entry has its own TTL."""
+        calls = []
+
+        @timed_cache(ttl_seconds=10)
+        def func(x):
+            calls.append(x)
+            return x
+
+        with patch("collibra_connector.helpers.time.monotonic", return_value=100.0):
+            func("a")
+        with patch("collibra_connector.helpers.time.monotonic", return_value=105.0):
+            func("b")
+        with patch("collibra_connector.helpers.time.monotonic", return_value=111.0):
+            func("a")
+            func("b")
+
+        assert calls == ["a", "b", "a"]
+
+    def test_keyword_arguments_and_unhashable_args(self):
+        """Test that keyword order does not matter and unhashable args are supported."""
+        calls = []
+
+        @timed_cache(ttl_seconds=60)
+        def func(filters=None, limit=10):
+            calls.append((filters, limit))
+            return len(calls)
+
+        func(filters={"a": [1]}, limit=5)
+        func(limit=5, filters={"a": [1]})
+
+        assert len(calls) == 1
+
+    def test_exceptions_are_not_cached(self):
+        """Test that a failed call is retried on the next call."""
+        attempts = []
+
+        @timed_cache(ttl_seconds=60)
+        def func():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise ValueError("boom")
+            return "ok"
+
+        with pytest.raises(ValueError):
+            func()
+        assert func() == "ok"
+
+    def test_concurrent_misses_share_one_call(self):
+        """Test that concurrent first calls run the function once."""
+        calls = []
+        started = threading.Event()
+        release = threading.Event()
+
+        @timed_cache(ttl_seconds=60)
+        def func(x):
+            calls.append(x)
+            started.set()
+            release.wait(5)
+            return x * 2
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(func(2))) for _ in range(5)]
+        threads[0].start()
+        started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert calls == [2]
+        assert results == [4] * 5
+
+    def test_copy_results(self):
+        """Test that callers get independent copies with copy_results."""
+        @timed_cache(ttl_seconds=60, copy_results=True)
+        def func():
+            return {"items": [1]}
+
+        func()["items"].append(2)
+        assert func() == {"items": [1]}
+
+    def test_async_function(self):
+        """Test that coroutine results are cached and concurrent misses share one call."""
+        calls = []
+
+        @timed_cache(ttl_seconds=60)
+        async def func(x):
+            calls.append(x)
+            await asyncio.sleep(0.01)
+            return x + 1
+
+        async def run():
+            first = await asyncio.gather(*(func(1) for _ in range(5)))
+            second = await func(1)
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert first == [2] * 5
+        assert second == 2
+        assert calls == [1]
+        assert func.cache_info().hits == 1
+
+    def test_methods_cache_per_instance(self):
+        """Test that each instance has its own entries and maxsize, and is not kept alive."""
+        calls = []
+
+        class Client:
+            def __init__(self, name):
+                self.name = name
+
+            @timed_cache(ttl_seconds=60, maxsize=1)
+            def lookup(self, x):
+                calls.append((self.name, x))
+                return f"{self.name}-{x}"
+
+        first, second = Client("a"), Client("b")
+        assert first.lookup(1) == "a-1"
+        assert second.lookup(1) == "b-1"
+        assert first.lookup(1) == "a-1"
+        assert calls == [("a", 1), ("b", 1)]
+        assert first.lookup.cache_info().currsize == second.lookup.cache_info().currsize == 1
+
+        first.lookup.cache_clear()
+        assert second.lookup.cache_info().currsize == 1
+
+        ref = weakref.ref(second)
+        del second
+        gc.collect()
+        assert ref() is None
@@ -1,5 +1,6 @@
 """Tests for the Lineage Builder."""
 import pytest
+from unittest.mock import Mock
 from collibra_connector.lineage import (
     LineageBuilder,
     LineageNode,
@@ -275,6 +276,17 @@ class TestLineageBuilder:
         assert result.relations_created == 1
 
 
+    def test_relation_type_resolved_from_registry(self):
+        mock = MockCollibraConnector()
+        mock.relation_types = Mock()
+        mock.relation_types.resolve.return_value = "type-uuid"
+        builder = LineageBuilder(mock)
+
+        assert builder._resolve_relation_type_id("is source for") == "type-uuid"
+        assert builder._resolve_relation_type_id("is source for") == "type-uuid"
+        mock.relation_types.resolve.assert_called_once_with("is source for")
+
+
 class TestLineageCommitResult:
     """Tests for LineageCommitResult."""
 
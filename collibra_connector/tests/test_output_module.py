@@ -0,0 +1,108 @@
+"""Tests for Output Module API."""
+import json
+
+import pytest
+from unittest.mock import Mock, patch
+from collibra_connector import CollibraConnector, NotFoundError
+
+
+@pytest.fixture
+def connector():
+    return CollibraConnector("https://test.collibra.com", "user", "pass")
+
+
+@pytest.fixture
+def output_module(connector):
+    return connector.output_module
+
+
+def chunked(payload, size=7):
+    """Split a document into small chunks to exercise chunk boundaries."""
+    raw = json.dumps(payload).encode()
+    return [raw[i:i + size] for i in range(0, len(raw), size)]
+
+
+class TestExportJson:
+    def test_export_json_accepts_string_view_config(self, output_module, connector):
+        """Test that string ViewConfigs are sent as-is with the validation flag."""
+        view_config = '{"ViewConfig": {"Resources": {"Asset": {"Id": {"name": "id"}}}}}'
+        with patch.object(connector, '_make_request') as mock_request:
+            mock_request.return_value = Mock(status_code=200, content=b'{"view": {"Asset": []}}')
+
+            result = output_module.export_json(view_config, validation_enabled=True)
+
+            assert result == {"view": {"Asset": []}}
+            args, kwargs = mock_request.call_args
+            assert args == ("POST", f"{connector.api}/outputModule/export/json")
+            assert kwargs['data'] == view_config.encode()
+            assert kwargs['params'] == {"validationEnabled": "true"}
+
+
+class TestStreamJson:
+    def test_stream_json_yields_rows(self, output_module, connector):
+        """Test that rows are yielded one by one from a chunked response."""
+        rows = [{"id": str(i), "name": f"Asset, [{i}]"} for i in range(25)]
+        response = Mock(status_code=200)
+        response.iter_content.return_value = iter(chunked({"view": {"Asset": rows}}))
+
+        with patch.object(connector, '_make_request', return_value=response) as mock_request:
+            result = list(output_module.stream_json({"ViewConfig": {}}, path=("view", "Asset")))
+
+        assert result == rows
+        assert mock_request.call_args.kwargs['stream'] is True
+        response.close.assert_called_once()
+
+    def test_stream_json_table_view_config(self, output_module, connector):
+        """Test the default path picks the first array (aaData for TableViewConfig)."""
+        response = Mock(status_code=200)
+        response.iter_content.return_value = iter(
+            chunked({"iTotalRecords": 2, "aaData": [{"id": "1"}, {"id": "2"}]})
+        )
+
+        with patch.object(connector, '_make_request', return_value=response):
+            assert [r["id"] for r in output_module.stream_json("{}")] == ["1", "2"]
+
+    def test_stream_json_error_status(self, output_module, connector):
+        """Test that error responses raise before any row is parsed."""
+        response = Mock(status_code=404, text="missing")
+
+        with patch.object(connector, '_make_request', return_value=response):
+            with pytest.raises(NotFoundError):
+                list(output_module.stream_json("{}"))
+        response.close.assert_called_once()
+
+    def test_stream_json_missing_array(self, output_module, connector):
+        """Test that a response without the rows array is reported."""
+        response = Mock(status_code=200)
+        response.iter_content.return_value = iter([b'{"view": {}}'])
+
+        with patch.object(connector, '_make_request', return_value=response):
+            with pytest.raises(ValueError, match="view.Asset"):
+                list(output_module.stream_json("{}", path=("view", "Asset")))
+
+
+class TestTableViewConfig:
+    def test_columns_mirror_fields(self, output_module):
+        """Test that named fields become columns and field lists become groups."""
+        config = output_module.table_view_config(
+            "Asset",
+            {
+                "Id": {"name": "id"},
+                "Domain": {"Id": {"name": "domainId"}},
+                "StringAttribute": [{
+                    "name": "attrs",
+                    "labelId": "x",
+                    "LongExpression": {"name": "attrValue"},
+                }],
+            },
+            filter={"AND": [{"Field": {"name": "id", "operator": "IN", "values": ["a"]}}]},
+            display_length=10
+        )["TableViewConfig"]
+
+        assert config["Columns"] == [
+            {"Column": {"fieldName": "id"}},
+            {"Column": {"fieldName": "domainId"}},
+            {"Group": {"name": "attrs", "Columns": [{"Column": {"fieldName": "attrValue"}}]}},
+        ]
+        assert config["Resources"]["Asset"]["Filter"]["AND"][0]["Field"]["values"] == ["a"]
+        assert (config["displayStart"], config["displayLength"]) == (0, 10)
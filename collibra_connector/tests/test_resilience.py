@@ -0,0 +1,318 @@
+"""Tests for resilience primitives."""
+import asyncio
+import time
+
+import pytest
+
+from collibra_connector.api.Exceptions import CircuitOpenError
+from collibra_connector.resilience import (
+    AdaptiveConcurrencyLimiter,
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    HedgingPolicy,
+    RateLimiter,
+    endpoint_family,
+    parse_retry_after,
+)
+
+
+class TestParseRetryAfter:
+    """Tests for Retry-After parsing."""
+
+    def test_delta_seconds(self):
+        """Test numeric Retry-After values."""
+        assert parse_retry_after("7") == 7.0
+        assert parse_retry_after("0.5") == 0.5
+
+    def test_http_date(self):
+        """Test HTTP-date Retry-After values."""
+        now = 1_700_000_000.0
+        delay = parse_retry_after("Tue, 14 Nov 2023 22:13:30 GMT", now=now)
+        assert delay == pytest.approx(10.0)
+
+    def test_invalid_or_missing(self):
+        """Test that unparseable values return None."""
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("") is None
+        assert parse_retry_after("soon") is None
+
+
+class TestRateLimiter:
+    """Tests for the adaptive token bucket."""
+
+    def test_unlimited_never_waits(self):
+        """Test that no limit means no delay."""
+        limiter = RateLimiter()
+        assert all(limiter.reserve() == 0.0 for _ in range(100))
+
+    def test_bucket_spaces_requests(self):
+        """Test that tokens beyond the burst are spread over time."""
+        limiter = RateLimiter(rate=10, burst=2)
+        delays = [limiter.reserve() for _ in range(4)]
+
+        assert delays[0] == 0.0
+        assert delays[1] == 0.0
+        assert delays[2] == pytest.approx(0.1, abs=0.02)
+        assert delays[3] == pytest.approx(0.2, abs=0.02)
+
+    def test_429_halves_rate_and_success_recovers(self):
+        """Test multiplicative decrease and additive recovery."""
+        limiter = RateLimiter(rate=8, increase_step=1.0)
+
+        limiter.update(429, {})
+        assert limiter.rate == 4.0
+        assert limiter.throttled_count == 1
+
+        limiter.update(200, {})
+        assert limiter.rate == 5.0
+
+        for _ in range(10):
+            limiter.update(200, {})
+        assert limiter.rate == 8.0
+
+    def test_rate_never_below_minimum(self):
+        """Test the adaptive floor."""
+        limiter = RateLimiter(rate=2, min_rate=1)
+        for _ in range(5):
+            limiter.update(429, {})
+        assert limiter.rate == 1
+
+    def test_retry_after_pauses_all_callers(self):
+        """Test that Retry-After blocks subsequent reservations, even when unlimited."""
+        limiter = RateLimiter()
+        assert limiter.update(429, {"Retry-After": "2"}) == 2.0
+        assert limiter.reserve() == pytest.approx(2.0, abs=0.05)
+
+    def test_remaining_zero_pauses_until_reset(self):
+        """Test that exhausted rate-limit headers pause until reset."""
+        limiter = RateLimiter()
+        delay = limiter.update(200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "3"})
+        assert delay == 3.0
+        assert limiter.reserve() == pytest.approx(3.0, abs=0.05)
+
+    def test_non_mapping_headers_ignored(self):
+        """Test that unusual header objects do not break updates."""
+        limiter = RateLimiter()
+        assert limiter.update(200, object()) is None
+
+    def test_invalid_arguments(self):
+        """Test argument validation."""
+        with pytest.raises(ValueError):
+            RateLimiter(rate=0)
+        with pytest.raises(ValueError):
+            RateLimiter(rate=1, decrease_factor=1.5)
+
+    def test_acquire_async(self):
+        """Test that coroutines wait for their reservation."""
+        limiter = RateLimiter(rate=20, burst=1)
+
+        async def run():
+            start = time.monotonic()
+            await asyncio.gather(*[limiter.acquire_async() for _ in range(3)])
+            return time.monotonic() - start
+
+        assert asyncio.run(run()) >= 0.09
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Tests for AdaptiveConcurrencyLimiter."""
+
+    def test_additive_increase(self):
+        """Test that healthy responses grow the limit by about one per window."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=10)
+        for _ in range(4):
+            limiter.record(0.1, 200)
+        assert limiter.limit == 4
+        for _ in range(2):
+            limiter.record(0.1, 200)
+        assert limiter.limit == 5
+        assert limiter.baseline_latency == pytest.approx(0.1)
+
+    def test_decrease_on_throttle_and_server_error(self):
+        """Test multiplicative decrease on 429, 5xx and transport errors."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=16)
+        limiter.record(0.0, 429)
+        assert limiter.limit == 8
+        limiter.record(0.0, 503)
+        assert limiter.limit == 4
+        limiter.record(0.0, error=True)
+        assert limiter.limit == 2
+        assert limiter.stats()["decreases"] == 3
+
+    def test_decrease_on_latency_spike(self):
+        """Test that latency well above the baseline counts as congestion."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=10, latency_tolerance=2.0)
+        limiter.record(0.001, 200)
+        limiter.record(0.1, 200)
+        assert limiter.limit == 5
+
+    def test_bounds(self):
+        """Test that the limit stays within min and max."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=3, min_limit=2, max_limit=4)
+        for _ in range(50):
+            limiter.record(0.0, 200)
+        assert limiter.limit == 4
+        for _ in range(5):
+            limiter.record(0.0, 500)
+        assert limiter.limit == 2
+
+    def test_invalid_arguments(self):
+        """Test argument validation."""
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(min_limit=0)
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(min_limit=5, max_limit=2)
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(backoff_factor=1.0)
+
+    def test_acquire_gates_concurrency(self):
+        """Test that no more than `limit` coroutines hold a slot at once."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2)
+        peak = 0
+
+        async def worker():
+            nonlocal peak
+            await limiter.acquire()
+            try:
+                peak = max(peak, limiter.in_flight)
+                await asyncio.sleep(0.01)
+            finally:
+                limiter.release()
+
+        async def run():
+            await asyncio.gather(*[worker() for _ in range(6)])
+
+        asyncio.run(run())
+        assert peak == 2
+        assert limiter.in_flight == 0
+
+    def test_cancelled_waiter_is_removed(self):
+        """Test that cancelling a queued acquire does not leak a slot."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+
+        async def run():
+            await limiter.acquire()
+            waiter = asyncio.ensure_future(limiter.acquire())
+            await asyncio.sleep(0)
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+            limiter.release()
+
+        asyncio.run(run())
+        assert limiter.in_flight == 0
+        assert limiter.stats()["waiting"] == 0
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker and CircuitBreakerRegistry."""
+
+    @pytest.mark.parametrize("url,expected", [
+        ("https://x.collibra.com/rest/2.0/assets/123/tags", "/assets"),
+        ("https://x.collibra.com/rest/2.0/outputModule/export/json", "/outputModule"),
+        ("/search", "/search"),
+        ("https://x.collibra.com/rest/2.0", "/"),
+    ])
+    def test_endpoint_family(self, url, expected):
+        """Test endpoint family extraction."""
+        assert endpoint_family(url) == expected
+
+    def test_opens_after_consecutive_failures(self):
+        """Test that the circuit opens at the threshold and rejects requests."""
+        breaker = CircuitBreaker("/assets", failure_threshold=3, recovery_timeout=60)
+        for _ in range(2):
+            breaker.before_request()
+            breaker.record_failure()
+        assert breaker.state == "closed"
+
+        breaker.record_failure()
+        assert breaker.state == "open"
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.before_request()
+        assert exc_info.value.retry_after > 59
+        assert breaker.stats()["rejected_count"] == 1
+
+    def test_success_resets_failure_count(self):
+        """Test that only consecutive failures count."""
+        breaker = CircuitBreaker("/assets", failure_threshold=2)
+        breaker.record_failure()
+        breaker.record_response(404)
+        breaker.record_failure()
+        assert breaker.state == "closed"
+
+    def test_half_open_probe_closes_on_success(self):
+        """Test recovery through a single half-open probe."""
+        breaker = CircuitBreaker("/assets", failure_threshold=1, recovery_timeout=0.05)
+        breaker.record_failure()
+        time.sleep(0.06)
+        assert breaker.state == "half_open"
+
+        breaker.before_request()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+
+        breaker.record_response(200)
+        assert breaker.state == "closed"
+        breaker.before_request()
+
+    def test_half_open_probe_failure_reopens(self):
+        """Test that a failed probe opens the circuit again."""
+        breaker = CircuitBreaker("/assets", failure_threshold=1, recovery_timeout=0.05)
+        breaker.record_failure()
+        time.sleep(0.06)
+        breaker.before_request()
+        breaker.record_response(503)
+        assert breaker.state == "open"
+        assert breaker.stats()["open_count"] == 2
+
+    def test_registry_isolates_families(self):
+        """Test that each endpoint family has its own breaker."""
+        registry = CircuitBreakerRegistry(failure_threshold=1)
+        registry.for_url("https://x/rest/2.0/search").record_failure()
+        registry.for_url("https://x/rest/2.0/assets/1").record_success()
+        assert registry.states() == {"/search": "open", "/assets": "closed"}
+
+        registry.reset()
+        assert registry.states() == {"/search": "closed", "/assets": "closed"}
+
+    def test_invalid_arguments(self):
+        """Test argument validation."""
+        with pytest.raises(ValueError):
+            CircuitBreaker("/assets", failure_threshold=0)
+        with pytest.raises(ValueError):
+            CircuitBreakerRegistry(half_open_max_calls=0)
+
+
+class TestHedgingPolicy:
+    """Tests for HedgingPolicy."""
+
+    def test_delay_follows_percentile_per_family(self):
+        """Test that each endpoint family gets its own percentile delay."""
+        policy = HedgingPolicy(percentile=0.9, min_samples=10, min_delay=0)
+        for i in range(1, 11):
+            policy.record("/assets", i / 100)
+        policy.record("/search", 5.0)
+        assert policy.hedge_delay("/assets") == pytest.approx(0.10)
+        assert policy.hedge_delay("/search") is None
+
+    def test_sliding_window_matches_full_sort(self):
+        """Test that the incrementally sorted window drops evicted samples."""
+        policy = HedgingPolicy(percentile=0.5, window=5, min_samples=1, min_delay=0)
+        latencies = [0.9, 0.1, 0.5, 0.5, 0.3, 0.8, 0.2, 0.7, 0.4, 0.6]
+        for i, latency in enumerate(latencies):
+            policy.record("/assets", latency)
+            window = sorted(latencies[max(0, i - 4):i + 1])
+            assert policy.hedge_delay("/assets") == window[min(len(window) - 1, int(0.5 * len(window)))]
+
+    def test_min_delay_floor(self):
+        """Test the lower bound on the hedge delay."""
+        policy = HedgingPolicy(min_samples=1, min_delay=0.2)
+        policy.record("/assets", 0.001)
+        assert policy.hedge_delay("/assets") == 0.2
+
+    def test_invalid_arguments(self):
+        """Test argument validation."""
+        with pytest.raises(ValueError):
+            HedgingPolicy(percentile=1.5)
+        with pytest.raises(ValueError):
+            HedgingPolicy(max_extra_ratio=0)
@@ -0,0 +1,209 @@
+"""Tests for the Utils API class."""
+import json
+import os
+import threading
+import time
+
+import pytest
+from unittest.mock import Mock, patch
+
+from collibra_connector import CollibraConnector
+from collibra_connector.api.Utils import UUID_ENDPOINTS, UUIDS_SNAPSHOT_VERSION
+from collibra_connector.cache import cache_identity
+
+
+API = "https://test.collibra.com/rest/2.0"
+
+
+def make_catalog(domains=2500):
+    """Build the list contents of every endpoint read by get_uuids."""
+    catalog = {
+        endpoint: [{"id": f"{endpoint}-{i}", "name": f"{endpoint} {i}"} for i in range(3)]
+        for endpoint in UUID_ENDPOINTS.values()
+    }
+    catalog["domains"] = [{"id": f"d-{i}", "name": f"Domain {i}"} for i in range(domains)]
+    catalog["relationTypes"] = [{
+        "id": "rt-1",
+        "sourceType": {"name": "Business Term"},
+        "targetType": {"name": "Data Element"},
+    }]
+    return catalog
+
+
+def fake_get(catalog, calls=None):
+    """Return a _get replacement serving paginated pages from the catalog."""
+    def get(url=None, params=None, headers=None):
+        endpoint = url[len(API) + 1:]
+        if calls is not None:
+            calls.append((endpoint, params["offset"], threading.get_ident()))
+        items = catalog[endpoint]
+        page = items[params["offset"]:params["offset"] + params["limit"]]
+        body = {"results": page, "offset": params["offset"], "limit": params["limit"], "total": len(items)}
+        return Mock(status_code=200, content=json.dumps(body).encode())
+    return get
+
+
+@pytest.fixture
+def connector():
+    """Create a connector for testing."""
+    return CollibraConnector(
+        api="https://test.collibra.com",
+        username="testuser",
+        password="testpass"
+    )
+
+
+@pytest.fixture
+def utils(connector):
+    """Create a Utils API instance with a fresh UUID cache."""
+    connector.utils._fetch_uuids.cache_clear()
+    yield connector.utils
+    connector.utils._fetch_uuids.cache_clear()
+
+
+class TestGetUuids:
+    """Tests for get_uuids."""
+
+    def test_reads_every_page_of_every_category(self, utils):
+        """Test that all categories are fully paginated."""
+        calls = []
+        with patch.object(utils, "_get", side_effect=fake_get(make_catalog(), calls)):
+            uuids = utils.get_uuids()
+
+        assert set(uuids) == set(UUID_ENDPOINTS)
+        assert len(uuids["Domain"]) == 2500
+        assert uuids["Relation"] == {"BusinessTerm_DataElement": "rt-1"}
+        assert uuids["AssetType"]["assetTypes 2"] == "assetTypes-2"
+        assert [offset for endpoint, offset, _ in calls if endpoint == "domains"] == [0, 1000, 2000]
+
+    def test_categories_fetched_concurrently(self, utils):
+        """Test that categories are requested from several threads."""
+        barrier = threading.Barrier(2, timeout=5)
+        calls = []
+        get = fake_get(make_catalog(domains=1), calls)
+
+        def slow_get(url=None, params=None, headers=None):
+            if url.endswith(("assetTypes", "statuses")):
+                barrier.wait()
+            return get(url=url, params=params)
+
+        with patch.object(utils, "_get", side_effect=slow_get):
+            assert utils.get_uuids() is not None
+
+        assert len({thread for _, _, thread in calls}) > 1
+
+    def test_malformed_response_returns_none(self, utils):
+        """Test that malformed responses are logged and reported as None."""
+        response = Mock(status_code=200, content=b'{"unexpected": []}')
+        with patch.object(utils, "_get", return_value=response):
+            assert utils.get_uuids() is None
+
+
+class TestUuidSnapshot:
+    """Tests for the persistent UUID snapshot."""
+
+    def test_missing_snapshot_is_fetched_and_saved(self, utils, tmp_path):
+        """Test that the first load fetches the UUIDs and writes a versioned snapshot."""
+        path = str(tmp_path / "uuids.json")
+        with patch.object(utils, "_get", side_effect=fake_get(make_catalog(domains=1))):
+            uuids = utils.load_uuids(path)
+
+        with open(path) as handle:
+            snapshot = json.load(handle)
+        assert snapshot["version"] == UUIDS_SNAPSHOT_VERSION
+        assert snapshot["api"] == API
+        assert snapshot["uuids"] == uuids
+
+    def test_fresh_snapshot_loaded_without_requests(self, utils, tmp_path):
+        """Test that a fresh snapshot is served without touching the API."""
+        path = str(tmp_path / "uuids.json")
+        with patch.object(utils, "_get", side_effect=fake_get(make_catalog(domains=1))):
+            expected = utils.load_uuids(path)
+        utils._fetch_uuids.cache_clear()
+
+        with patch.object(utils, "_get") as mock_get:
+            assert utils.load_uuids(path) == expected
+        mock_get.assert_not_called()
+        assert utils._refresh_thread is None
+
+    @pytest.mark.parametrize("snapshot", [
+        {"version": UUIDS_SNAPSHOT_VERSION + 1},
+        {"version": UUIDS_SNAPSHOT_VERSION, "api": "https://other.collibra.com/rest/2.0"},
+        {"version": UUIDS_SNAPSHOT_VERSION, "identity": cache_identity(API, "otheruser")},
+    ])
+    def test_incompatible_snapshot_ignored(self, connector, utils, tmp_path, snapshot):
+        """Test that snapshots of another version, instance or user are refetched."""
+        path = tmp_path / "uuids.json"
+        snapshot.update(created_at=time.time(), uuids={category: {} for category in UUID_ENDPOINTS})
+        snapshot.setdefault("api", API)
+        snapshot.setdefault("identity", connector.cache_identity)
+        path.write_text(json.dumps(snapshot))
+
+        with patch.object(utils, "_get", side_effect=fake_get(make_catalog(domains=1))) as mock_get:
+            uuids = utils.load_uuids(str(path))
+        assert mock_get.called
+        assert uuids["Domain"] == {"Domain 0": "d-0"}
+
+    def test_stale_snapshot_refreshed_in_background(self, connector, utils, tmp_path):
+        """Test that a stale snapshot is returned at once and updated in place."""
+        path = tmp_path / "uuids.json"
+        stale = {category: {} for category in UUID_ENDPOINTS}
+        path.write_text(json.dumps({
+            "version": UUIDS_SNAPSHOT_VERSION, "api": API, "identity": connector.cache_identity,
+            "created_at": time.time() - 7200, "uuids": stale,
+        }))
+        release = threading.Event()
+        get = fake_get(make_catalog(domains=1))
+
+        def blocked_get(url=None, params=None, headers=None):
+            release.wait(5)
+            return get(url=url, params=params)
+
+        with patch.object(utils, "_get", side_effect=blocked_get):
+            uuids = utils.load_uuids(str(path))
+            assert uuids == stale
+            release.set()
+            utils._refresh_thread.join(5)
+
+        assert uuids["Domain"] == {"Domain 0": "d-0"}
+        assert json.loads(path.read_text())["created_at"] > time.time() - 60
+
+    def test_unwritable_snapshot_is_ignored(self, utils, tmp_path):
+        """Test that a snapshot that cannot be written does not fail the load."""
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        path = str(blocker / "uuids.json")
+        with patch.object(utils, "_get", side_effect=fake_get(make_catalog(domains=1))):
+            assert utils.load_uuids(path) is not None
+        assert not os.path.exists(path)
+
+    def test_connector_loads_snapshot_on_init(self, tmp_path):
+        """Test that uuids_snapshot=True uses a snapshot per user in the cache directory."""
+        with patch.dict(os.environ, {"COLLIBRA_CACHE_DIR": str(tmp_path)}):
+            with patch("collibra_connector.api.Utils.Utils._get", side_effect=fake_get(make_catalog(domains=1))):
+                first = CollibraConnector(
+                    api="https://test.collibra.com", username="u", password="p", uuids=True, uuids_snapshot=True
+                )
+            first.utils._fetch_uuids.cache_clear()
+            with patch("collibra_connector.api.Utils.Utils._get") as mock_get:
+                second = CollibraConnector(
+                    api="https://test.collibra.com", username="u", password="p", uuids=True, uuids_snapshot=True
+                )
+            mock_get.assert_not_called()
+            with patch("collibra_connector.api.Utils.Utils._get", side_effect=fake_get(make_catalog(domains=1))):
+                other = CollibraConnector(
+                    api="https://test.collibra.com", username="v", password="p", uuids=True, uuids_snapshot=True
+                )
+
+        assert second.uuids == first.uuids
+        assert first.utils.snapshot_path() != other.utils.snapshot_path()
+        assert len(os.listdir(tmp_path)) == 2
+
+    def test_connector_does_not_persist_by_default(self, tmp_path):
+        """Test that uuids=True alone neither reads nor writes a snapshot."""
+        with patch.dict(os.environ, {"COLLIBRA_CACHE_DIR": str(tmp_path)}):
+            with patch("collibra_connector.api.Utils.Utils._get", side_effect=fake_get(make_catalog(domains=1))):
+                connector = CollibraConnector(api="https://test.collibra.com", username="u", password="p", uuids=True)
+
+        assert connector.uuids["Domain"] == {"Domain 0": "d-0"}
+        assert os.listdir(tmp_path) == []